@@ -30,7 +30,7 @@ from pathlib import Path
 from turbobulk_client import TurboBulkClient, TurboBulkError, JobFailedError
 
 
-def main():
+def main(argv=None):
     parser = argparse.ArgumentParser(
         description='TurboBulk Hello World - Bulk insert 10 sites',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -40,7 +40,7 @@ def main():
     parser.add_argument('--token', help='API token (or set NETBOX_TOKEN env var)')
     parser.add_argument('--prefix', default='hello', help='Site name prefix (default: hello)')
     parser.add_argument('--count', type=int, default=10, help='Number of sites (default: 10)')
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     try:
         # Create client (uses env vars if --url/--token not provided)
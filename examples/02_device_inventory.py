@@ -127,7 +127,7 @@ def generate_devices(ref_data: dict, count: int, prefix: str) -> list:
     return devices
 
 
-def main():
+def main(argv=None):
     parser = argparse.ArgumentParser(
         description='TurboBulk Device Inventory - Bulk insert devices',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -136,7 +136,7 @@ def main():
     parser.add_argument('--token', help='API token (or set NETBOX_TOKEN env var)')
     parser.add_argument('--prefix', default='inv', help='Device name prefix (default: inv)')
     parser.add_argument('--count', type=int, default=1000, help='Number of devices (default: 1000)')
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     try:
         client = TurboBulkClient(base_url=args.url, token=args.token)
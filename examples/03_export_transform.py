@@ -50,7 +50,7 @@ def write_jsonl(data: list, path: Path):
             f.write(json.dumps(row) + '\n')
 
 
-def main():
+def main(argv=None):
     parser = argparse.ArgumentParser(
         description='TurboBulk ETL Workflow - Export, Transform, Reimport',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -58,7 +58,7 @@ def main():
     parser.add_argument('--url', help='NetBox URL (or set NETBOX_URL env var)')
     parser.add_argument('--token', help='API token (or set NETBOX_TOKEN env var)')
     parser.add_argument('--filter-prefix', help='Only process sites with this name prefix')
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     try:
         client = TurboBulkClient(base_url=args.url, token=args.token)
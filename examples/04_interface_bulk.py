@@ -21,8 +21,6 @@ import random
 import sys
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent))
-
 from turbobulk_client import TurboBulkClient, TurboBulkError, JobFailedError
 from common.parquet_utils import create_parquet
 
@@ -87,7 +85,7 @@ def generate_interfaces_for_device(
     return interfaces
 
 
-def main():
+def main(argv=None):
     parser = argparse.ArgumentParser(
         description='TurboBulk Interface Bulk Operations',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -99,7 +97,7 @@ def main():
     parser.add_argument('--interfaces-per-device', type=int, default=8, help='Interfaces per device (default: 8)')
     parser.add_argument('--interface-type', choices=['server', 'switch', 'gpu_server'], default='server',
                         help='Interface type profile (default: server)')
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     try:
         client = TurboBulkClient(base_url=args.url, token=args.token)
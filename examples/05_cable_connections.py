@@ -22,8 +22,6 @@ import sys
 from pathlib import Path
 from typing import Dict, List, Tuple
 
-sys.path.insert(0, str(Path(__file__).parent))
-
 from turbobulk_client import TurboBulkClient, TurboBulkError, JobFailedError
 from common.parquet_utils import create_parquet, read_parquet
 
@@ -125,7 +123,7 @@ def create_cables_and_terminations(
         verbose=False,
     )
 
-    cable_export = read_parquet(export_result['path'])
+    cable_export = read_parquet(export_result['path'], columns=['label', 'id'])
     label_to_id = dict(zip(cable_export['label'], cable_export['id']))
     print(f"Retrieved {len(label_to_id)} cable IDs")
 
@@ -174,7 +172,7 @@ def create_cables_and_terminations(
     return cables_created, terminations_created
 
 
-def main():
+def main(argv=None):
     parser = argparse.ArgumentParser(
         description='TurboBulk Cable Connections',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -184,7 +182,7 @@ def main():
     parser.add_argument('--device-prefix', help='Only cable interfaces on devices with this prefix')
     parser.add_argument('--max-cables', type=int, default=50, help='Max cables to create (default: 50)')
     parser.add_argument('--cable-type', default='cat6a', help='Cable type (default: cat6a)')
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     try:
         client = TurboBulkClient(base_url=args.url, token=args.token)
@@ -53,10 +53,10 @@ import time
 from pathlib import Path
 from typing import Dict, Optional
 
-sys.path.insert(0, str(Path(__file__).parent))
-
 from turbobulk_client import TurboBulkClient, TurboBulkError, JobFailedError
-from common.parquet_utils import create_parquet, read_parquet, create_pk_parquet
+from common.parquet_utils import (
+    create_parquet, create_parquet_table, read_parquet, parquet_row_count,
+)
 from common.topology import GPUDatacenterTopology
 
 
@@ -200,7 +200,7 @@ def cmd_devices(client: TurboBulkClient, args):
     )
 
     device_path = Path('/tmp/gpu_dc_devices.parquet')
-    create_parquet(device_data, device_path)
+    create_parquet_table(device_data, device_path)
 
     print("Loading devices...")
     start = time.time()
@@ -218,11 +218,11 @@ def cmd_devices(client: TurboBulkClient, args):
     # Generate interfaces
     print(f"\nGenerating interfaces...")
     interface_data = topo.generate_interfaces(device_id_map)
-    total_interfaces = len(interface_data['device_id'])
+    total_interfaces = interface_data.num_rows
     print(f"  Generated {total_interfaces:,} interfaces")
 
     interface_path = Path('/tmp/gpu_dc_interfaces.parquet')
-    create_parquet(interface_data, interface_path)
+    create_parquet_table(interface_data, interface_path)
 
     print("Loading interfaces...")
     start = time.time()
@@ -239,19 +239,35 @@ def cmd_push(client: TurboBulkClient, args):
     topo = get_topology(args)
     print(topo.summary())
 
-    # Get interface map
+    # Get device and interface IDs
+    print("Fetching devices...")
+    device_export = client.export(
+        model='dcim.device',
+        filters={'name__startswith': topo.prefix},
+        fields=['id', 'name'],
+        output_path=Path('/tmp/gpu_dc_devices_export.parquet'),
+        format='parquet',
+        verbose=False,
+    )
+    devices = read_parquet(device_export['path'], columns=['name', 'id'])
+    device_id_map = dict(zip(devices['name'], devices['id']))
+    print(f"  Found {len(device_id_map):,} devices")
+
     print("Fetching interfaces...")
-    interfaces = client.rest_get_all(
-        '/api/dcim/interfaces/',
-        {'device__name__startswith': topo.prefix}
+    interface_export = client.export(
+        model='dcim.interface',
+        filters={'device__name__startswith': topo.prefix},
+        fields=['id', 'device_id', 'name'],
+        output_path=Path('/tmp/gpu_dc_interfaces_export.parquet'),
+        format='parquet',
+        verbose=False,
     )
-    interface_map = {
-        f"{iface['device']['name']}:{iface['name']}": iface['id']
-        for iface in interfaces
-    }
-    print(f"  Found {len(interface_map):,} interfaces")
+    interfaces = read_parquet(
+        interface_export['path'], columns=['id', 'device_id', 'name'], as_arrow=True
+    )
+    print(f"  Found {interfaces.num_rows:,} interfaces")
 
-    if not interface_map:
+    if interfaces.num_rows == 0:
         print("No interfaces found. Run 'devices' first.")
         return
 
@@ -261,14 +277,14 @@ def cmd_push(client: TurboBulkClient, args):
 
     # Generate cables
     print(f"\nGenerating cables...")
-    cables, terminations = topo.generate_cables(interface_map, ct_id)
-    print(f"  Generated {len(cables['label']):,} cables")
-    print(f"  Generated {len(terminations['cable_id']):,} termination records")
+    cables, terminations = topo.generate_cables(interfaces, device_id_map, ct_id)
+    print(f"  Generated {cables.num_rows:,} cables")
+    print(f"  Generated {terminations.num_rows:,} termination records")
 
     # Load cables
     print("\nLoading cables...")
     cables_path = Path('/tmp/gpu_dc_cables.parquet')
-    create_parquet(cables, cables_path)
+    create_parquet_table(cables, cables_path)
 
     start = time.time()
     result = client.load('dcim.cable', cables_path, mode='insert', verbose=True)
@@ -286,19 +302,19 @@ def cmd_push(client: TurboBulkClient, args):
         format='parquet',
         verbose=False,
     )
-    cable_export = read_parquet(export_result['path'])
+    cable_export = read_parquet(export_result['path'], columns=['label', 'id'])
     label_to_id = dict(zip(cable_export['label'], cable_export['id']))
     print(f"  Retrieved {len(label_to_id):,} cable IDs")
 
     # Update terminations with cable IDs
     print("\nUpdating terminations with cable IDs...")
     updated_terminations = topo.update_terminations_with_cable_ids(terminations, label_to_id)
-    print(f"  Prepared {len(updated_terminations['cable_id']):,} termination records")
+    print(f"  Prepared {updated_terminations.num_rows:,} termination records")
 
     # Load terminations
     print("\nLoading cable terminations...")
     terms_path = Path('/tmp/gpu_dc_terminations.parquet')
-    create_parquet(updated_terminations, terms_path)
+    create_parquet_table(updated_terminations, terms_path)
 
     start = time.time()
     result = client.load('dcim.cabletermination', terms_path, mode='insert', verbose=True)
@@ -309,8 +325,8 @@ def cmd_push(client: TurboBulkClient, args):
     print(f"\n{'='*60}")
     print("CABLE DESIGN PUSHED!")
     print(f"{'='*60}")
-    print(f"Cables:       {len(cables['label']):,}")
-    print(f"Terminations: {len(updated_terminations['cable_id']):,}")
+    print(f"Cables:       {cables.num_rows:,}")
+    print(f"Terminations: {updated_terminations.num_rows:,}")
     print(f"\nView cables at: {client.base_url}/dcim/cables/?label__startswith={topo.prefix}")
 
 
@@ -335,59 +351,67 @@ def cmd_status(client: TurboBulkClient, args):
         print("\nCable design complete!")
 
 
+def export_delete_ids(client: TurboBulkClient, model: str, filters: Dict, name: str):
+    """
+    Export the IDs of matching objects to a Parquet file for a delete job.
+
+    The export holds only the 'id' column, so it is submitted to delete()
+    as-is; the row count is read from the file metadata without loading
+    the IDs.
+
+    Returns:
+        (path, row_count) tuple
+    """
+    export_result = client.export(
+        model=model,
+        filters=filters,
+        fields=['id'],
+        include_custom_fields=False,
+        include_tags=False,
+        output_path=Path(f'/tmp/gpu_dc_delete_{name}.parquet'),
+        format='parquet',
+        verbose=False,
+    )
+    path = Path(export_result['path'])
+    return path, parquet_row_count(path)
+
+
 def cmd_delete(client: TurboBulkClient, args):
     """Delete all cables from current design."""
     topo = get_topology(args)
 
     # Get cable IDs
     print(f"Fetching cables with prefix '{topo.prefix}'...")
-    export_path = client.export(
-        model='dcim.cable',
-        filters={'label__startswith': topo.prefix},
-        fields=['id'],
-        output_path=Path('/tmp/gpu_dc_delete_cables.parquet'),
-        verbose=False,
+    cable_path, cable_count = export_delete_ids(
+        client, 'dcim.cable', {'label__startswith': topo.prefix}, 'cables'
     )
-    cable_data = read_parquet(export_path)
-    cable_ids = cable_data.get('id', [])
 
-    if not cable_ids:
+    if not cable_count:
         print("No cables found to delete.")
         return
 
-    print(f"Found {len(cable_ids):,} cables to delete")
+    print(f"Found {cable_count:,} cables to delete")
 
     # First, delete cable terminations (they reference cables via FK)
     print("\nFetching cable terminations...")
-    term_export_path = client.export(
-        model='dcim.cabletermination',
-        filters={'cable_id__in': cable_ids},
-        fields=['id'],
-        output_path=Path('/tmp/gpu_dc_delete_terminations.parquet'),
-        verbose=False,
+    term_path, term_count = export_delete_ids(
+        client, 'dcim.cabletermination', {'cable__label__startswith': topo.prefix}, 'terminations'
     )
-    term_data = read_parquet(term_export_path)
-    term_ids = term_data.get('id', [])
 
-    if term_ids:
-        print(f"Found {len(term_ids):,} terminations to delete")
-        term_delete_path = Path('/tmp/gpu_dc_delete_term_ids.parquet')
-        create_pk_parquet(term_ids, term_delete_path)
+    if term_count:
+        print(f"Found {term_count:,} terminations to delete")
 
         print("Deleting terminations...")
         start = time.time()
-        result = client.delete('dcim.cabletermination', term_delete_path, verbose=True)
+        result = client.delete('dcim.cabletermination', term_path, verbose=True)
         duration = time.time() - start
         rows = result.get('data', {}).get('rows_affected', 0)
         print(f"  Deleted {rows:,} terminations in {duration:.1f}s")
 
     # Now delete cables
-    delete_path = Path('/tmp/gpu_dc_delete_ids.parquet')
-    create_pk_parquet(cable_ids, delete_path)
-
     print("\nDeleting cables...")
     start = time.time()
-    result = client.delete('dcim.cable', delete_path, verbose=True)
+    result = client.delete('dcim.cable', cable_path, verbose=True)
     duration = time.time() - start
     rows = result.get('data', {}).get('rows_affected', 0)
     print(f"  Deleted {rows:,} cables in {duration:.1f}s")
@@ -410,18 +434,10 @@ def cmd_teardown(client: TurboBulkClient, args):
 
     # Delete interfaces
     print("\n2. Deleting interfaces...")
-    export_path = client.export(
-        model='dcim.interface',
-        filters={'device__name__startswith': topo.prefix},
-        fields=['id'],
-        output_path=Path('/tmp/gpu_dc_delete_interfaces.parquet'),
-        verbose=False,
+    delete_path, count = export_delete_ids(
+        client, 'dcim.interface', {'device__name__startswith': topo.prefix}, 'interfaces'
     )
-    iface_data = read_parquet(export_path)
-    iface_ids = iface_data.get('id', [])
-    if iface_ids:
-        delete_path = Path('/tmp/gpu_dc_delete_iface_ids.parquet')
-        create_pk_parquet(iface_ids, delete_path)
+    if count:
         result = client.delete('dcim.interface', delete_path, verbose=False)
         print(f"   Deleted {result.get('data', {}).get('rows_affected', 0):,} interfaces")
     else:
@@ -429,18 +445,10 @@ def cmd_teardown(client: TurboBulkClient, args):
 
     # Delete devices
     print("\n3. Deleting devices...")
-    export_path = client.export(
-        model='dcim.device',
-        filters={'name__startswith': topo.prefix},
-        fields=['id'],
-        output_path=Path('/tmp/gpu_dc_delete_devices.parquet'),
-        verbose=False,
+    delete_path, count = export_delete_ids(
+        client, 'dcim.device', {'name__startswith': topo.prefix}, 'devices'
     )
-    device_data = read_parquet(export_path)
-    device_ids = device_data.get('id', [])
-    if device_ids:
-        delete_path = Path('/tmp/gpu_dc_delete_device_ids.parquet')
-        create_pk_parquet(device_ids, delete_path)
+    if count:
         result = client.delete('dcim.device', delete_path, verbose=False)
         print(f"   Deleted {result.get('data', {}).get('rows_affected', 0):,} devices")
     else:
@@ -453,7 +461,7 @@ def cmd_teardown(client: TurboBulkClient, args):
     print("\nTeardown complete!")
 
 
-def main():
+def main(argv=None):
     parser = argparse.ArgumentParser(
         description='GPU Datacenter Cabling Design Tool',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -476,7 +484,7 @@ def main():
     parser.add_argument('command', choices=['setup', 'devices', 'push', 'status', 'delete', 'teardown'],
                         help='Command to execute')
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     try:
         client = TurboBulkClient(base_url=args.url, token=args.token)
@@ -15,7 +15,6 @@ Run: python 07_post_hooks.py [--cleanup]
 """
 
 import argparse
-import sys
 import tempfile
 import time
 from pathlib import Path
@@ -23,9 +22,6 @@ from pathlib import Path
 import pyarrow as pa
 import pyarrow.parquet as pq
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent))
-
 from turbobulk_client import TurboBulkClient
 
 
@@ -300,11 +296,11 @@ def cleanup(client: TurboBulkClient, prefix: str):
         print("  No test data to clean up")
 
 
-def main():
+def main(argv=None):
     parser = argparse.ArgumentParser(description='Post-hooks demonstration')
     parser.add_argument('--cleanup', action='store_true', help='Clean up test data and exit')
     parser.add_argument('--prefix', default='tb-hooks', help='Prefix for test objects')
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     client = TurboBulkClient()
     print(f"Connected to: {client.base_url}")
@@ -36,9 +36,6 @@ from typing import Optional
 import pyarrow as pa
 import pyarrow.parquet as pq
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent))
-
 from turbobulk_client import TurboBulkClient, TurboBulkError
 
 
@@ -511,13 +508,13 @@ def cleanup(client: TurboBulkClient):
         print("  No devices to clean up from main")
 
 
-def main():
+def main(argv=None):
     parser = argparse.ArgumentParser(description='TurboBulk + NetBox Branching demo')
     parser.add_argument('--merge', action='store_true',
                         help='Merge the test branch to main at the end')
     parser.add_argument('--cleanup', action='store_true',
                         help='Clean up test branch and data and exit')
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     client = TurboBulkClient()
     print(f"Connected to: {client.base_url}")
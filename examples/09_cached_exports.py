@@ -28,14 +28,11 @@ import argparse
 import json
 import sys
 import time
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent))
 
 from turbobulk_client import TurboBulkClient, TurboBulkError
 
 
-def main():
+def main(argv=None):
     parser = argparse.ArgumentParser(
         description='TurboBulk Export Caching Demonstration',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -43,7 +40,7 @@ def main():
     parser.add_argument('--url', help='NetBox URL (or set NETBOX_URL env var)')
     parser.add_argument('--token', help='API token (or set NETBOX_TOKEN env var)')
     parser.add_argument('--model', default='dcim.device', help='Model to export (default: dcim.device)')
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     try:
         client = TurboBulkClient(base_url=args.url, token=args.token)
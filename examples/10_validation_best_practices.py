@@ -19,16 +19,12 @@ Run: python 10_validation_best_practices.py [--cleanup]
 """
 
 import argparse
-import sys
 import tempfile
 from pathlib import Path
 
 import pyarrow as pa
 import pyarrow.parquet as pq
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent))
-
 from turbobulk_client import TurboBulkClient
 
 
@@ -325,11 +321,11 @@ def cleanup(client: TurboBulkClient, prefix: str):
         print("  No test data to clean up")
 
 
-def main():
+def main(argv=None):
     parser = argparse.ArgumentParser(description='Validation best practices demonstration')
     parser.add_argument('--cleanup', action='store_true', help='Clean up test data and exit')
     parser.add_argument('--prefix', default='tb-val', help='Prefix for test objects')
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     client = TurboBulkClient()
     print(f"Connected to: {client.base_url}")
@@ -34,7 +34,7 @@ def write_jsonl(data: list, path: Path):
             f.write(json.dumps(row) + '\n')
 
 
-def main():
+def main(argv=None):
     parser = argparse.ArgumentParser(
         description='Event Streams Integration Example',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -50,7 +50,7 @@ Environment variables:
     )
     parser.add_argument('--prefix', default='evt', help='Name prefix for test objects')
     parser.add_argument('--cleanup', action='store_true', help='Clean up test objects')
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     client = TurboBulkClient()
 
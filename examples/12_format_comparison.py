@@ -16,13 +16,9 @@ Run: python 12_format_comparison.py [--count N] [--cleanup]
 """
 
 import argparse
-import sys
 import time
 from pathlib import Path
 
-# Add parent to path for imports
-sys.path.insert(0, str(Path(__file__).parent))
-
 from common.parquet_utils import create_jsonl, create_parquet, read_jsonl, read_parquet
 from turbobulk_client import TurboBulkClient
 
@@ -40,13 +36,13 @@ def generate_site_data(count: int, prefix: str) -> list:
     ]
 
 
-def main():
+def main(argv=None):
     parser = argparse.ArgumentParser(description='Compare JSONL vs Parquet formats')
     parser.add_argument('--count', type=int, default=1000, help='Number of rows')
     parser.add_argument('--prefix', default='fmt', help='Data prefix')
     parser.add_argument('--cleanup', action='store_true', help='Cleanup only')
     parser.add_argument('--skip-cleanup', action='store_true', help='Skip cleanup after test')
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # TurboBulkClient reads NETBOX_URL and NETBOX_TOKEN from environment
     client = TurboBulkClient()
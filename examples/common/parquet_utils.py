@@ -11,26 +11,160 @@ JSONL is the default and recommended format for most use cases due to:
 - Universal language support (any language with JSON)
 - Row-oriented data (natural for most applications)
 - Easy debugging (human-readable)
-- Compression via gzip
+- Compression via gzip (or zstd, when the optional `zstandard` package is installed)
 """
 
 import gzip
+import io
 import json
+import queue
+import re
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Iterator, List, Any, Optional
+from typing import BinaryIO, Dict, Iterator, List, Any, Optional, Union
 
 import pyarrow as pa
 import pyarrow.parquet as pq
 
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON encoding when installed
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:  # Optional: only needed for codec='zstd'
+    zstandard = None
+
 
 # =============================================================================
 # JSONL UTILITIES (Default Format)
 # =============================================================================
 
+# Supported JSONL compression codecs and the file suffix each one produces.
+# TurboBulk uploads accept .jsonl and .jsonl.gz; .jsonl.zst is for local storage.
+JSONL_CODECS = {
+    'gzip': '.jsonl.gz',
+    'zstd': '.jsonl.zst',
+    'none': '.jsonl',
+}
+
+
+def _require_zstandard():
+    """Return the zstandard module or raise a helpful ImportError."""
+    if zstandard is None:
+        raise ImportError("zstd compression requires the 'zstandard' package (pip install zstandard)")
+    return zstandard
+
+
+def _resolve_codec(compress: bool, codec: str) -> str:
+    """Validate the codec name and fold compress=False into 'none'."""
+    if codec not in JSONL_CODECS:
+        raise ValueError(f"Unknown codec {codec!r} (expected one of: {', '.join(JSONL_CODECS)})")
+    return codec if compress else 'none'
+
+
+@contextmanager
+def _open_jsonl_writer(path: Path, codec: str) -> Iterator[BinaryIO]:
+    """Open a binary writer for a JSONL file using the given codec."""
+    if codec == 'gzip':
+        with gzip.open(path, 'wb') as f:
+            yield f
+    elif codec == 'zstd':
+        cctx = _require_zstandard().ZstdCompressor(level=3, threads=-1)
+        with open(path, 'wb') as raw, cctx.stream_writer(raw) as f:
+            yield f
+    else:
+        with open(path, 'wb') as f:
+            yield f
+
+
+def _dumps_line(row: Dict[str, Any]) -> bytes:
+    """Serialize one row to a newline-terminated JSON line (UTF-8 bytes)."""
+    if orjson is not None:
+        return orjson.dumps(
+            row,
+            default=str,
+            option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS,
+        )
+    return (json.dumps(row, default=str) + '\n').encode('utf-8')
+
+
+# orjson.loads accepts bytes directly, as does json.loads
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Streaming writes hand ~64 KiB buffers to a writer thread through a bounded queue
+_STREAM_BUFFER_SIZE = 64 * 1024
+_STREAM_QUEUE_DEPTH = 4
+
+# Reads pull 4 MiB at a time and split into lines in bulk
+_READ_CHUNK_SIZE = 4 * 1024 * 1024
+
+# An empty or whitespace-only line, matched at any line start
+_BLANK_LINE = re.compile(rb'^[ \t\r\f\v]*\n', re.M)
+
+
+def _write_rows_pipelined(f: BinaryIO, row_iterator: Iterator[Dict[str, Any]]) -> None:
+    """
+    Write rows to f using a two-stage pipeline.
+
+    The calling thread serializes rows into buffers while a background thread
+    compresses and writes them, so JSON encoding overlaps with compression
+    (zlib and zstd release the GIL while they work).
+    """
+    buffers: queue.Queue = queue.Queue(maxsize=_STREAM_QUEUE_DEPTH)
+    errors: List[BaseException] = []
+
+    def writer() -> None:
+        while True:
+            buf = buffers.get()
+            if buf is None:
+                return
+            if errors:
+                continue  # Keep draining so the producer never blocks
+            try:
+                f.write(buf)
+            except BaseException as e:
+                errors.append(e)
+
+    thread = threading.Thread(target=writer, name='jsonl-writer', daemon=True)
+    thread.start()
+    try:
+        pending = bytearray()
+        for row in row_iterator:
+            pending += _dumps_line(row)
+            if len(pending) >= _STREAM_BUFFER_SIZE:
+                buffers.put(bytes(pending))
+                pending.clear()
+                if errors:
+                    break
+        if pending:
+            buffers.put(bytes(pending))
+    finally:
+        buffers.put(None)
+        thread.join()
+
+    if errors:
+        raise errors[0]
+
+
+def _open_jsonl_reader(path: Path) -> BinaryIO:
+    """Open a binary reader for a JSONL file, sniffing compression from the extension."""
+    name = str(path)
+    if name.endswith('.gz'):
+        return gzip.open(path, 'rb')
+    if name.endswith('.zst'):
+        dctx = _require_zstandard().ZstdDecompressor()
+        return io.BufferedReader(dctx.stream_reader(open(path, 'rb'), closefd=True))
+    return open(path, 'rb')
+
+
 def create_jsonl(
     rows: List[Dict[str, Any]],
     path: Path,
     compress: bool = True,
+    codec: str = 'gzip',
 ) -> Path:
     """
     Create a JSONL file from row-oriented data.
@@ -40,7 +174,9 @@ def create_jsonl(
     Args:
         rows: List of row dictionaries
         path: Output file path (extension will be added)
-        compress: Whether to gzip compress (default: True, recommended)
+        compress: Whether to compress (default: True, recommended)
+        codec: Compression codec when compress=True - 'gzip' (default),
+               'zstd' (requires zstandard), or 'none'
 
     Returns:
         Path to created file
@@ -51,29 +187,32 @@ def create_jsonl(
             {'name': 'site-2', 'slug': 'site-2', 'status': 'active'},
         ], Path('/tmp/sites'))
     """
-    path = Path(path)
-    if compress:
-        output_path = path.with_suffix('.jsonl.gz')
-        with gzip.open(output_path, 'wt', encoding='utf-8') as f:
-            for row in rows:
-                f.write(json.dumps(row, default=str) + '\n')
-    else:
-        output_path = path.with_suffix('.jsonl')
-        with open(output_path, 'w', encoding='utf-8') as f:
-            for row in rows:
-                f.write(json.dumps(row, default=str) + '\n')
+    codec = _resolve_codec(compress, codec)
+    output_path = Path(path).with_suffix(JSONL_CODECS[codec])
+    with _open_jsonl_writer(output_path, codec) as f:
+        for row in rows:
+            f.write(_dumps_line(row))
 
     return output_path
 
 
-def create_pk_jsonl(ids: List[int], path: Path, compress: bool = True) -> Path:
+def create_pk_jsonl(
+    ids: List[int],
+    path: Path,
+    compress: bool = True,
+    codec: str = 'gzip',
+) -> Path:
     """
     Create a JSONL file with just an 'id' column for delete operations.
 
+    Lines are formatted directly as bytes (no per-row dicts or JSON encoder)
+    and written in ~64 KiB batches.
+
     Args:
         ids: List of primary key IDs to delete
         path: Output file path
-        compress: Whether to gzip compress (default: True)
+        compress: Whether to compress (default: True)
+        codec: Compression codec when compress=True ('gzip', 'zstd', or 'none')
 
     Returns:
         Path to created file
@@ -81,14 +220,26 @@ def create_pk_jsonl(ids: List[int], path: Path, compress: bool = True) -> Path:
     Example:
         create_pk_jsonl([1, 2, 3, 4, 5], Path('/tmp/delete_ids'))
     """
-    return create_jsonl([{'id': id_} for id_ in ids], path, compress=compress)
+    codec = _resolve_codec(compress, codec)
+    output_path = Path(path).with_suffix(JSONL_CODECS[codec])
+    with _open_jsonl_writer(output_path, codec) as f:
+        buf = bytearray()
+        for id_ in ids:
+            buf += b'{"id":%d}\n' % id_
+            if len(buf) >= _STREAM_BUFFER_SIZE:
+                f.write(buf)
+                buf.clear()
+        if buf:
+            f.write(buf)
+
+    return output_path
 
 
 def read_jsonl(path: Path) -> List[Dict[str, Any]]:
     """
     Read a JSONL file to list of row dicts.
 
-    Handles both plain and gzipped JSONL files.
+    Handles plain, gzipped (.gz), and zstd-compressed (.zst) JSONL files.
 
     Args:
         path: Path to JSONL file
@@ -96,18 +247,21 @@ def read_jsonl(path: Path) -> List[Dict[str, Any]]:
     Returns:
         List of row dictionaries
     """
-    path = Path(path)
-    rows = []
-
-    # Check if gzipped
-    opener = gzip.open if str(path).endswith('.gz') else open
-    mode = 'rt' if str(path).endswith('.gz') else 'r'
-
-    with opener(path, mode, encoding='utf-8') as f:
-        for line in f:
-            line = line.strip()
-            if line:
-                rows.append(json.loads(line))
+    rows: List[Dict[str, Any]] = []
+    tail = b''
+
+    with _open_jsonl_reader(Path(path)) as f:
+        while True:
+            chunk = f.read(_READ_CHUNK_SIZE)
+            if not chunk:
+                break
+            # The last piece may be a partial line; carry it into the next chunk
+            lines = (tail + chunk).split(b'\n')
+            tail = lines.pop()
+            rows.extend([_json_loads(line) for line in lines if line.strip()])
+
+    if tail.strip():
+        rows.append(_json_loads(tail))
 
     return rows
 
@@ -116,21 +270,31 @@ def jsonl_row_count(path: Path) -> int:
     """
     Get row count from a JSONL file.
 
+    Counts newline bytes chunk by chunk with bytes.count() instead of
+    splitting lines or decoding JSON. Like read_jsonl(), lines that are empty
+    or whitespace-only are not rows, and a final record without a trailing
+    newline is.
+
     Args:
         path: Path to JSONL file
 
     Returns:
         Number of rows
     """
-    path = Path(path)
-    opener = gzip.open if str(path).endswith('.gz') else open
-    mode = 'rt' if str(path).endswith('.gz') else 'r'
-
     count = 0
-    with opener(path, mode, encoding='utf-8') as f:
-        for line in f:
-            if line.strip():
-                count += 1
+    tail = b''
+    with _open_jsonl_reader(Path(path)) as f:
+        while chunk := f.read(_READ_CHUNK_SIZE):
+            # Count complete lines only; carry the partial last line into the next chunk
+            buffer = tail + chunk
+            end = buffer.rfind(b'\n') + 1
+            tail = buffer[end:]
+            if end:
+                complete = buffer[:end]
+                count += complete.count(b'\n') - len(_BLANK_LINE.findall(complete))
+
+    if tail.strip():
+        count += 1
     return count
 
 
@@ -138,14 +302,19 @@ def create_jsonl_streaming(
     row_iterator: Iterator[Dict[str, Any]],
     path: Path,
     compress: bool = True,
+    codec: str = 'gzip',
 ) -> Path:
     """
     Stream rows to JSONL file (memory efficient for large datasets).
 
+    Rows are serialized on the calling thread while compression and disk
+    writes run on a background thread.
+
     Args:
         row_iterator: Iterator yielding row dictionaries
         path: Output file path (extension will be added)
-        compress: Whether to gzip compress (default: True)
+        compress: Whether to compress (default: True)
+        codec: Compression codec when compress=True ('gzip', 'zstd', or 'none')
 
     Returns:
         Path to created file
@@ -157,17 +326,10 @@ def create_jsonl_streaming(
 
         create_jsonl_streaming(generate_sites(), Path('/tmp/sites'))
     """
-    path = Path(path)
-    if compress:
-        output_path = path.with_suffix('.jsonl.gz')
-        with gzip.open(output_path, 'wt', encoding='utf-8') as f:
-            for row in row_iterator:
-                f.write(json.dumps(row, default=str) + '\n')
-    else:
-        output_path = path.with_suffix('.jsonl')
-        with open(output_path, 'w', encoding='utf-8') as f:
-            for row in row_iterator:
-                f.write(json.dumps(row, default=str) + '\n')
+    codec = _resolve_codec(compress, codec)
+    output_path = Path(path).with_suffix(JSONL_CODECS[codec])
+    with _open_jsonl_writer(output_path, codec) as f:
+        _write_rows_pipelined(f, row_iterator)
 
     return output_path
 
@@ -176,19 +338,87 @@ def create_jsonl_streaming(
 # PARQUET UTILITIES (High-Performance Alternative)
 # =============================================================================
 
+# Parquet codecs that accept an explicit compression level.
+_LEVELLED_CODECS = ('zstd', 'gzip', 'brotli')
+
+# Parquet pages are flushed as many small writes; coalesce them in
+# userspace so each write() syscall moves a large contiguous block.
+_PARQUET_WRITE_BUFFER_SIZE = 8 * 1024 * 1024
+
+
+def _parquet_sink(path: Path) -> pa.NativeFile:
+    """Open a buffered Arrow output stream for writing a Parquet file."""
+    return pa.output_stream(
+        str(path), compression=None, buffer_size=_PARQUET_WRITE_BUFFER_SIZE
+    )
+
+
+def create_parquet_table(
+    table: pa.Table,
+    path: Path,
+    compression: str = 'zstd',
+    compression_level: Optional[int] = 3,
+    row_group_size: int = 128 * 1024,
+    data_page_size: int = 1 << 20,
+) -> Path:
+    """
+    Write an existing PyArrow table to a Parquet file.
+
+    Use this when the data is already in Arrow form (e.g. the topology
+    generators) to skip the per-element type inference of create_parquet.
+    Files are written with zstd compression, dictionary encoding and column
+    statistics. zstd packs the mostly-sequential integer FK columns much
+    tighter than the snappy default at similar speed.
+
+    Args:
+        table: Table to write
+        path: Output file path
+        compression: Parquet codec (default: 'zstd'; also 'snappy', 'gzip', 'none')
+        compression_level: Level for zstd/gzip/brotli (default: 3; ignored by other codecs)
+        row_group_size: Maximum rows per row group (default: 131072)
+        data_page_size: Target data page size in bytes (default: 1 MiB)
+
+    Returns:
+        Path to created file
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    with _parquet_sink(path) as sink:
+        pq.write_table(
+            table,
+            sink,
+            compression=compression,
+            compression_level=compression_level if compression in _LEVELLED_CODECS else None,
+            use_dictionary=True,
+            write_statistics=True,
+            row_group_size=row_group_size,
+            data_page_size=data_page_size,
+        )
+    return path
+
+
 def create_parquet(
-    data: Dict[str, List[Any]],
+    data: Union[Dict[str, List[Any]], pa.Table],
     path: Path,
     schema: Optional[pa.Schema] = None,
+    compression: str = 'zstd',
+    compression_level: Optional[int] = 3,
+    row_group_size: int = 128 * 1024,
+    data_page_size: int = 1 << 20,
 ) -> Path:
     """
     Create a Parquet file from column-oriented data.
 
     Args:
-        data: Dict mapping column names to lists of values.
-              All lists must have the same length.
+        data: Dict mapping column names to lists (or PyArrow arrays) of values,
+              or a PyArrow table. All columns must have the same length.
         path: Output file path
         schema: Optional PyArrow schema for explicit type control
+        compression: Parquet codec (default: 'zstd'; also 'snappy', 'gzip', 'none')
+        compression_level: Level for zstd/gzip/brotli (default: 3; ignored by other codecs)
+        row_group_size: Maximum rows per row group (default: 131072)
+        data_page_size: Target data page size in bytes (default: 1 MiB)
 
     Returns:
         Path to created file
@@ -200,24 +430,29 @@ def create_parquet(
             'status': ['active', 'active', 'planned'],
         }, Path('/tmp/sites.parquet'))
     """
-    path = Path(path)
-    path.parent.mkdir(parents=True, exist_ok=True)
-
-    if schema:
+    if isinstance(data, pa.Table):
+        table = data.cast(schema) if schema else data
+    elif schema:
         table = pa.table(data, schema=schema)
     else:
         table = pa.table(data)
 
-    pq.write_table(table, path)
-    return path
+    return create_parquet_table(
+        table,
+        path,
+        compression=compression,
+        compression_level=compression_level,
+        row_group_size=row_group_size,
+        data_page_size=data_page_size,
+    )
 
 
-def create_pk_parquet(ids: List[int], path: Path) -> Path:
+def create_pk_parquet(ids: Union[List[int], pa.Array], path: Path) -> Path:
     """
     Create a Parquet file with just an 'id' column for delete operations.
 
     Args:
-        ids: List of primary key IDs to delete
+        ids: Primary key IDs to delete, as a list or an int64 PyArrow array
         path: Output file path
 
     Returns:
@@ -226,29 +461,41 @@ def create_pk_parquet(ids: List[int], path: Path) -> Path:
     Example:
         create_pk_parquet([1, 2, 3, 4, 5], Path('/tmp/delete_ids.parquet'))
     """
-    return create_parquet({'id': ids}, path)
+    return create_parquet({'id': pa.array(ids, type=pa.int64())}, path)
 
 
-def read_parquet(path: Path) -> Dict[str, List[Any]]:
+def read_parquet(
+    path: Path,
+    columns: Optional[List[str]] = None,
+    as_arrow: bool = False,
+) -> Union[Dict[str, List[Any]], pa.Table]:
     """
     Read a Parquet file to column-oriented dict.
 
     Args:
         path: Path to Parquet file
+        columns: Only read these columns (default: all). Unread columns are
+                 skipped on disk, so lookups like id + name stay cheap on
+                 wide exports.
+        as_arrow: Return the PyArrow table instead of converting every value
+                  to a Python object (default: False)
 
     Returns:
-        Dict mapping column names to lists of values
+        Dict mapping column names to lists of values, or a PyArrow Table
+        if as_arrow is set
 
     Example:
-        data = read_parquet(Path('/tmp/sites.parquet'))
+        data = read_parquet(Path('/tmp/sites.parquet'), columns=['name', 'slug'])
         for name, slug in zip(data['name'], data['slug']):
             print(f"{name}: {slug}")
     """
-    table = pq.read_table(path)
+    table = pq.read_table(path, columns=columns)
+    if as_arrow:
+        return table
     return {col: table[col].to_pylist() for col in table.column_names}
 
 
-def read_parquet_table(path: Path) -> pa.Table:
+def read_parquet_table(path: Path, columns: Optional[List[str]] = None) -> pa.Table:
     """
     Read a Parquet file as a PyArrow Table.
 
@@ -256,11 +503,12 @@ def read_parquet_table(path: Path) -> pa.Table:
 
     Args:
         path: Path to Parquet file
+        columns: Only read these columns (default: all)
 
     Returns:
         PyArrow Table
     """
-    return pq.read_table(path)
+    return pq.read_table(path, columns=columns)
 
 
 def parquet_row_count(path: Path) -> int:
@@ -281,7 +529,9 @@ def merge_parquet_files(input_paths: List[Path], output_path: Path) -> Path:
     """
     Merge multiple Parquet files into one.
 
-    All input files must have the same schema.
+    All input files must have the same schema. Row groups are copied one at
+    a time, so memory use is bounded by the largest row group rather than
+    the combined size of the inputs.
 
     Args:
         input_paths: List of Parquet file paths to merge
@@ -290,9 +540,22 @@ def merge_parquet_files(input_paths: List[Path], output_path: Path) -> Path:
     Returns:
         Path to merged file
     """
-    tables = [pq.read_table(p) for p in input_paths]
-    merged = pa.concat_tables(tables)
-    pq.write_table(merged, output_path)
+    if not input_paths:
+        raise ValueError('merge_parquet_files needs at least one input file')
+
+    schema = pq.read_schema(input_paths[0])
+    with _parquet_sink(output_path) as sink, pq.ParquetWriter(
+        sink,
+        schema,
+        compression='zstd',
+        compression_level=3,
+        use_dictionary=True,
+        write_statistics=True,
+    ) as writer:
+        for input_path in input_paths:
+            source = pq.ParquetFile(input_path)
+            for row_group in range(source.num_row_groups):
+                writer.write_table(source.read_row_group(row_group))
     return output_path
 
 
@@ -331,7 +594,7 @@ def netbox_schema_interface() -> pa.Schema:
     return pa.schema([
         ('device', pa.int64()),  # FK
         ('name', pa.string()),
-        ('type', pa.string()),  # e.g., '400gbase-x-qsfpdd'
+        ('type', pa.dictionary(pa.int32(), pa.string())),  # e.g., '400gbase-x-qsfpdd'
         ('enabled', pa.bool_()),
         ('description', pa.string()),
     ])
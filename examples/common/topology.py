@@ -5,10 +5,215 @@ Generates realistic spine-leaf GPU cluster topology data for TurboBulk examples.
 Designed to scale to ~200K cables for performance testing.
 """
 
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
-from typing import Dict, List, Tuple, Any
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import json
 
+import pyarrow as pa
+import pyarrow.compute as pc
+
+
+# Interface names eth1..eth1024; ETH_NAMES[port] is the name of 0-based port
+ETH_NAMES = [f'eth{port}' for port in range(1, 1025)]
+
+
+def _eth_names(count: int) -> List[str]:
+    """Names of the first count interfaces (eth1..eth{count})."""
+    if count <= len(ETH_NAMES):
+        return ETH_NAMES[:count]
+    return ETH_NAMES + [f'eth{port}' for port in range(len(ETH_NAMES) + 1, count + 1)]
+
+
+def _dictionary(indices: pa.Array, values: List[str]) -> pa.DictionaryArray:
+    """Dictionary-encode a string column from integer indices into values."""
+    return pa.DictionaryArray.from_arrays(
+        pc.cast(indices, pa.int32()), pa.array(values, type=pa.string())
+    )
+
+
+def _repeat_dictionary(value: str, count: int) -> pa.DictionaryArray:
+    """Dictionary-encoded column holding the same string count times."""
+    return _dictionary(pa.repeat(pa.scalar(0, pa.int32()), count), [value])
+
+
+def _concat(arrays: List[pa.Array]) -> pa.Array:
+    """Concatenate arrays, unifying dictionaries for dictionary-encoded columns."""
+    if pa.types.is_dictionary(arrays[0].type):
+        return pa.chunked_array(arrays).unify_dictionaries().combine_chunks()
+    return pa.concat_arrays(arrays)
+
+
+def _interface_block(
+    device_ids: pa.Array,
+    port_names: List[str],
+    port_descriptions: List[str],
+    interface_type: str,
+) -> Dict[str, pa.Array]:
+    """
+    Build interface columns for devices that all share the same port layout.
+
+    Row i belongs to device i // ports and port i % ports, so every column is
+    produced with Arrow kernels (take/repeat) instead of a per-row Python loop.
+    Name, type and description repeat per port, so they are dictionary-encoded
+    against the per-port tables rather than materialized as strings.
+    """
+    ports = len(port_names)
+    total = len(device_ids) * ports
+    row = pa.array(range(total), type=pa.int64())
+    device_idx = pc.divide(row, ports) if ports else row
+    port_idx = pc.subtract(row, pc.multiply(device_idx, ports))
+
+    return {
+        'device_id': device_ids.take(device_idx),
+        'name': _dictionary(port_idx, port_names),
+        'type': _repeat_dictionary(interface_type, total),
+        'enabled': pa.repeat(pa.scalar(True, pa.bool_()), total),
+        'description': _dictionary(port_idx, port_descriptions),
+    }
+
+
+def _divmod(values: pa.Array, divisor: int) -> Tuple[pa.Array, pa.Array]:
+    """Element-wise (values // divisor, values % divisor) for non-negative int64 arrays."""
+    quotient = pc.divide(values, divisor) if divisor else values
+    return quotient, pc.subtract(values, pc.multiply(quotient, divisor))
+
+
+def _fabric_link_indices(
+    pods: int,
+    leaves_per_pod: int,
+    spines_per_pod: int,
+    spine_ports: int,
+) -> Dict[str, pa.Array]:
+    """
+    Compute spine-to-leaf cable endpoints as integer arrays.
+
+    Each leaf has 2 redundant links to every spine in its pod. Returns the
+    global leaf index, global spine index, leaf port and spine port (both
+    1-based) for every fabric cable, in cable order.
+    """
+    links_per_leaf = spines_per_pod * 2
+    cable = pa.array(range(pods * leaves_per_pod * links_per_leaf), type=pa.int64())
+    leaf, within = _divmod(cable, links_per_leaf)
+    pod, leaf_in_pod = _divmod(leaf, leaves_per_pod)
+    spine_in_pod, redundant = _divmod(within, 2)
+    _, spine_port = _divmod(pc.add(pc.multiply(leaf_in_pod, 2), redundant), spine_ports)
+
+    return {
+        'leaf': leaf,
+        'spine': pc.add(pc.multiply(pod, spines_per_pod), spine_in_pod),
+        'leaf_port': pc.add(within, 1),
+        'spine_port': pc.add(spine_port, 1),
+    }
+
+
+def _server_link_indices(
+    total_leaves: int,
+    gpu_servers_per_leaf: int,
+    nics_per_gpu_server: int,
+    leaf_uplinks: int,
+) -> Dict[str, pa.Array]:
+    """
+    Compute leaf-to-server cable endpoints as integer arrays.
+
+    Returns the global leaf index, leaf port (1-based, after the uplinks),
+    global GPU server index and NIC port (1-based) for every server cable.
+    """
+    links_per_leaf = gpu_servers_per_leaf * nics_per_gpu_server
+    cable = pa.array(range(total_leaves * links_per_leaf), type=pa.int64())
+    leaf, within = _divmod(cable, links_per_leaf)
+    gpu_in_leaf, nic = _divmod(within, nics_per_gpu_server)
+
+    return {
+        'leaf': leaf,
+        'leaf_port': pc.add(within, leaf_uplinks + 1),
+        'gpu': pc.add(pc.multiply(leaf, gpu_servers_per_leaf), gpu_in_leaf),
+        'nic_port': pc.add(nic, 1),
+    }
+
+
+# Interface (device_id, port) pairs are packed into one int64 key as
+# device_id * _PORT_KEY_STRIDE + port
+_PORT_KEY_STRIDE = 1 << 20
+
+
+def _interface_keys(interfaces: pa.Table) -> Tuple[pa.Array, pa.Array]:
+    """
+    Integer (device_id, port) keys and IDs for the ethN interfaces in a table.
+
+    Interfaces not named ethN are ignored.
+    """
+    names = interfaces.column('name').combine_chunks()
+    eth = interfaces.filter(pc.match_substring_regex(names, r'^eth[0-9]{1,6}$'))
+    port = pc.cast(pc.utf8_slice_codeunits(eth.column('name'), 3), pa.int64())
+    device_id = pc.cast(eth.column('device_id'), pa.int64())
+    keep = pc.less(port, _PORT_KEY_STRIDE)
+    key = pc.add(pc.multiply(device_id, _PORT_KEY_STRIDE), port).filter(keep)
+    return key.combine_chunks(), pc.cast(eth.column('id'), pa.int64()).filter(keep).combine_chunks()
+
+
+def _port_id_table(
+    device_ids: pa.Array,
+    ports: int,
+    interface_keys: pa.Array,
+    interface_ids: pa.Array,
+) -> pa.Array:
+    """
+    Lay out interface IDs for devices' eth1..eth{ports} as a flat (device, port) table.
+
+    Entry device * ports + (port - 1) holds the ID of that device's eth{port},
+    or null if the device or interface is missing.
+    """
+    row = pa.array(range(len(device_ids) * ports), type=pa.int64())
+    device, port = _divmod(row, ports)
+    key = pc.add(pc.multiply(device_ids.take(device), _PORT_KEY_STRIDE), pc.add(port, 1))
+    return interface_ids.take(pc.index_in(key, value_set=interface_keys))
+
+
+def _endpoint_ids(id_table: pa.Array, device: pa.Array, port: pa.Array, ports: int) -> pa.Array:
+    """Look up (device index, 1-based port) pairs in a _port_id_table; null if absent."""
+    index = pc.add(pc.multiply(device, ports), pc.subtract(port, 1))
+    in_range = pc.less_equal(port, ports)
+    return id_table.take(pc.if_else(in_range, index, pa.scalar(None, pa.int64())))
+
+
+def _labels(prefix: str, start: int, stop: int) -> pa.Array:
+    """Labels prefix + zero-padded six digit number for numbers in [start, stop)."""
+    numbers = pc.cast(pa.array(range(start, stop), type=pa.int64()), pa.string())
+    return pc.binary_join_element_wise(prefix, pc.utf8_lpad(numbers, 6, '0'), '')
+
+
+def _group_endpoints(
+    fabric: Dict[str, pa.Array],
+    server: Dict[str, pa.Array],
+    leaf_ids: pa.Array,
+    spine_ids: pa.Array,
+    gpu_ids: pa.Array,
+    ports: Tuple[int, int, int],
+) -> Tuple[pa.Array, pa.Array, pa.Array, pa.Array]:
+    """
+    A- and B-side interface IDs for one group of pods.
+
+    fabric/server hold link indices local to the group and the ID tables
+    cover only the group's devices. ports is (leaf, spine, GPU NIC) port
+    counts. Returns (fabric A, fabric B, server A, server B).
+    """
+    leaf_ports, spine_ports, nic_ports = ports
+    return (
+        _endpoint_ids(leaf_ids, fabric['leaf'], fabric['leaf_port'], leaf_ports),
+        _endpoint_ids(spine_ids, fabric['spine'], fabric['spine_port'], spine_ports),
+        _endpoint_ids(leaf_ids, server['leaf'], server['leaf_port'], leaf_ports),
+        _endpoint_ids(gpu_ids, server['gpu'], server['nic_port'], nic_ports),
+    )
+
+
+def _run_tasks(function: Callable, tasks: List[Tuple], workers: Optional[int]) -> List[Any]:
+    """Run function(*task) for each task, in a process pool when workers > 1."""
+    if not workers or workers <= 1 or len(tasks) <= 1:
+        return [function(*task) for task in tasks]
+    with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+        return list(pool.map(function, *zip(*tasks)))
+
 
 @dataclass
 class GPUDatacenterTopology:
@@ -156,13 +361,38 @@ class GPUDatacenterTopology:
             },
         ]
 
+    def _spine_names(self) -> List[str]:
+        """Spine device names in generation order."""
+        return [
+            f'{self.prefix}-spine-p{pod:02d}-s{s:02d}'
+            for pod in range(self.pods)
+            for s in range(self.spines_per_pod)
+        ]
+
+    def _leaf_names(self) -> List[str]:
+        """Leaf device names in generation order."""
+        return [
+            f'{self.prefix}-leaf-p{pod:02d}-r{l:02d}'
+            for pod in range(self.pods)
+            for l in range(self.leaves_per_pod)
+        ]
+
+    def _gpu_names(self) -> List[str]:
+        """GPU server names in generation order."""
+        return [
+            f'{self.prefix}-gpu-p{pod:02d}-r{l:02d}-u{g:02d}'
+            for pod in range(self.pods)
+            for l in range(self.leaves_per_pod)
+            for g in range(self.gpu_servers_per_leaf)
+        ]
+
     def generate_devices(
         self,
         site_id: int,
         device_type_ids: Dict[str, int],
         device_role_ids: Dict[str, int],
         rack_ids: Dict[str, int] = None,
-    ) -> Dict[str, List[Any]]:
+    ) -> pa.Table:
         """
         Generate device records.
 
@@ -173,259 +403,254 @@ class GPUDatacenterTopology:
             rack_ids: Optional map of rack name to ID
 
         Returns:
-            Column-oriented dict for Parquet creation
+            PyArrow table ready for create_parquet_table
         """
+        spine_names = self._spine_names()
+        leaf_names = self._leaf_names()
+        gpu_names = self._gpu_names()
+
+        # (count, device type ID, role ID) per device block, in generation order
+        blocks = [
+            (
+                len(spine_names),
+                device_type_ids.get(f'{self.prefix}-spine-64x400g'),
+                device_role_ids.get(f'{self.prefix}-spine'),
+            ),
+            (
+                len(leaf_names),
+                device_type_ids.get(f'{self.prefix}-leaf-64x400g'),
+                device_role_ids.get(f'{self.prefix}-leaf'),
+            ),
+            (
+                len(gpu_names),
+                device_type_ids.get(f'{self.prefix}-gpu-8x400g'),
+                device_role_ids.get(f'{self.prefix}-gpu-server'),
+            ),
+        ]
+        total = sum(count for count, _, _ in blocks)
+
+        serials = (
+            [f'SPN-{pod:02d}{s:02d}' for pod in range(self.pods) for s in range(self.spines_per_pod)]
+            + [f'LF-{pod:02d}{l:02d}' for pod in range(self.pods) for l in range(self.leaves_per_pod)]
+            + [f'GPU-{n:06d}' for n in range(len(gpu_names))]
+        )
+
         # FK columns use DB column names with _id suffix
-        devices = {
-            'name': [],
-            'device_type_id': [],  # FK to device type
-            'role_id': [],  # FK to device role
-            'site_id': [],  # FK to site
-            'status': [],
-            'serial': [],
-        }
-
-        # Spine switches
-        spine_type_id = device_type_ids.get(f'{self.prefix}-spine-64x400g')
-        spine_role_id = device_role_ids.get(f'{self.prefix}-spine')
-
-        for pod in range(self.pods):
-            for s in range(self.spines_per_pod):
-                name = f'{self.prefix}-spine-p{pod:02d}-s{s:02d}'
-                devices['name'].append(name)
-                devices['device_type_id'].append(spine_type_id)
-                devices['role_id'].append(spine_role_id)
-                devices['site_id'].append(site_id)
-                devices['status'].append('active')
-                devices['serial'].append(f'SPN-{pod:02d}{s:02d}')
-
-        # Leaf switches
-        leaf_type_id = device_type_ids.get(f'{self.prefix}-leaf-64x400g')
-        leaf_role_id = device_role_ids.get(f'{self.prefix}-leaf')
-
-        for pod in range(self.pods):
-            for l in range(self.leaves_per_pod):
-                name = f'{self.prefix}-leaf-p{pod:02d}-r{l:02d}'
-                devices['name'].append(name)
-                devices['device_type_id'].append(leaf_type_id)
-                devices['role_id'].append(leaf_role_id)
-                devices['site_id'].append(site_id)
-                devices['status'].append('active')
-                devices['serial'].append(f'LF-{pod:02d}{l:02d}')
-
-        # GPU servers
-        gpu_type_id = device_type_ids.get(f'{self.prefix}-gpu-8x400g')
-        gpu_role_id = device_role_ids.get(f'{self.prefix}-gpu-server')
-
-        server_num = 0
-        for pod in range(self.pods):
-            for l in range(self.leaves_per_pod):
-                for g in range(self.gpu_servers_per_leaf):
-                    name = f'{self.prefix}-gpu-p{pod:02d}-r{l:02d}-u{g:02d}'
-                    devices['name'].append(name)
-                    devices['device_type_id'].append(gpu_type_id)
-                    devices['role_id'].append(gpu_role_id)
-                    devices['site_id'].append(site_id)
-                    devices['status'].append('active')
-                    devices['serial'].append(f'GPU-{server_num:06d}')
-                    server_num += 1
-
-        return devices
-
-    def generate_interfaces(self, device_id_map: Dict[str, int]) -> Dict[str, List[Any]]:
+        return pa.table({
+            'name': pa.array(spine_names + leaf_names + gpu_names, type=pa.string()),
+            'device_type_id': pa.concat_arrays([  # FK to device type
+                pa.repeat(pa.scalar(type_id, pa.int64()), count) for count, type_id, _ in blocks
+            ]),
+            'role_id': pa.concat_arrays([  # FK to device role
+                pa.repeat(pa.scalar(role_id, pa.int64()), count) for count, _, role_id in blocks
+            ]),
+            'site_id': pa.repeat(pa.scalar(site_id, pa.int64()), total),  # FK to site
+            'status': _repeat_dictionary('active', total),
+            'serial': pa.array(serials, type=pa.string()),
+        })
+
+    def generate_interfaces(
+        self,
+        device_id_map: Dict[str, int],
+        workers: Optional[int] = None,
+    ) -> pa.Table:
         """
         Generate interface records for all devices.
 
+        Devices missing from device_id_map are skipped.
+
         Args:
             device_id_map: Map of device name to device ID
+            workers: Build each pod in a separate process, using up to this
+                     many workers (default: None, build in-process). Only
+                     worth it for very large scale-outs; output is identical.
 
         Returns:
-            Column-oriented dict for Parquet creation
+            PyArrow table ready for create_parquet_table
         """
+
+        def present_ids(names: List[str]) -> pa.Array:
+            lookup = device_id_map.get
+            ids = pa.array((lookup(name) for name in names), type=pa.int64(), size=len(names))
+            return ids.drop_null()
+
+        leaf_descriptions = [
+            f'Uplink to spine {port + 1}' if port < self.leaf_uplinks
+            else f'Downlink to server {port - self.leaf_uplinks + 1}'
+            for port in range(self.leaf_ports)
+        ]
+
+        # (device names, port names, port descriptions, interface type) per role
+        roles = [
+            (
+                self._spine_names(),
+                _eth_names(self.spine_ports),
+                [f'Spine port {port + 1}' for port in range(self.spine_ports)],
+                self.spine_interface_type,
+            ),
+            (
+                self._leaf_names(),
+                _eth_names(self.leaf_ports),
+                leaf_descriptions,
+                self.leaf_interface_type,
+            ),
+            (
+                self._gpu_names(),
+                _eth_names(self.nics_per_gpu_server),
+                [f'Fabric NIC {nic + 1}' for nic in range(self.nics_per_gpu_server)],
+                self.server_interface_type,
+            ),
+        ]
+
+        # Devices are laid out pod by pod within each role, so a pod is a
+        # contiguous slice of every role's name list
+        groups = self.pods if workers and workers > 1 and self.pods > 1 else 1
+        tasks = []
+        for names, port_names, descriptions, interface_type in roles:
+            per_group = len(names) // groups
+            for group in range(groups):
+                group_names = names[group * per_group:(group + 1) * per_group]
+                tasks.append((present_ids(group_names), port_names, descriptions, interface_type))
+        blocks = _run_tasks(_interface_block, tasks, workers)
+
         # FK columns use DB column names with _id suffix
-        interfaces = {
-            'device_id': [],  # FK to device
-            'name': [],
-            'type': [],
-            'enabled': [],
-            'description': [],
-        }
-
-        # Spine interfaces
-        for pod in range(self.pods):
-            for s in range(self.spines_per_pod):
-                device_name = f'{self.prefix}-spine-p{pod:02d}-s{s:02d}'
-                device_id = device_id_map.get(device_name)
-                if device_id is None:
-                    continue
-
-                for port in range(self.spine_ports):
-                    interfaces['device_id'].append(device_id)
-                    interfaces['name'].append(f'eth{port + 1}')
-                    interfaces['type'].append(self.spine_interface_type)
-                    interfaces['enabled'].append(True)
-                    interfaces['description'].append(f'Spine port {port + 1}')
-
-        # Leaf interfaces
-        for pod in range(self.pods):
-            for l in range(self.leaves_per_pod):
-                device_name = f'{self.prefix}-leaf-p{pod:02d}-r{l:02d}'
-                device_id = device_id_map.get(device_name)
-                if device_id is None:
-                    continue
-
-                for port in range(self.leaf_ports):
-                    if port < self.leaf_uplinks:
-                        desc = f'Uplink to spine {port + 1}'
-                    else:
-                        desc = f'Downlink to server {port - self.leaf_uplinks + 1}'
-
-                    interfaces['device_id'].append(device_id)
-                    interfaces['name'].append(f'eth{port + 1}')
-                    interfaces['type'].append(self.leaf_interface_type)
-                    interfaces['enabled'].append(True)
-                    interfaces['description'].append(desc)
-
-        # GPU server interfaces
-        for pod in range(self.pods):
-            for l in range(self.leaves_per_pod):
-                for g in range(self.gpu_servers_per_leaf):
-                    device_name = f'{self.prefix}-gpu-p{pod:02d}-r{l:02d}-u{g:02d}'
-                    device_id = device_id_map.get(device_name)
-                    if device_id is None:
-                        continue
-
-                    for nic in range(self.nics_per_gpu_server):
-                        interfaces['device_id'].append(device_id)
-                        interfaces['name'].append(f'eth{nic + 1}')
-                        interfaces['type'].append(self.server_interface_type)
-                        interfaces['enabled'].append(True)
-                        interfaces['description'].append(f'Fabric NIC {nic + 1}')
-
-        return interfaces
+        return pa.table({
+            column: _concat([block[column] for block in blocks])
+            for column in blocks[0]
+        })
 
     def generate_cables(
         self,
-        interface_map: Dict[str, int],
+        interfaces: pa.Table,
+        device_id_map: Dict[str, int],
         interface_content_type_id: int,
-    ) -> Tuple[Dict[str, List[Any]], Dict[str, List[Any]]]:
+        workers: Optional[int] = None,
+    ) -> Tuple[pa.Table, pa.Table]:
         """
         Generate cable and cable termination records.
 
+        Interfaces are matched on integer (device ID, port number) keys, so
+        no per-cable strings are built or hashed.
+
         Args:
-            interface_map: Map of "device_name:interface_name" to interface ID
+            interfaces: Loaded interfaces with id, device_id and name columns
+                        (e.g. a Parquet export of dcim.interface)
+            device_id_map: Map of device name to device ID
             interface_content_type_id: ContentType ID for dcim.interface
+            workers: Resolve each pod's cable endpoints in a separate process,
+                     using up to this many workers (default: None, resolve
+                     in-process). Output is identical.
 
         Returns:
-            Tuple of (cable_data, termination_data) dicts
+            Tuple of (cable_data, termination_data) PyArrow tables
         """
-        cables = {
-            'type': [],
-            'status': [],
-            'label': [],
-            'color': [],
-        }
-
-        # We'll store termination info indexed by cable label
-        # After loading cables, we'll update with cable IDs
-        termination_staging = []  # List of (label, a_iface_key, b_iface_key)
-
-        cable_idx = 0
-
-        # Spine-to-Leaf cables
-        # Each leaf connects to all spines in its pod with redundant links
-        for pod in range(self.pods):
-            for l in range(self.leaves_per_pod):
-                leaf_name = f'{self.prefix}-leaf-p{pod:02d}-r{l:02d}'
-                uplink_port = 1
-
-                for s in range(self.spines_per_pod):
-                    spine_name = f'{self.prefix}-spine-p{pod:02d}-s{s:02d}'
-
-                    # 2 redundant connections per spine
-                    for redundant in range(2):
-                        # Find the next available port on leaf
-                        leaf_iface = f'{leaf_name}:eth{uplink_port}'
-                        # Distribute across spine ports
-                        spine_port = (l * 2 + redundant) % self.spine_ports + 1
-                        spine_iface = f'{spine_name}:eth{spine_port}'
-
-                        label = f'{self.prefix}-fab-{cable_idx:06d}'
-                        cables['type'].append(self.fabric_cable_type)
-                        cables['status'].append(self.fabric_cable_status)
-                        cables['label'].append(label)
-                        cables['color'].append('00ff00')  # Green for fabric
-
-                        termination_staging.append((label, leaf_iface, spine_iface))
-                        cable_idx += 1
-                        uplink_port += 1
-
-        # Leaf-to-Server cables
-        for pod in range(self.pods):
-            for l in range(self.leaves_per_pod):
-                leaf_name = f'{self.prefix}-leaf-p{pod:02d}-r{l:02d}'
-                # Start from after uplinks
-                downlink_port = self.leaf_uplinks + 1
-
-                for g in range(self.gpu_servers_per_leaf):
-                    gpu_name = f'{self.prefix}-gpu-p{pod:02d}-r{l:02d}-u{g:02d}'
-
-                    for nic in range(self.nics_per_gpu_server):
-                        leaf_iface = f'{leaf_name}:eth{downlink_port}'
-                        gpu_iface = f'{gpu_name}:eth{nic + 1}'
-
-                        label = f'{self.prefix}-srv-{cable_idx:06d}'
-                        cables['type'].append(self.fabric_cable_type)
-                        cables['status'].append(self.fabric_cable_status)
-                        cables['label'].append(label)
-                        cables['color'].append('0000ff')  # Blue for server
-
-                        termination_staging.append((label, leaf_iface, gpu_iface))
-                        cable_idx += 1
-                        downlink_port += 1
-
-        # Build termination data using interface_map
+        # Every pod is wired identically and its cables are contiguous in
+        # cable order, so links are computed once for a group of pods (with
+        # group-local device indices) and resolved against each group's IDs
+        groups = self.pods if workers and workers > 1 and self.pods > 1 else 1
+        pods_per_group = self.pods // groups
+        fabric = _fabric_link_indices(
+            pods_per_group, self.leaves_per_pod, self.spines_per_pod, self.spine_ports
+        )
+        server = _server_link_indices(
+            pods_per_group * self.leaves_per_pod, self.gpu_servers_per_leaf,
+            self.nics_per_gpu_server, self.leaf_uplinks,
+        )
+        n_fabric = len(fabric['leaf']) * groups
+        n_server = len(server['leaf']) * groups
+        total = n_fabric + n_server
+
+        # Resolve interface IDs once per interface into (device, port) tables;
+        # cable endpoints are then plain integer lookups
+        def device_ids(names: List[str]) -> pa.Array:
+            lookup = device_id_map.get
+            return pa.array((lookup(name) for name in names), type=pa.int64(), size=len(names))
+
+        keys, ids = _interface_keys(interfaces)
+        leaf_ids = _port_id_table(device_ids(self._leaf_names()), self.leaf_ports, keys, ids)
+        spine_ids = _port_id_table(device_ids(self._spine_names()), self.spine_ports, keys, ids)
+        gpu_ids = _port_id_table(
+            device_ids(self._gpu_names()), self.nics_per_gpu_server, keys, ids
+        )
+
+        def group_slice(table: pa.Array, group: int) -> pa.Array:
+            size = len(table) // groups
+            return table.slice(group * size, size)
+
+        ports = (self.leaf_ports, self.spine_ports, self.nics_per_gpu_server)
+        endpoints = _run_tasks(
+            _group_endpoints,
+            [
+                (
+                    fabric, server, group_slice(leaf_ids, group),
+                    group_slice(spine_ids, group), group_slice(gpu_ids, group), ports,
+                )
+                for group in range(groups)
+            ],
+            workers,
+        )
+
+        # A side is always the leaf; B side is the spine or GPU server.
+        # All fabric cables come before all server cables
+        a_ids = pa.concat_arrays(
+            [fab_a for fab_a, _, _, _ in endpoints] + [srv_a for _, _, srv_a, _ in endpoints]
+        )
+        b_ids = pa.concat_arrays(
+            [fab_b for _, fab_b, _, _ in endpoints] + [srv_b for _, _, _, srv_b in endpoints]
+        )
+
+        labels = pa.concat_arrays([
+            _labels(f'{self.prefix}-fab-', 0, n_fabric),
+            _labels(f'{self.prefix}-srv-', n_fabric, total),
+        ])
+        cables = pa.table({
+            'type': _repeat_dictionary(self.fabric_cable_type, total),
+            'status': _repeat_dictionary(self.fabric_cable_status, total),
+            'label': labels,
+            'color': _dictionary(  # Green for fabric, blue for server
+                pa.concat_arrays([
+                    pa.repeat(pa.scalar(0, pa.int32()), n_fabric),
+                    pa.repeat(pa.scalar(1, pa.int32()), n_server),
+                ]),
+                ['00ff00', '0000ff'],
+            ),
+        })
+
+        # Cables with a missing endpoint get no terminations. The rest get two
+        # rows each (A side, then B side), tagged with the cable label so they
+        # can be matched to cable IDs after the cables are loaded
+        connected = pc.and_(pc.is_valid(a_ids), pc.is_valid(b_ids))
+        kept = pc.sum(connected).as_py() or 0
+        row = pa.array(range(2 * kept), type=pa.int64())
+        cable, end = _divmod(row, 2)
+
         # FK columns use DB column names with _id suffix
-        terminations = {
-            'cable_id': [],  # Will be populated after cable load
-            'cable_end': [],
-            'termination_type_id': [],  # FK to ContentType
-            'termination_id': [],  # ID of the terminated object
-            '_label': [],  # Temp field to match with cables
-        }
-
-        for label, a_key, b_key in termination_staging:
-            a_id = interface_map.get(a_key)
-            b_id = interface_map.get(b_key)
-
-            if a_id is None or b_id is None:
-                continue
-
-            # A-side
-            terminations['cable_id'].append(0)  # Placeholder
-            terminations['cable_end'].append('A')
-            terminations['termination_type_id'].append(interface_content_type_id)
-            terminations['termination_id'].append(a_id)
-            terminations['_label'].append(label)
-
-            # B-side
-            terminations['cable_id'].append(0)  # Placeholder
-            terminations['cable_end'].append('B')
-            terminations['termination_type_id'].append(interface_content_type_id)
-            terminations['termination_id'].append(b_id)
-            terminations['_label'].append(label)
+        terminations = pa.table({
+            # Placeholder, populated after cable load
+            'cable_id': pa.repeat(pa.scalar(0, pa.int64()), 2 * kept),
+            'cable_end': _dictionary(end, ['A', 'B']),
+            'termination_type_id': pa.repeat(  # FK to ContentType
+                pa.scalar(interface_content_type_id, pa.int64()), 2 * kept
+            ),
+            'termination_id': pa.concat_arrays([  # ID of the terminated object
+                a_ids.filter(connected), b_ids.filter(connected),
+            ]).take(pc.add(cable, pc.multiply(end, kept))),
+            '_label': labels.filter(connected).take(cable),  # Temp field to match with cables
+        })
 
         return cables, terminations
 
     def update_terminations_with_cable_ids(
         self,
-        terminations: Dict[str, List[Any]],
+        terminations: pa.Table,
         label_to_cable_id: Dict[str, int],
-    ) -> Dict[str, List[Any]]:
+    ) -> pa.Table:
         """
         Update termination records with actual cable IDs.
 
         Call this after loading cables and exporting to get their IDs.
+        Terminations whose label has no cable ID are dropped; the rest keep
+        their original order.
 
         Args:
             terminations: Termination data with _label field
@@ -434,24 +659,20 @@ class GPUDatacenterTopology:
         Returns:
             Updated terminations with cable IDs (without _label)
         """
-        updated = {
-            'cable_id': [],  # FK uses DB column name with _id suffix
-            'cable_end': [],
-            'termination_type_id': [],  # FK to ContentType
-            'termination_id': [],
-        }
-
-        for i, label in enumerate(terminations['_label']):
-            cable_id = label_to_cable_id.get(label)
-            if cable_id is None:
-                continue
-
-            updated['cable_id'].append(cable_id)
-            updated['cable_end'].append(terminations['cable_end'][i])
-            updated['termination_type_id'].append(terminations['termination_type_id'][i])
-            updated['termination_id'].append(terminations['termination_id'][i])
-
-        return updated
+        # Position of each termination's label among the known labels (null if
+        # unknown), resolved with a hash lookup in Arrow rather than per row
+        position = pc.index_in(
+            terminations.column('_label').combine_chunks(),
+            value_set=pa.array(list(label_to_cable_id), type=pa.string()),
+        )
+        cable_ids = pa.array(list(label_to_cable_id.values()), type=pa.int64()).take(position)
+
+        # FK uses DB column name with _id suffix
+        updated = terminations.set_column(
+            terminations.schema.get_field_index('cable_id'), 'cable_id', cable_ids
+        )
+        columns = [name for name in updated.column_names if name != '_label']
+        return updated.select(columns).filter(pc.is_valid(cable_ids))
 
     def summary(self) -> str:
         """Return topology summary string."""
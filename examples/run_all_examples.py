@@ -15,18 +15,216 @@ Usage:
 """
 
 import argparse
+import collections
+import importlib.util
 import os
+import re
+import signal
 import subprocess
 import sys
-import tempfile
+import threading
 import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
 
-# Add parent directory for imports
-sys.path.insert(0, str(Path(__file__).parent))
-
 from turbobulk_client import TurboBulkClient, TurboBulkError
-from common.parquet_utils import create_pk_parquet, read_parquet
+
+
+# (model, prefixed field) in deletion order: dependent objects first
+# Cables -> Interfaces -> Devices -> Sites, then prefixed roles/types/manufacturers
+CLEANUP_ORDER = [
+    ('dcim.cabletermination', 'cable__label'),  # Reference cables
+    ('dcim.cable', 'label'),
+    ('dcim.interface', 'device__name'),  # Reference devices
+    ('dcim.device', 'name'),  # Reference sites
+    ('dcim.site', 'name'),
+    ('dcim.site', 'slug'),
+    ('dcim.devicerole', 'slug'),
+    ('dcim.devicetype', 'slug'),
+    ('dcim.manufacturer', 'slug'),
+]
+
+
+# Lines of child output kept for the failure report
+OUTPUT_TAIL_LINES = 500
+
+# Objects created by ensure_prerequisites() when NetBox has none
+PREREQ_MANUFACTURER = {'name': ['Generic Corp'], 'slug': ['generic-corp']}
+PREREQ_DEVICE_TYPE = {'model': ['Generic Server'], 'slug': ['generic-server'], 'u_height': [1]}
+PREREQ_DEVICE_ROLE = {'name': ['Server'], 'slug': ['server'], 'color': ['ff0000']}
+PREREQ_SITE = {'name': ['Main DC'], 'slug': ['main-dc'], 'status': ['active']}
+
+# Seconds an example may run before it is stopped (override per example)
+DEFAULT_TIMEOUT = 120
+
+# Seconds a timed-out example gets to exit after SIGTERM before SIGKILL
+TERMINATE_GRACE = 2
+
+
+# Examples to run with their configurations; '{prefix}' in args and config
+# values is replaced with the run's base prefix
+# Format: (name, script, args, extra_config)
+# extra_config: dict with prefix, skip_pre_cleanup, skip_post_cleanup, uses_env_vars,
+# timeout (seconds, default DEFAULT_TIMEOUT)
+# 'prefix' scopes pre/post cleanup; examples sharing a prefix form a
+# chain that runs in order, and separate chains run concurrently
+EXAMPLES = (
+    # Example 01: Hello sites
+    ('01_hello_sites', '01_hello_turbobulk.py',
+     ['--prefix', '{prefix}-01', '--count', '5'],
+     {'prefix': '{prefix}-01'}),
+
+    # Example 02: Device inventory (include prefix in asset_tag to avoid conflicts)
+    ('02_device_inventory', '02_device_inventory.py',
+     ['--prefix', '{prefix}-02', '--count', '20'],
+     {'prefix': '{prefix}-02'}),
+
+    # Example 03: Export transform (works on existing sites, no prefix needed)
+    ('03_export_transform', '03_export_transform.py',
+     ['--filter-prefix', '{prefix}-01'],  # Filter to our test sites
+     {'prefix': '{prefix}-01'}),
+
+    # Example 04: Interface bulk (uses --device-prefix)
+    ('04_interface_bulk', '04_interface_bulk.py',
+     ['--device-prefix', '{prefix}-02', '--device-limit', '5', '--interfaces-per-device', '4'],
+     {'prefix': '{prefix}-02'}),
+
+    # Example 05: Cable connections (uses --device-prefix)
+    ('05_cable_connections', '05_cable_connections.py',
+     ['--device-prefix', '{prefix}-02', '--max-cables', '5'],
+     {'prefix': '{prefix}-02'}),
+
+    # Example 06: GPU datacenter - run as a sequence without intermediate cleanup
+    ('06_gpu_dc_setup', '06_gpu_datacenter_cabling.py',
+     ['--prefix', '{prefix}-gpu', 'setup', '--pods', '1', '--leaves-per-pod', '2',
+      '--gpu-servers-per-leaf', '2', '--nics-per-gpu-server', '2'],
+     {'prefix': '{prefix}-gpu', 'skip_post_cleanup': True, 'timeout': 600}),
+    ('06_gpu_dc_devices', '06_gpu_datacenter_cabling.py',
+     ['--prefix', '{prefix}-gpu', 'devices', '--pods', '1', '--leaves-per-pod', '2',
+      '--gpu-servers-per-leaf', '2', '--nics-per-gpu-server', '2'],
+     {'prefix': '{prefix}-gpu', 'skip_pre_cleanup': True, 'skip_post_cleanup': True, 'timeout': 600}),
+    ('06_gpu_dc_status', '06_gpu_datacenter_cabling.py',
+     ['--prefix', '{prefix}-gpu', 'status', '--pods', '1', '--leaves-per-pod', '2',
+      '--gpu-servers-per-leaf', '2', '--nics-per-gpu-server', '2'],
+     {'prefix': '{prefix}-gpu', 'skip_pre_cleanup': True, 'skip_post_cleanup': True, 'timeout': 600}),
+    ('06_gpu_dc_teardown', '06_gpu_datacenter_cabling.py',
+     ['--prefix', '{prefix}-gpu', 'teardown', '--pods', '1', '--leaves-per-pod', '2',
+      '--gpu-servers-per-leaf', '2', '--nics-per-gpu-server', '2'],
+     {'prefix': '{prefix}-gpu', 'skip_pre_cleanup': True, 'timeout': 600}),
+
+    # Example 07: Post hooks (uses env vars, not CLI args for url/token)
+    ('07_post_hooks', '07_post_hooks.py',
+     ['--prefix', '{prefix}-hooks'],
+     {'prefix': '{prefix}-hooks', 'uses_env_vars': True}),
+    ('07_post_hooks_cleanup', '07_post_hooks.py',
+     ['--prefix', '{prefix}-hooks', '--cleanup'],
+     {'prefix': '{prefix}-hooks', 'uses_env_vars': True, 'skip_pre_cleanup': True}),
+
+    # Example 08: NetBox Branching workflow (requires netbox-branching plugin)
+    # Skip the generic pre-cleanup as it doesn't apply to branching
+    # The branching example uses its own 'tb-branch' prefix internally
+    ('08_branching_workflow', '08_branching_workflow.py',
+     [],  # Uses env vars, cleanup handled internally
+     {'prefix': '{prefix}-08', 'uses_env_vars': True, 'skip_pre_cleanup': True, 'timeout': 600}),
+    ('08_branching_cleanup', '08_branching_workflow.py',
+     ['--cleanup'],
+     {'prefix': '{prefix}-08', 'uses_env_vars': True, 'skip_pre_cleanup': True, 'timeout': 600}),
+
+    # Example 09: Cached exports (exports existing data, no cleanup needed)
+    ('09_cached_exports', '09_cached_exports.py',
+     ['--model', 'dcim.site'],
+     {'prefix': '{prefix}-09', 'skip_pre_cleanup': True, 'skip_post_cleanup': True}),
+
+    # Example 10: Validation best practices (uses env vars)
+    ('10_validation', '10_validation_best_practices.py',
+     ['--prefix', '{prefix}-val'],
+     {'prefix': '{prefix}-val', 'uses_env_vars': True}),
+    ('10_validation_cleanup', '10_validation_best_practices.py',
+     ['--prefix', '{prefix}-val', '--cleanup'],
+     {'prefix': '{prefix}-val', 'uses_env_vars': True, 'skip_pre_cleanup': True}),
+
+    # Example 11: Event streams integration (uses env vars)
+    ('11_event_streams', '11_event_streams.py',
+     ['--prefix', '{prefix}-evt'],
+     {'prefix': '{prefix}-evt', 'uses_env_vars': True}),
+    ('11_event_streams_cleanup', '11_event_streams.py',
+     ['--prefix', '{prefix}-evt', '--cleanup'],
+     {'prefix': '{prefix}-evt', 'uses_env_vars': True, 'skip_pre_cleanup': True}),
+
+    # Example 12: Format comparison (uses env vars)
+    ('12_format_comparison', '12_format_comparison.py',
+     ['--prefix', '{prefix}-fmt', '--count', '100'],
+     {'prefix': '{prefix}-fmt', 'uses_env_vars': True}),
+)
+
+
+def terminate_process_group(process: subprocess.Popen):
+    """Stop a child started in its own process group, including any helpers it spawned."""
+    if os.name != 'posix':
+        process.kill()
+        process.wait()
+        return
+
+    try:
+        os.killpg(process.pid, signal.SIGTERM)
+        process.wait(timeout=TERMINATE_GRACE)
+    except (subprocess.TimeoutExpired, ProcessLookupError):
+        pass
+    # Whatever ignored SIGTERM (or outlived the child) is killed outright
+    try:
+        os.killpg(process.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+    process.wait()
+
+
+class InProcessOutput:
+    """
+    Stand-in for sys.stdout/sys.stderr while examples run in-process.
+
+    Text written by a thread that is running an example is split into lines,
+    tagged with the example name and kept in that example's output tail, the
+    same as a subprocess's piped output. Other threads write straight through.
+    """
+
+    _local = threading.local()
+
+    def __init__(self, stream, echo):
+        self.stream = stream  # Untagged writes
+        self.echo = echo  # Tagged example lines (the real stdout)
+
+    @classmethod
+    @contextmanager
+    def capture(cls, name: str, tail: collections.deque):
+        """Route the current thread's output to the given example."""
+        cls._local.target = (name, tail)
+        cls._local.partial = ''
+        try:
+            yield
+        finally:
+            if cls._local.partial:
+                sys.stdout.write('\n')  # Flush an unterminated last line
+            cls._local.target = None
+
+    def write(self, text: str) -> int:
+        target = getattr(self._local, 'target', None)
+        if target is None:
+            return self.stream.write(text)
+        name, tail = target
+        *lines, self._local.partial = (self._local.partial + text).split('\n')
+        for line in lines:
+            self.echo.write(f"  [{name}] {line}\n")
+            tail.append(line + '\n')
+        return len(text)
+
+    def flush(self):
+        self.stream.flush()
+        self.echo.flush()
+
+    def __getattr__(self, attr):
+        return getattr(self.stream, attr)
 
 
 def get_timestamp_prefix():
@@ -37,40 +235,39 @@ def get_timestamp_prefix():
 class ExampleRunner:
     """Runs TurboBulk examples with cleanup."""
 
-    def __init__(self, client: TurboBulkClient, base_prefix: str):
+    def __init__(self, client: TurboBulkClient, base_prefix: str, force_pre_cleanup: bool = False,
+                 in_process: bool = False):
         self.client = client
         self.base_prefix = base_prefix
+        # Call example main() functions in this interpreter instead of spawning Python
+        self.in_process = in_process
+        self.modules = {}
+        self.modules_lock = threading.Lock()
+        # Pre-clean prefixes this run has not used yet (e.g. a base prefix reused across runs)
+        self.force_pre_cleanup = force_pre_cleanup
         self.results = {}
+        # Prefixes an example has run under whose objects may still exist
+        self.uncleaned_prefixes = set()
+        # Child environment is the same for every example, so build it once
+        self.child_env = {
+            **os.environ,
+            'NETBOX_URL': client.base_url,
+            'NETBOX_TOKEN': client.token,
+        }
 
     def cleanup_model(self, model: str, name_filter: dict, verbose: bool = True):
         """Delete all objects matching a filter."""
         model_name = model.split('.')[-1]
 
-        # Export IDs
         try:
-            export_path = self.client.export(
-                model=model,
-                filters=name_filter,
-                fields=['id'],
-                output_path=Path(f'/tmp/cleanup_{model_name}.parquet'),
-                verbose=False,
-            )
-            data = read_parquet(export_path)
-            ids = data.get('id', [])
-
-            if not ids:
-                if verbose:
-                    print(f"    No {model_name} to delete")
-                return 0
-
-            # Delete
-            delete_path = Path(f'/tmp/cleanup_{model_name}_ids.parquet')
-            create_pk_parquet(ids, delete_path)
-            result = self.client.delete(model, delete_path, verbose=False)
-            deleted = result.get('data', {}).get('rows_deleted', len(ids))
+            result = self.client.delete_by_filter(model, name_filter, verbose=False)
+            deleted = result.get('data', {}).get('rows_deleted', 0)
 
             if verbose:
-                print(f"    Deleted {deleted} {model_name}")
+                if deleted:
+                    print(f"    Deleted {deleted} {model_name}")
+                else:
+                    print(f"    No {model_name} to delete")
             return deleted
 
         except Exception as e:
@@ -78,110 +275,170 @@ class ExampleRunner:
                 print(f"    Error cleaning {model_name}: {e}")
             return 0
 
-    def cleanup_by_prefix(self, prefix: str, verbose: bool = True):
-        """Clean up all objects with a given prefix."""
-        if verbose:
-            print(f"  Cleaning up prefix '{prefix}'...")
-
-        # Order matters: delete dependent objects first
-        # Cables -> Interfaces -> Devices -> Sites
+    def cleanup_prefixes(self, prefixes: list, verbose: bool = True):
+        """
+        Clean up all objects whose name starts with any of the given prefixes.
 
-        # 1. Cable terminations (reference cables)
-        self.cleanup_model('dcim.cabletermination', {'cable__label__startswith': prefix}, verbose)
-
-        # 2. Cables
-        self.cleanup_model('dcim.cable', {'label__startswith': prefix}, verbose)
-
-        # 3. Interfaces (reference devices)
-        self.cleanup_model('dcim.interface', {'device__name__startswith': prefix}, verbose)
-
-        # 4. Devices (reference sites)
-        self.cleanup_model('dcim.device', {'name__startswith': prefix}, verbose)
-
-        # 5. Sites
-        self.cleanup_model('dcim.site', {'name__startswith': prefix}, verbose)
-        self.cleanup_model('dcim.site', {'slug__startswith': prefix}, verbose)
+        Each model is exported and deleted once for all prefixes together,
+        using a single regex filter, instead of once per prefix.
+        """
+        if verbose:
+            print(f"  Cleaning up prefixes {', '.join(repr(p) for p in prefixes)}...")
 
-        # 6. Device roles (if prefixed)
-        self.cleanup_model('dcim.devicerole', {'slug__startswith': prefix}, verbose)
+        if len(prefixes) == 1:
+            lookup, value = 'startswith', prefixes[0]
+        else:
+            lookup, value = 'regex', '^(' + '|'.join(re.escape(p) for p in prefixes) + ')'
 
-        # 7. Device types (if prefixed)
-        self.cleanup_model('dcim.devicetype', {'slug__startswith': prefix}, verbose)
+        for model, field in CLEANUP_ORDER:
+            self.cleanup_model(model, {f'{field}__{lookup}': value}, verbose)
 
-        # 8. Manufacturers (if prefixed)
-        self.cleanup_model('dcim.manufacturer', {'slug__startswith': prefix}, verbose)
+    def cleanup_by_prefix(self, prefix: str, verbose: bool = True):
+        """Clean up all objects with a given prefix."""
+        self.cleanup_prefixes([prefix], verbose)
 
     def run_example(self, name: str, script: str, args: list, prefix: str = None,
                     skip_pre_cleanup: bool = False, skip_post_cleanup: bool = False,
-                    uses_env_vars: bool = False):
+                    uses_env_vars: bool = False, timeout: int = DEFAULT_TIMEOUT):
         """Run a single example and record the result."""
-        print(f"\n{'='*60}")
-        print(f"EXAMPLE: {name}")
-        print(f"{'='*60}")
+        # Chains run concurrently, so every status line below carries [name]
+        # and the banner goes out in one print to keep it together
+        print(f"\n{'='*60}\nEXAMPLE: {name}\n{'='*60}")
 
         # Use provided prefix or generate one
         example_prefix = prefix or f"{self.base_prefix}-{name[:3]}"
-
-        # Pre-cleanup (unless skipped)
-        if not skip_pre_cleanup:
-            print(f"\n  Pre-cleanup for prefix '{example_prefix}'...")
+        # A prefix this run has never used, or whose last example cleaned up
+        # after itself, has nothing to pre-clean
+        needs_pre_cleanup = self.force_pre_cleanup or example_prefix in self.uncleaned_prefixes
+        self.uncleaned_prefixes.add(example_prefix)
+
+        # Pre-cleanup (unless skipped or known clean)
+        if not skip_pre_cleanup and needs_pre_cleanup:
+            print(f"\n  [{name}] Pre-cleanup for prefix '{example_prefix}'...")
             self.cleanup_by_prefix(example_prefix, verbose=False)
 
-        # Build command with environment variables
-        env = os.environ.copy()
-        env['NETBOX_URL'] = self.client.base_url
-        env['NETBOX_TOKEN'] = self.client.token
-
-        # Build command
-        cmd = [sys.executable, script]
-
         # Add URL/token only if script accepts them (not uses_env_vars)
+        argv = list(args)
         if not uses_env_vars:
-            cmd.extend(['--url', self.client.base_url, '--token', self.client.token])
+            argv = ['--url', self.client.base_url, '--token', self.client.token] + argv
 
-        cmd.extend(args)
+        print(f"\n  [{name}] Running: {Path(script).name} {' '.join(args)}\n"
+              f"  [{name}] Prefix: {example_prefix}\n" + "-" * 40)
 
-        print(f"\n  Running: {Path(script).name} {' '.join(args)}")
-        print(f"  Prefix: {example_prefix}")
-        print("-" * 40)
+        # Stream output as it arrives, tagged with the example name since
+        # chains run concurrently; only a bounded tail is kept for the report
+        tail = collections.deque(maxlen=OUTPUT_TAIL_LINES)
 
         start_time = time.time()
         try:
-            result = subprocess.run(
-                cmd,
-                cwd=Path(__file__).parent,
-                capture_output=True,
-                text=True,
-                timeout=120,  # 2 minute timeout
-                env=env,
-            )
+            if self.in_process:
+                returncode = self.run_in_process(name, script, argv, tail, timeout)
+            else:
+                returncode = self.run_subprocess(name, script, argv, tail, timeout)
             duration = time.time() - start_time
 
-            if result.returncode == 0:
-                print(result.stdout)
-                self.results[name] = {'status': 'PASS', 'duration': duration}
-                print(f"\n  Result: PASS ({duration:.1f}s)")
+            if returncode == 0:
+                self.results[name] = {'status': 'PASS', 'duration': duration, 'timeout': timeout}
+                print(f"\n  [{name}] Result: PASS ({duration:.1f}s)")
             else:
-                print(result.stdout)
-                print(result.stderr, file=sys.stderr)
-                self.results[name] = {'status': 'FAIL', 'duration': duration, 'error': result.stderr}
-                print(f"\n  Result: FAIL ({duration:.1f}s)")
+                self.results[name] = {
+                    'status': 'FAIL', 'duration': duration, 'timeout': timeout, 'error': ''.join(tail),
+                }
+                print(f"\n  [{name}] Result: FAIL ({duration:.1f}s)")
 
         except subprocess.TimeoutExpired:
-            self.results[name] = {'status': 'TIMEOUT', 'duration': 120}
-            print(f"\n  Result: TIMEOUT (>120s)")
+            self.results[name] = {
+                'status': 'TIMEOUT', 'duration': timeout, 'timeout': timeout, 'error': ''.join(tail),
+            }
+            print(f"\n  [{name}] Result: TIMEOUT (>{timeout}s)")
         except Exception as e:
             duration = time.time() - start_time
             self.results[name] = {'status': 'ERROR', 'duration': duration, 'error': str(e)}
-            print(f"\n  Result: ERROR - {e}")
+            print(f"\n  [{name}] Result: ERROR - {e}")
 
         # Post-cleanup (unless skipped)
         if not skip_post_cleanup:
-            print(f"\n  Post-cleanup...")
+            print(f"\n  [{name}] Post-cleanup...")
             self.cleanup_by_prefix(example_prefix, verbose=False)
+            self.uncleaned_prefixes.discard(example_prefix)
 
         return self.results[name]['status'] == 'PASS'
 
+    def run_subprocess(self, name: str, script: str, argv: list, tail: collections.deque,
+                       timeout: int) -> int:
+        """Run an example script in a fresh interpreter and return its exit code."""
+        def relay(stream):
+            for line in stream:
+                print(f"  [{name}] {line}", end='')
+                tail.append(line)
+
+        process = subprocess.Popen(
+            [sys.executable, script] + argv,
+            cwd=Path(__file__).parent,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+            env=self.child_env,
+            # Own process group, so a timeout also stops helpers the example spawned
+            start_new_session=os.name == 'posix',
+            creationflags=getattr(subprocess, 'CREATE_NEW_PROCESS_GROUP', 0),
+        )
+        reader = threading.Thread(target=relay, args=(process.stdout,), daemon=True)
+        reader.start()
+        try:
+            return process.wait(timeout=timeout)
+        finally:
+            if process.poll() is None:
+                terminate_process_group(process)
+            reader.join()
+            process.stdout.close()
+
+    def load_example(self, script: str):
+        """Import an example script once and return the module."""
+        with self.modules_lock:
+            if script not in self.modules:
+                path = Path(__file__).parent / script
+                spec = importlib.util.spec_from_file_location(f"example_{path.stem}", path)
+                module = importlib.util.module_from_spec(spec)
+                spec.loader.exec_module(module)
+                self.modules[script] = module
+            return self.modules[script]
+
+    def run_in_process(self, name: str, script: str, argv: list, tail: collections.deque,
+                       timeout: int) -> int:
+        """
+        Call an example's main(argv) in this interpreter and return its exit code.
+
+        Requires sys.stdout/sys.stderr to be InProcessOutput. The example runs
+        on its own thread so the timeout can be enforced, but a thread cannot
+        be killed: a timed-out example keeps running in the background.
+        """
+        module = self.load_example(script)
+        outcome = {}
+
+        def target():
+            with InProcessOutput.capture(name, tail):
+                try:
+                    result = module.main(argv)
+                    outcome['code'] = result if isinstance(result, int) else 0
+                except SystemExit as e:
+                    if e.code is None or isinstance(e.code, int):
+                        outcome['code'] = e.code or 0
+                    else:
+                        print(e.code, file=sys.stderr)
+                        outcome['code'] = 1
+                except BaseException:
+                    traceback.print_exc()
+                    outcome['code'] = 1
+
+        worker = threading.Thread(target=target, name=f"example-{name}", daemon=True)
+        worker.start()
+        worker.join(timeout)
+        if worker.is_alive():
+            raise subprocess.TimeoutExpired(script, timeout)
+        return outcome['code']
+
     def print_summary(self):
         """Print summary of all results."""
         print(f"\n{'='*60}")
@@ -207,72 +464,57 @@ def ensure_prerequisites(client: TurboBulkClient):
 
     print("Checking and creating prerequisites...")
 
-    # Check for manufacturer
-    mfrs = client.rest_get('/api/dcim/manufacturers/', {'limit': 1})
-    if not mfrs.get('results'):
-        print("  Creating manufacturer...")
-        data = {
-            'name': ['Generic Corp'],
-            'slug': ['generic-corp'],
-        }
-        path = Path('/tmp/prereq_mfr.parquet')
+    # The existence checks are independent, so issue them concurrently
+    check_paths = [
+        '/api/dcim/manufacturers/',
+        '/api/dcim/device-types/',
+        '/api/dcim/device-roles/',
+        '/api/dcim/sites/',
+    ]
+    with ThreadPoolExecutor(max_workers=len(check_paths)) as pool:
+        mfrs, dt, roles, sites = pool.map(
+            lambda path: client.rest_get(path, {'limit': 1}), check_paths
+        )
+
+    for label, existing in (
+        ('Manufacturers', mfrs), ('Device types', dt), ('Device roles', roles), ('Sites', sites),
+    ):
+        if existing.get('results'):
+            print(f"  {label}: OK ({existing.get('count', 1)})")
+
+    def create(model: str, data: dict, filename: str, label: str):
+        path = Path('/tmp') / filename
         create_parquet(data, path)
-        client.load('dcim.manufacturer', path, verbose=False)
-        print("    Created: Generic Corp")
-    else:
-        print(f"  Manufacturers: OK ({mfrs.get('count', 1)})")
-
-    # Check for device types
-    dt = client.rest_get('/api/dcim/device-types/', {'limit': 1})
-    if not dt.get('results'):
-        print("  Creating device type...")
-        # Get first manufacturer ID
-        mfrs = client.rest_get('/api/dcim/manufacturers/', {'limit': 1})
-        mfr_id = mfrs['results'][0]['id'] if mfrs.get('results') else 1
-        data = {
-            'manufacturer_id': [mfr_id],  # Use _id suffix with actual ID
-            'model': ['Generic Server'],
-            'slug': ['generic-server'],
-            'u_height': [1],
-        }
-        path = Path('/tmp/prereq_dt.parquet')
-        create_parquet(data, path)
-        client.load('dcim.devicetype', path, verbose=False)
-        print("    Created: Generic Server")
-    else:
-        print(f"  Device types: OK ({dt.get('count', 1)})")
-
-    # Check for device roles
-    roles = client.rest_get('/api/dcim/device-roles/', {'limit': 1})
+        client.load(model, path, verbose=False)
+        print(f"    Created: {label}")
+
+    def create_manufacturer_and_device_type():
+        # Device types reference a manufacturer, so these two load in order
+        manufacturers = mfrs
+        if not manufacturers.get('results'):
+            create('dcim.manufacturer', PREREQ_MANUFACTURER, 'prereq_mfr.parquet', 'Generic Corp')
+        if not dt.get('results'):
+            # Get first manufacturer ID (only re-fetch if it was just created)
+            if not manufacturers.get('results'):
+                manufacturers = client.rest_get('/api/dcim/manufacturers/', {'limit': 1})
+            mfr_id = manufacturers['results'][0]['id'] if manufacturers.get('results') else 1
+            data = {'manufacturer_id': [mfr_id], **PREREQ_DEVICE_TYPE}  # Use _id suffix with actual ID
+            create('dcim.devicetype', data, 'prereq_dt.parquet', 'Generic Server')
+
+    # Roles and sites are independent of the manufacturer chain, so load concurrently
+    tasks = []
+    if not (mfrs.get('results') and dt.get('results')):
+        tasks.append(create_manufacturer_and_device_type)
     if not roles.get('results'):
-        print("  Creating device role...")
-        data = {
-            'name': ['Server'],
-            'slug': ['server'],
-            'color': ['ff0000'],
-        }
-        path = Path('/tmp/prereq_role.parquet')
-        create_parquet(data, path)
-        client.load('dcim.devicerole', path, verbose=False)
-        print("    Created: Server")
-    else:
-        print(f"  Device roles: OK ({roles.get('count', 1)})")
-
-    # Check for at least one site
-    sites = client.rest_get('/api/dcim/sites/', {'limit': 1})
+        tasks.append(lambda: create('dcim.devicerole', PREREQ_DEVICE_ROLE, 'prereq_role.parquet', 'Server'))
     if not sites.get('results'):
-        print("  Creating site...")
-        data = {
-            'name': ['Main DC'],
-            'slug': ['main-dc'],
-            'status': ['active'],
-        }
-        path = Path('/tmp/prereq_site.parquet')
-        create_parquet(data, path)
-        client.load('dcim.site', path, verbose=False)
-        print("    Created: Main DC")
-    else:
-        print(f"  Sites: OK ({sites.get('count', 1)})")
+        tasks.append(lambda: create('dcim.site', PREREQ_SITE, 'prereq_site.parquet', 'Main DC'))
+
+    if tasks:
+        print(f"  Creating {len(tasks)} missing prerequisite group(s)...")
+        with ThreadPoolExecutor(max_workers=len(tasks)) as pool:
+            for future in [pool.submit(task) for task in tasks]:
+                future.result()
 
 
 def main():
@@ -283,10 +525,28 @@ def main():
     )
     parser.add_argument('--url', help='NetBox URL (or set NETBOX_URL env var)')
     parser.add_argument('--token', help='API token (or set NETBOX_TOKEN env var)')
-    parser.add_argument('--skip', nargs='*', default=[], help='Examples to skip (e.g., 06)')
-    parser.add_argument('--only', nargs='*', default=[], help='Only run these examples')
+    parser.add_argument('--skip', nargs='*', default=[],
+                        help='Examples to skip, as name substrings or regexes (e.g., 06 ^08_)')
+    parser.add_argument('--only', nargs='*', default=[],
+                        help='Only run these examples, as name substrings or regexes')
+    parser.add_argument('--jobs', type=int, default=0,
+                        help='Example chains to run at once (default: all; 1 runs sequentially)')
+    parser.add_argument('--force-cleanup', action='store_true',
+                        help='Pre-clean every example prefix, even ones not used yet in this run')
+    parser.add_argument('--in-process', action='store_true',
+                        help='Call example main() functions in this interpreter instead of '
+                             'starting Python per example (faster; timed-out examples cannot '
+                             'be stopped)')
     args = parser.parse_args()
 
+    # Each filter is a regex searched in the example name; all of them are
+    # combined into one pattern per option
+    try:
+        only_re = re.compile('|'.join(f'(?:{o})' for o in args.only)) if args.only else None
+        skip_re = re.compile('|'.join(f'(?:{sk})' for sk in args.skip)) if args.skip else None
+    except re.error as e:
+        parser.error(f"invalid --only/--skip pattern: {e}")
+
     try:
         client = TurboBulkClient(base_url=args.url, token=args.token)
         print(f"Connected to: {client.base_url}")
@@ -296,131 +556,70 @@ def main():
 
         # Create runner with unique prefix
         prefix = get_timestamp_prefix()
-        runner = ExampleRunner(client, prefix)
+        runner = ExampleRunner(
+            client, prefix, force_pre_cleanup=args.force_cleanup, in_process=args.in_process
+        )
+        if args.in_process:
+            # Examples that read their connection from the environment see the runner's
+            os.environ.update(NETBOX_URL=client.base_url, NETBOX_TOKEN=client.token)
+            sys.stdout = InProcessOutput(sys.stdout, echo=sys.stdout)
+            sys.stderr = InProcessOutput(sys.stderr, echo=sys.stdout.stream)
 
         print(f"\nUsing base prefix: {prefix}")
 
-        # Define examples to run with their configurations
-        # Format: (name, script, args, extra_config)
-        # extra_config: dict with skip_pre_cleanup, skip_post_cleanup, uses_env_vars, prefix_arg
+        # Substitute the run's base prefix into the example templates
         examples = [
-            # Example 01: Hello sites
-            ('01_hello_sites', '01_hello_turbobulk.py',
-             ['--prefix', f'{prefix}-01', '--count', '5'], {}),
-
-            # Example 02: Device inventory (include prefix in asset_tag to avoid conflicts)
-            ('02_device_inventory', '02_device_inventory.py',
-             ['--prefix', f'{prefix}-02', '--count', '20'], {}),
-
-            # Example 03: Export transform (works on existing sites, no prefix needed)
-            ('03_export_transform', '03_export_transform.py',
-             ['--filter-prefix', f'{prefix}-01'], {}),  # Filter to our test sites
-
-            # Example 04: Interface bulk (uses --device-prefix)
-            ('04_interface_bulk', '04_interface_bulk.py',
-             ['--device-prefix', f'{prefix}-02', '--device-limit', '5', '--interfaces-per-device', '4'], {}),
-
-            # Example 05: Cable connections (uses --device-prefix)
-            ('05_cable_connections', '05_cable_connections.py',
-             ['--device-prefix', f'{prefix}-02', '--max-cables', '5'], {}),
-
-            # Example 06: GPU datacenter - run as a sequence without intermediate cleanup
-            ('06_gpu_dc_setup', '06_gpu_datacenter_cabling.py',
-             ['--prefix', f'{prefix}-gpu', 'setup', '--pods', '1', '--leaves-per-pod', '2',
-              '--gpu-servers-per-leaf', '2', '--nics-per-gpu-server', '2'],
-             {'skip_post_cleanup': True}),
-            ('06_gpu_dc_devices', '06_gpu_datacenter_cabling.py',
-             ['--prefix', f'{prefix}-gpu', 'devices', '--pods', '1', '--leaves-per-pod', '2',
-              '--gpu-servers-per-leaf', '2', '--nics-per-gpu-server', '2'],
-             {'skip_pre_cleanup': True, 'skip_post_cleanup': True}),
-            ('06_gpu_dc_status', '06_gpu_datacenter_cabling.py',
-             ['--prefix', f'{prefix}-gpu', 'status', '--pods', '1', '--leaves-per-pod', '2',
-              '--gpu-servers-per-leaf', '2', '--nics-per-gpu-server', '2'],
-             {'skip_pre_cleanup': True, 'skip_post_cleanup': True}),
-            ('06_gpu_dc_teardown', '06_gpu_datacenter_cabling.py',
-             ['--prefix', f'{prefix}-gpu', 'teardown', '--pods', '1', '--leaves-per-pod', '2',
-              '--gpu-servers-per-leaf', '2', '--nics-per-gpu-server', '2'],
-             {'skip_pre_cleanup': True}),
-
-            # Example 07: Post hooks (uses env vars, not CLI args for url/token)
-            ('07_post_hooks', '07_post_hooks.py',
-             ['--prefix', f'{prefix}-hooks'],
-             {'uses_env_vars': True}),
-            ('07_post_hooks_cleanup', '07_post_hooks.py',
-             ['--prefix', f'{prefix}-hooks', '--cleanup'],
-             {'uses_env_vars': True, 'skip_pre_cleanup': True}),
-
-            # Example 08: NetBox Branching workflow (requires netbox-branching plugin)
-            # Skip the generic pre-cleanup as it doesn't apply to branching
-            # The branching example uses its own 'tb-branch' prefix internally
-            ('08_branching_workflow', '08_branching_workflow.py',
-             [],  # Uses env vars, cleanup handled internally
-             {'uses_env_vars': True, 'skip_pre_cleanup': True}),
-            ('08_branching_cleanup', '08_branching_workflow.py',
-             ['--cleanup'],
-             {'uses_env_vars': True, 'skip_pre_cleanup': True}),
-
-            # Example 09: Cached exports (exports existing data, no cleanup needed)
-            ('09_cached_exports', '09_cached_exports.py',
-             ['--model', 'dcim.site'],
-             {'skip_pre_cleanup': True, 'skip_post_cleanup': True}),
-
-            # Example 10: Validation best practices (uses env vars)
-            ('10_validation', '10_validation_best_practices.py',
-             ['--prefix', f'{prefix}-val'],
-             {'uses_env_vars': True}),
-            ('10_validation_cleanup', '10_validation_best_practices.py',
-             ['--prefix', f'{prefix}-val', '--cleanup'],
-             {'uses_env_vars': True, 'skip_pre_cleanup': True}),
-
-            # Example 11: Event streams integration (uses env vars)
-            ('11_event_streams', '11_event_streams.py',
-             ['--prefix', f'{prefix}-evt'],
-             {'uses_env_vars': True}),
-            ('11_event_streams_cleanup', '11_event_streams.py',
-             ['--prefix', f'{prefix}-evt', '--cleanup'],
-             {'uses_env_vars': True, 'skip_pre_cleanup': True}),
-
-            # Example 12: Format comparison (uses env vars)
-            ('12_format_comparison', '12_format_comparison.py',
-             ['--prefix', f'{prefix}-fmt', '--count', '100'],
-             {'uses_env_vars': True}),
+            (name, script, [arg.format(prefix=prefix) for arg in example_args],
+             {key: value.format(prefix=prefix) if isinstance(value, str) else value
+              for key, value in config.items()})
+            for name, script, example_args, config in EXAMPLES
         ]
 
         # Filter examples based on --skip and --only
-        if args.only:
-            examples = [(n, s, a, c) for n, s, a, c in examples if any(o in n for o in args.only)]
-        if args.skip:
-            examples = [(n, s, a, c) for n, s, a, c in examples if not any(sk in n for sk in args.skip)]
+        examples = [
+            example for example in examples
+            if (only_re is None or only_re.search(example[0]))
+            and (skip_re is None or not skip_re.search(example[0]))
+        ]
 
         if not examples:
             print("No examples to run!")
             return 1
 
-        print(f"\nRunning {len(examples)} example(s)...")
-
-        # Run each example
-        for name, script, example_args, config in examples:
-            runner.run_example(
-                name, script, example_args,
-                prefix=prefix,
-                skip_pre_cleanup=config.get('skip_pre_cleanup', False),
-                skip_post_cleanup=config.get('skip_post_cleanup', False),
-                uses_env_vars=config.get('uses_env_vars', False),
-            )
-
-        # Print summary
+        # Group into chains by cleanup prefix, keeping the listed order
+        chains = {}
+        for example in examples:
+            chains.setdefault(example[3].get('prefix', prefix), []).append(example)
+
+        jobs = args.jobs or min(len(chains), (os.cpu_count() or 1) * 2)
+        print(f"\nRunning {len(examples)} example(s) in {len(chains)} chain(s), {jobs} at a time...")
+
+        def run_chain(chain):
+            for name, script, example_args, config in chain:
+                runner.run_example(
+                    name, script, example_args,
+                    prefix=config.get('prefix', prefix),
+                    skip_pre_cleanup=config.get('skip_pre_cleanup', False),
+                    skip_post_cleanup=config.get('skip_post_cleanup', False),
+                    uses_env_vars=config.get('uses_env_vars', False),
+                    timeout=config.get('timeout', DEFAULT_TIMEOUT),
+                )
+
+        # Examples run as subprocesses, so threads are enough to overlap them
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            for future in [pool.submit(run_chain, chain) for chain in chains.values()]:
+                future.result()
+
+        # Print summary in example order rather than completion order
+        runner.results = {
+            name: runner.results[name] for name, _, _, _ in examples if name in runner.results
+        }
         success = runner.print_summary()
 
-        # Final cleanup
-        print(f"\nFinal cleanup...")
-        runner.cleanup_by_prefix(f"{prefix}-01", verbose=True)
-        runner.cleanup_by_prefix(f"{prefix}-02", verbose=True)
-        runner.cleanup_by_prefix(f"{prefix}-gpu", verbose=True)
-        runner.cleanup_by_prefix(f"{prefix}-hooks", verbose=True)
-        runner.cleanup_by_prefix(f"{prefix}-val", verbose=True)
-        runner.cleanup_by_prefix(f"{prefix}-evt", verbose=True)
-        runner.cleanup_by_prefix(f"{prefix}-fmt", verbose=True)
+        # Final cleanup, only for chains whose last example skipped post-cleanup
+        if runner.uncleaned_prefixes:
+            print(f"\nFinal cleanup...")
+            runner.cleanup_prefixes(sorted(runner.uncleaned_prefixes), verbose=True)
 
         return 0 if success else 1
 
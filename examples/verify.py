@@ -18,13 +18,28 @@ Usage:
 import argparse
 import sys
 import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-
-# Add parent directory to path for common imports
-sys.path.insert(0, str(Path(__file__).parent))
+from typing import Callable, Optional
 
 from turbobulk_client import TurboBulkClient, TurboBulkError, JobFailedError
 
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:  # Optional: dry-run and test-data checks are skipped without it
+    HAS_PYARROW = False
+
+if HAS_PYARROW:
+    # Schema of the test sites file, built once per process
+    _SITE_SCHEMA = pa.schema([
+        ('name', pa.string()),
+        ('slug', pa.string()),
+        ('status', pa.string()),
+    ])
+
 
 def check_mark(passed: bool) -> str:
     """Return a check mark or X."""
@@ -43,152 +58,132 @@ def verify_connection(client: TurboBulkClient) -> bool:
         return False
 
 
-def verify_model_schema(client: TurboBulkClient) -> bool:
+def verify_model_schema(client: TurboBulkClient, emit: Callable[[str], None] = print) -> bool:
     """Verify model schema endpoint works."""
     try:
         schema = client.get_model_schema('dcim.site')
         field_count = len(schema.get('fields', []))
-        print(f"  {check_mark(True)} Schema introspection works ({field_count} fields in dcim.site)")
+        emit(f"  {check_mark(True)} Schema introspection works ({field_count} fields in dcim.site)")
         return True
     except Exception as e:
-        print(f"  {check_mark(False)} Schema introspection failed: {e}")
+        emit(f"  {check_mark(False)} Schema introspection failed: {e}")
         return False
 
 
-def verify_template_generation(client: TurboBulkClient) -> bool:
+def verify_template_generation(client: TurboBulkClient, emit: Callable[[str], None] = print) -> bool:
     """Verify template generation works."""
     try:
         template = client.get_template('dcim.site')
         if 'name' in template and 'slug' in template:
-            print(f"  {check_mark(True)} Template generation works (fields: {list(template.keys())[:5]}...)")
+            emit(f"  {check_mark(True)} Template generation works (fields: {list(template.keys())[:5]}...)")
             return True
         else:
-            print(f"  {check_mark(False)} Template missing required fields")
+            emit(f"  {check_mark(False)} Template missing required fields")
             return False
     except Exception as e:
-        print(f"  {check_mark(False)} Template generation failed: {e}")
+        emit(f"  {check_mark(False)} Template generation failed: {e}")
         return False
 
 
-def verify_dry_run(client: TurboBulkClient) -> bool:
+def write_small_parquet(table, path: Path) -> None:
+    """Write a few-row table without compression or dictionary pages (nothing to gain)."""
+    pq.write_table(table, path, compression='none', use_dictionary=False)
+
+
+def write_test_sites(prefix: str) -> Optional[Path]:
+    """
+    Write three test sites to a temporary Parquet file.
+
+    The same file is validated by the dry-run check and loaded by the
+    test-data check, which then reuses the path for the delete IDs.
+    Returns None if pyarrow is not installed.
+    """
+    if not HAS_PYARROW:
+        return None
+
+    names = [f'{prefix}-1', f'{prefix}-2', f'{prefix}-3']
+    table = pa.table({'name': names, 'slug': names, 'status': ['active'] * 3}, schema=_SITE_SCHEMA)
+
+    with tempfile.NamedTemporaryFile(suffix='.parquet', delete=False) as f:
+        path = Path(f.name)
+    write_small_parquet(table, path)
+    return path
+
+
+def verify_dry_run(
+    client: TurboBulkClient,
+    sites_path: Optional[Path],
+    emit: Callable[[str], None] = print,
+) -> bool:
     """Verify dry-run validation works (requires pyarrow)."""
-    try:
-        import pyarrow as pa
-        import pyarrow.parquet as pq
-    except ImportError:
-        print(f"  [SKIP] Dry-run test skipped (pyarrow not installed)")
+    if sites_path is None:
+        emit(f"  [SKIP] Dry-run test skipped (pyarrow not installed)")
         return True
 
     try:
-        # Create a minimal test Parquet file
-        schema = pa.schema([
-            ('name', pa.string()),
-            ('slug', pa.string()),
-            ('status', pa.string()),
-        ])
-        data = {
-            'name': ['verify-test-site'],
-            'slug': ['verify-test-site'],
-            'status': ['active'],
-        }
-        table = pa.table(data, schema=schema)
-
-        with tempfile.NamedTemporaryFile(suffix='.parquet', delete=False) as f:
-            pq.write_table(table, f.name)
-            temp_path = Path(f.name)
-
-        try:
-            result = client.validate('dcim.site', temp_path, verbose=False)
-            job_data = result.get('data', {})
-
-            if job_data.get('valid', False) or job_data.get('dry_run', False):
-                print(f"  {check_mark(True)} Dry-run validation works")
+        result = client.validate('dcim.site', sites_path, verbose=False)
+        job_data = result.get('data', {})
+
+        if job_data.get('valid', False) or job_data.get('dry_run', False):
+            emit(f"  {check_mark(True)} Dry-run validation works")
+            return True
+        else:
+            # Check if it failed due to validation (expected for some schemas)
+            errors = job_data.get('errors', [])
+            if errors:
+                emit(f"  {check_mark(True)} Dry-run validation works (found {len(errors)} validation errors as expected)")
                 return True
-            else:
-                # Check if it failed due to validation (expected for some schemas)
-                errors = job_data.get('errors', [])
-                if errors:
-                    print(f"  {check_mark(True)} Dry-run validation works (found {len(errors)} validation errors as expected)")
-                    return True
-                print(f"  {check_mark(False)} Dry-run returned unexpected result: {result}")
-                return False
-        finally:
-            temp_path.unlink(missing_ok=True)
+            emit(f"  {check_mark(False)} Dry-run returned unexpected result: {result}")
+            return False
 
     except Exception as e:
-        print(f"  {check_mark(False)} Dry-run validation failed: {e}")
+        emit(f"  {check_mark(False)} Dry-run validation failed: {e}")
         return False
 
 
-def verify_test_data(client: TurboBulkClient) -> bool:
-    """Create, verify, and delete test data."""
-    try:
-        import pyarrow as pa
-        import pyarrow.parquet as pq
-    except ImportError:
+def verify_test_data(client: TurboBulkClient, sites_path: Optional[Path], prefix: str) -> bool:
+    """Create, verify, and delete the test sites written by write_test_sites()."""
+    if sites_path is None:
         print(f"  [SKIP] Test data skipped (pyarrow not installed)")
         return True
 
-    import time
-    prefix = f"tb-verify-{int(time.time())}"
-
     try:
-        # Create test sites
-        schema = pa.schema([
-            ('name', pa.string()),
-            ('slug', pa.string()),
-            ('status', pa.string()),
-        ])
-        data = {
-            'name': [f'{prefix}-1', f'{prefix}-2', f'{prefix}-3'],
-            'slug': [f'{prefix}-1', f'{prefix}-2', f'{prefix}-3'],
-            'status': ['active', 'active', 'active'],
-        }
-        table = pa.table(data, schema=schema)
-
-        with tempfile.NamedTemporaryFile(suffix='.parquet', delete=False) as f:
-            pq.write_table(table, f.name)
-            insert_path = Path(f.name)
-
-        try:
-            # Insert
-            result = client.load('dcim.site', insert_path, verbose=False)
-            inserted = result.get('data', {}).get('rows_inserted', 0)
-            if inserted != 3:
-                print(f"  {check_mark(False)} Insert failed: expected 3 rows, got {inserted}")
-                return False
-            print(f"  {check_mark(True)} Inserted 3 test sites")
-
-            # Get the IDs to delete
-            sites = client.rest_get('/api/dcim/sites/', {'name__startswith': prefix})
-            site_ids = [s['id'] for s in sites.get('results', [])]
-
-            if len(site_ids) != 3:
-                print(f"  {check_mark(False)} Verification failed: expected 3 sites, found {len(site_ids)}")
-                return False
-
-            # Delete
-            del_schema = pa.schema([('id', pa.int64())])
-            del_data = {'id': site_ids}
-            del_table = pa.table(del_data, schema=del_schema)
-
-            with tempfile.NamedTemporaryFile(suffix='.parquet', delete=False) as f:
-                pq.write_table(del_table, f.name)
-                delete_path = Path(f.name)
-
-            try:
-                result = client.delete('dcim.site', delete_path, verbose=False)
-                deleted = result.get('data', {}).get('rows_deleted', 0)
-                if deleted != 3:
-                    print(f"  {check_mark(False)} Delete failed: expected 3 rows, got {deleted}")
-                    return False
-                print(f"  {check_mark(True)} Deleted 3 test sites")
-                return True
-            finally:
-                delete_path.unlink(missing_ok=True)
+        # Insert
+        result = client.load('dcim.site', sites_path, verbose=False)
+        inserted = result.get('data', {}).get('rows_inserted', 0)
+        if inserted != 3:
+            print(f"  {check_mark(False)} Insert failed: expected 3 rows, got {inserted}")
+            return False
+        print(f"  {check_mark(True)} Inserted 3 test sites")
+
+        # Export just the IDs; the sites file has been loaded, so reuse its path.
+        # The id-only export is a valid delete file as-is.
+        export_result = client.export(
+            model='dcim.site',
+            filters={'name__startswith': prefix},
+            fields=['id'],
+            include_custom_fields=False,
+            include_tags=False,
+            format='parquet',
+            output_path=sites_path,
+            force_refresh=True,
+            verbose=False,
+        )
+        ids_path = Path(export_result['path'])
+        found = pq.read_metadata(ids_path).num_rows
+
+        if found != 3:
+            print(f"  {check_mark(False)} Verification failed: expected 3 sites, found {found}")
+            return False
 
-        finally:
-            insert_path.unlink(missing_ok=True)
+        # Delete
+        result = client.delete('dcim.site', ids_path, verbose=False)
+        deleted = result.get('data', {}).get('rows_deleted', 0)
+        if deleted != 3:
+            print(f"  {check_mark(False)} Delete failed: expected 3 rows, got {deleted}")
+            return False
+        print(f"  {check_mark(True)} Deleted 3 test sites")
+        return True
 
     except Exception as e:
         print(f"  {check_mark(False)} Test data verification failed: {e}")
@@ -222,18 +217,35 @@ def main():
     print("1. API Connection")
     results.append(verify_connection(client))
 
-    print("\n2. Model Schema")
-    results.append(verify_model_schema(client))
-
-    print("\n3. Template Generation")
-    results.append(verify_template_generation(client))
-
-    print("\n4. Dry-Run Validation")
-    results.append(verify_dry_run(client))
-
-    if args.test_data:
-        print("\n5. Test Data (Insert/Delete)")
-        results.append(verify_test_data(client))
+    prefix = f"tb-verify-{int(time.time())}"
+    sites_path = write_test_sites(prefix)
+    try:
+        # The read-only checks are independent: run them concurrently and
+        # print each one's output in order once it finishes
+        checks = [
+            ("2. Model Schema", verify_model_schema),
+            ("3. Template Generation", verify_template_generation),
+            ("4. Dry-Run Validation", lambda c, emit: verify_dry_run(c, sites_path, emit)),
+        ]
+        outputs = [[] for _ in checks]
+        with ThreadPoolExecutor(max_workers=len(checks)) as pool:
+            futures = [
+                pool.submit(check, client, output.append)
+                for (_, check), output in zip(checks, outputs)
+            ]
+            for (title, _), output, future in zip(checks, outputs, futures):
+                passed = future.result()
+                print(f"\n{title}")
+                for line in output:
+                    print(line)
+                results.append(passed)
+
+        if args.test_data:
+            print("\n5. Test Data (Insert/Delete)")
+            results.append(verify_test_data(client, sites_path, prefix))
+    finally:
+        if sites_path is not None:
+            sites_path.unlink(missing_ok=True)
 
     print()
     print("=" * 40)
@@ -4,7 +4,8 @@ TurboBulk Client - Python client for TurboBulk NetBox plugin.
 High-performance bulk data operations for NetBox.
 """
 
-from .client import TurboBulkClient
+from .async_client import AsyncTurboBulkClient
+from .client import TurboBulkClient, get_shared_session
 from .exceptions import (
     AuthenticationError,
     ConnectionError,
@@ -12,11 +13,15 @@ from .exceptions import (
     TurboBulkError,
     ValidationError,
 )
+from .jobs import JobWaiter
 
 __version__ = "0.1.0"
 
 __all__ = [
     "TurboBulkClient",
+    "AsyncTurboBulkClient",
+    "get_shared_session",
+    "JobWaiter",
     "TurboBulkError",
     "JobFailedError",
     "ValidationError",
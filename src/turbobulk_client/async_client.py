@@ -0,0 +1,575 @@
+"""
+TurboBulk asyncio API Client.
+
+Asynchronous counterpart of TurboBulkClient for running many uploads, exports
+and job polls concurrently on one event loop. Requires aiohttp
+(pip install turbobulk-client[async]).
+"""
+
+import asyncio
+import copy
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union, cast
+
+from .client import (
+    _BOOL,
+    _DOWNLOAD_CHUNK_SIZE,
+    _FINISHED_STATUSES,
+    _auth_failure_message,
+    _authorization_header,
+    _json_dumps,
+    _json_loads,
+    _poll_delay,
+    _validate_path,
+)
+from .exceptions import AuthenticationError, JobFailedError, TurboBulkError
+
+try:
+    import aiohttp
+except ImportError:  # Optional: pip install turbobulk-client[async]
+    aiohttp = None
+
+# Connections kept open by the session's connector
+_CONNECTION_LIMIT = 32
+
+
+class AsyncTurboBulkClient:
+    """
+    asyncio client for TurboBulk API operations.
+
+    Methods mirror TurboBulkClient but are coroutines, so independent
+    operations can be awaited together instead of one thread per job.
+
+    Example:
+        async with AsyncTurboBulkClient() as client:
+            sites, devices = await asyncio.gather(
+                client.load('dcim.site', 'sites.parquet'),
+                client.export('dcim.device', format='parquet'),
+            )
+    """
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        token: Optional[str] = None,
+        verify_ssl: bool = True,
+    ):
+        """
+        Initialize async TurboBulk client.
+
+        The HTTP session is created on first use (inside the running event
+        loop); close it with close() or by using the client as an async
+        context manager.
+
+        Args:
+            base_url: NetBox URL (or set NETBOX_URL env var)
+            token: API token (or set NETBOX_TOKEN env var)
+            verify_ssl: Verify SSL certificates (default True)
+        """
+        if aiohttp is None:
+            raise TurboBulkError(
+                "aiohttp is required for AsyncTurboBulkClient "
+                "(pip install turbobulk-client[async])"
+            )
+
+        self.base_url = (base_url or os.environ.get("NETBOX_URL", "")).rstrip("/")
+        self.token = token or os.environ.get("NETBOX_TOKEN", "")
+
+        if not self.base_url:
+            raise TurboBulkError("NetBox URL required (pass base_url or set NETBOX_URL)")
+        if not self.token:
+            raise TurboBulkError("API token required (pass token or set NETBOX_TOKEN)")
+
+        self.verify_ssl = verify_ssl
+        self.api_base = f"{self.base_url}/api/plugins/turbobulk"
+        self._urls = {
+            name: f"{self.api_base}/{name}/"
+            for name in ("models", "load", "delete", "export", "jobs")
+        }
+        self._session: Optional["aiohttp.ClientSession"] = None
+
+        # Schemas don't change during a run; fetch each once
+        self._models_cache: Optional[List[Dict]] = None
+        self._schema_cache: Dict[str, Dict] = {}
+
+    async def __aenter__(self) -> "AsyncTurboBulkClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    @property
+    def session(self) -> "aiohttp.ClientSession":
+        """The aiohttp session, created on first access."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=_CONNECTION_LIMIT,
+                keepalive_timeout=75,
+                ssl=self.verify_ssl,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers={"Authorization": _authorization_header(self.token)},
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Close the HTTP session and its pooled connections."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    async def _raise_for_status(self, response: "aiohttp.ClientResponse") -> None:
+        """Raise an appropriate exception for HTTP errors with helpful messages."""
+        if response.status in (401, 403):
+            detail = ""
+            try:
+                detail = (await response.json()).get("detail", "")
+            except Exception:
+                pass
+            raise AuthenticationError(_auth_failure_message(response.status, detail, self.token))
+
+        response.raise_for_status()
+
+    async def _get_json(self, url: str, params: Optional[Dict] = None) -> Any:
+        async with self.session.get(url, params=params) as response:
+            await self._raise_for_status(response)
+            return await response.json(loads=_json_loads)
+
+    async def _upload(self, endpoint: str, data: Dict[str, str], data_path: Path) -> Dict:
+        """POST form fields plus the data file to a TurboBulk endpoint."""
+        with open(data_path, "rb") as f:
+            form = aiohttp.FormData()
+            for key, value in data.items():
+                form.add_field(key, value)
+            form.add_field(
+                "file", f, filename=data_path.name, content_type="application/octet-stream"
+            )
+            async with self.session.post(self._urls[endpoint], data=form) as response:
+                await self._raise_for_status(response)
+                return cast(Dict[Any, Any], await response.json(loads=_json_loads))
+
+    async def get_models(self) -> List[Dict]:
+        """
+        List available models with their schemas.
+
+        Returns:
+            List of model info dicts with app_label, model_name, etc.
+        """
+        if self._models_cache is None:
+            self._models_cache = cast(
+                List[Dict[Any, Any]], await self._get_json(self._urls["models"])
+            )
+        # Copy so callers can modify the result without changing the cache
+        return copy.deepcopy(self._models_cache)
+
+    async def get_model_schema(self, model: str) -> Dict:
+        """
+        Get detailed schema for a specific model.
+
+        Args:
+            model: Model identifier (e.g., 'dcim.device', 'dcim.site')
+
+        Returns:
+            Schema dict with fields, constraints, etc.
+        """
+        if model not in self._schema_cache:
+            self._schema_cache[model] = cast(
+                Dict[Any, Any], await self._get_json(f"{self._urls['models']}{model}/")
+            )
+        return copy.deepcopy(self._schema_cache[model])
+
+    def invalidate_schema_cache(self, model: Optional[str] = None) -> None:
+        """
+        Drop cached schemas so the next lookup refetches them.
+
+        Args:
+            model: Model identifier to drop (default: drop every cached schema
+                and the model list)
+        """
+        if model is not None:
+            self._schema_cache.pop(model, None)
+            return
+        self._schema_cache.clear()
+        self._models_cache = None
+
+    async def validate(
+        self,
+        model: str,
+        data_path: Union[str, Path],
+        mode: str = "insert",
+        conflict_fields: Optional[List[str]] = None,
+        validation_mode: str = "auto",
+        wait: bool = True,
+        poll_interval: float = 1.0,
+        timeout: int = 3600,
+        verbose: bool = True,
+    ) -> Dict:
+        """
+        Validate a data file without committing changes (dry-run).
+
+        See TurboBulkClient.validate() for argument details.
+        """
+        return await self.load(
+            model=model,
+            data_path=data_path,
+            mode=mode,
+            conflict_fields=conflict_fields,
+            validation_mode=validation_mode,
+            dry_run=True,
+            wait=wait,
+            poll_interval=poll_interval,
+            timeout=timeout,
+            verbose=verbose,
+        )
+
+    async def load(
+        self,
+        model: str,
+        data_path: Union[str, Path],
+        mode: str = "insert",
+        conflict_fields: Optional[List[str]] = None,
+        conflict_constraint: Optional[str] = None,
+        validation_mode: str = "auto",
+        post_hooks: Optional[Dict[str, bool]] = None,
+        create_changelogs: bool = True,
+        dispatch_events: Optional[bool] = None,
+        branch: Optional[str] = None,
+        dry_run: bool = False,
+        wait: bool = True,
+        poll_interval: float = 1.0,
+        timeout: int = 3600,
+        verbose: bool = True,
+    ) -> Dict:
+        """
+        Submit a bulk load (insert/upsert) job.
+
+        See TurboBulkClient.load() for argument details.
+
+        Raises:
+            JobFailedError: If job fails or times out
+        """
+        data_path = _validate_path(data_path)
+
+        fields = {
+            "model": model,
+            "mode": mode,
+            "validation_mode": validation_mode,
+            "create_changelogs": _BOOL(create_changelogs),
+            "conflict_fields": ",".join(conflict_fields) if conflict_fields else None,
+            "conflict_constraint": conflict_constraint or None,
+            "post_hooks": _json_dumps(post_hooks) if post_hooks else None,
+            "dispatch_events": None if dispatch_events is None else _BOOL(dispatch_events),
+            "branch": branch or None,
+            "dry_run": "true" if dry_run else None,
+        }
+        data = {key: value for key, value in fields.items() if value is not None}
+
+        result = await self._upload("load", data, data_path)
+
+        job_id = result.get("job_id")
+        if not wait or not job_id:
+            return result
+
+        operation = f"dry-run {mode} {model}" if dry_run else f"{mode} {model}"
+        return await self._wait_for_job(
+            job_id,
+            poll_interval=poll_interval,
+            timeout=timeout,
+            verbose=verbose,
+            operation=operation,
+        )
+
+    async def delete(
+        self,
+        model: str,
+        data_path: Union[str, Path],
+        key_fields: Optional[List[str]] = None,
+        cascade_nullable_fks: bool = True,
+        create_changelogs: bool = True,
+        dispatch_events: Optional[bool] = None,
+        branch: Optional[str] = None,
+        dry_run: bool = False,
+        wait: bool = True,
+        poll_interval: float = 1.0,
+        timeout: int = 3600,
+        verbose: bool = True,
+    ) -> Dict:
+        """
+        Submit a bulk delete job.
+
+        See TurboBulkClient.delete() for argument details.
+        """
+        data_path = _validate_path(data_path)
+
+        fields = {
+            "model": model,
+            "cascade_nullable_fks": _BOOL(cascade_nullable_fks),
+            "create_changelogs": _BOOL(create_changelogs),
+            "key_fields": ",".join(key_fields) if key_fields else None,
+            "dispatch_events": None if dispatch_events is None else _BOOL(dispatch_events),
+            "branch": branch or None,
+            "dry_run": "true" if dry_run else None,
+        }
+        data = {key: value for key, value in fields.items() if value is not None}
+
+        result = await self._upload("delete", data, data_path)
+
+        job_id = result.get("job_id")
+        if not wait or not job_id:
+            return result
+
+        operation = f"dry-run delete {model}" if dry_run else f"delete {model}"
+        return await self._wait_for_job(
+            job_id,
+            poll_interval=poll_interval,
+            timeout=timeout,
+            verbose=verbose,
+            operation=operation,
+        )
+
+    async def export(
+        self,
+        model: str,
+        filters: Optional[Dict[str, Any]] = None,
+        fields: Optional[List[str]] = None,
+        include_custom_fields: bool = True,
+        include_tags: bool = True,
+        format: str = "jsonl",
+        output_path: Optional[Path] = None,
+        force_refresh: bool = False,
+        check_cache_only: bool = False,
+        client_cache_key: Optional[str] = None,
+        wait: bool = True,
+        poll_interval: float = 1.0,
+        timeout: int = 3600,
+        verbose: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Export data from NetBox to JSONL or Parquet file.
+
+        See TurboBulkClient.export() for argument details and result shapes.
+        """
+        data: Dict[str, Any] = {
+            "model": model,
+            "format": format,
+            "include_custom_fields": include_custom_fields,
+            "include_tags": include_tags,
+        }
+        if filters:
+            data["filters"] = filters
+        if fields:
+            data["fields"] = fields
+        if force_refresh:
+            data["force_refresh"] = True
+        if check_cache_only:
+            data["check_cache_only"] = True
+        if client_cache_key:
+            data["client_cache_key"] = client_cache_key
+
+        async with self.session.post(self._urls["export"], json=data) as response:
+            # Handle 304 Not Modified
+            if response.status == 304:
+                body = await response.read()
+                result: Dict[str, Any] = _json_loads(body) if body else {}
+                result["status_code"] = 304
+                result["cached"] = True
+                if verbose:
+                    print("Cache current: client file is up to date")
+                return result
+
+            await self._raise_for_status(response)
+            result = await response.json(loads=_json_loads)
+            result["status_code"] = response.status
+
+        if check_cache_only:
+            if verbose:
+                if result.get("cached"):
+                    print(f"Cache valid: {model}")
+                else:
+                    print(f"Cache invalid or missing: {model}")
+            return result
+
+        # Handle cache hit (HTTP 200)
+        if result["status_code"] == 200 and result.get("cached"):
+            if verbose:
+                print(f"Cache hit: {result.get('row_count', 'N/A')} rows")
+            download_url = result.get("download_url")
+            if download_url:
+                result["path"] = await self._download_export_file(
+                    download_url, output_path, format, verbose
+                )
+            return result
+
+        # Handle job submission (HTTP 202)
+        if not wait:
+            return result
+
+        job_id = result.get("job_id")
+        if not job_id:
+            raise TurboBulkError("No job_id in export response")
+
+        if verbose:
+            print("Cache miss: creating new export job")
+
+        job_result = await self._wait_for_job(
+            job_id,
+            poll_interval=poll_interval,
+            timeout=timeout,
+            verbose=verbose,
+            operation=f"export {model}",
+        )
+
+        # Prefer download_url at top level (new API), then file_url in data (legacy)
+        download_url = job_result.get("download_url") or job_result.get("data", {}).get("file_url")
+        if not download_url:
+            download_url = f"{self._urls['jobs']}{job_id}/download/"
+
+        job_result["path"] = await self._download_export_file(
+            download_url, output_path, format, verbose
+        )
+        job_result["cached"] = False
+        return job_result
+
+    async def _download_export_file(
+        self,
+        url: str,
+        output_path: Optional[Path],
+        format: str,
+        verbose: bool,
+    ) -> Path:
+        """Stream an export file from URL to disk."""
+        if url.startswith("/"):
+            url = f"{self.base_url}{url}"
+
+        if verbose:
+            print("Downloading export file...")
+
+        if output_path is None:
+            suffix = ".jsonl.gz" if format == "jsonl" else ".parquet"
+            fd, temp_path = tempfile.mkstemp(suffix=suffix)
+            os.close(fd)
+            final_path = Path(temp_path)
+        else:
+            final_path = Path(output_path)
+
+        loop = asyncio.get_running_loop()
+        async with self.session.get(url) as response:
+            await self._raise_for_status(response)
+            with open(final_path, "wb") as f:
+                async for chunk in response.content.iter_chunked(_DOWNLOAD_CHUNK_SIZE):
+                    # Disk writes run in the default executor so they don't block the loop
+                    await loop.run_in_executor(None, f.write, chunk)
+
+        if verbose:
+            print(f"Saved to: {final_path}")
+
+        return final_path
+
+    async def get_job_status(self, job_id: str) -> Dict:
+        """
+        Get status of a bulk operation job.
+
+        Args:
+            job_id: Job UUID
+
+        Returns:
+            Job status dict
+        """
+        result, _ = await self._poll_job_status(job_id)
+        return cast(Dict[Any, Any], result)
+
+    async def _poll_job_status(
+        self, job_id: str, etag: Optional[str] = None, brief: bool = False
+    ) -> Tuple[Optional[Dict], Optional[str]]:
+        """
+        Fetch job status, sending If-None-Match when an ETag is known.
+
+        With brief=True only the status field is requested (?fields=status).
+
+        Returns:
+            (status dict, ETag) tuple; the dict is None when the server
+            answered 304 Not Modified
+        """
+        headers = {"If-None-Match": etag} if etag else None
+        params = {"fields": "status"} if brief else None
+        async with self.session.get(
+            f"{self._urls['jobs']}{job_id}/", params=params, headers=headers
+        ) as response:
+            if response.status == 304:
+                return None, etag
+            await self._raise_for_status(response)
+            return await response.json(loads=_json_loads), response.headers.get("ETag")
+
+    async def _wait_for_job(
+        self,
+        job_id: str,
+        poll_interval: float = 1.0,
+        timeout: int = 3600,
+        verbose: bool = True,
+        operation: str = "operation",
+        max_poll_interval: float = 30.0,
+    ) -> Dict:
+        """
+        Wait for a job to complete without blocking the event loop.
+
+        Polling backs off like TurboBulkClient._wait_for_job().
+        """
+        start_time = time.time()
+        last_status = None
+        result: Dict[Any, Any] = {}
+        etag = None
+        unchanged_polls = 0
+
+        while True:
+            elapsed = time.time() - start_time
+            if elapsed > timeout:
+                raise TurboBulkError(f"Job {job_id} timed out after {timeout}s")
+
+            polled, etag = await self._poll_job_status(job_id, etag, brief=True)
+            if polled is not None:
+                result = polled
+            status = result.get("status")
+            if status in _FINISHED_STATUSES and "data" not in result:
+                # Brief polls carry only the status; fetch the full result once
+                result = await self.get_job_status(job_id)
+
+            if status != last_status:
+                if verbose:
+                    print(f"[{elapsed:.1f}s] {operation}: {status}")
+                last_status = status
+                unchanged_polls = 0
+            else:
+                unchanged_polls += 1
+
+            if status == "completed":
+                if verbose:
+                    rows = result.get("data", {}).get("rows_affected", "N/A")
+                    duration = result.get("duration_seconds", "N/A")
+                    print(f"Completed: {rows} rows in {duration}s")
+                return result
+
+            if status == "errored" or status == "failed":
+                error_msg = result.get("data", {}).get("error", "Unknown error")
+                raise JobFailedError(f"Job failed: {error_msg}", result)
+
+            await asyncio.sleep(
+                _poll_delay(poll_interval, unchanged_polls, max_poll_interval, timeout - elapsed)
+            )
+
+    async def rest_get(self, endpoint: str, params: Optional[Dict] = None) -> Dict:
+        """
+        Make a GET request to the NetBox REST API.
+
+        Args:
+            endpoint: API endpoint (e.g., '/api/dcim/sites/')
+            params: Query parameters
+
+        Returns:
+            Response JSON
+        """
+        if not endpoint.startswith("/"):
+            endpoint = f"/{endpoint}"
+        return cast(Dict[Any, Any], await self._get_json(f"{self.base_url}{endpoint}", params))
@@ -4,15 +4,366 @@ TurboBulk API Client.
 High-level client for TurboBulk bulk data operations.
 """
 
+import contextlib
+import copy
+import functools
+import gzip
+import hashlib
+import json
+import mmap
 import os
+import random
+import shutil
+import socket
+import tempfile
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union, cast
+from types import MappingProxyType
+from typing import (
+    Any,
+    BinaryIO,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Protocol,
+    Tuple,
+    Union,
+    cast,
+)
+from urllib.parse import parse_qs, urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
 
 from .exceptions import AuthenticationError, JobFailedError, TurboBulkError
 
+try:
+    from requests_toolbelt import MultipartEncoder
+except ImportError:  # Optional: streams uploads instead of buffering the whole file
+    MultipartEncoder = None
+
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON encoding/decoding when installed
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import httpx
+except ImportError:  # Optional: HTTP/2 transport for polling and downloads
+    httpx = None
+
+# Connections kept per host by the shared pool
+_POOL_SIZE = 32
+
+# Job statuses that end polling
+_FINISHED_STATUSES = frozenset(["completed", "errored", "failed"])
+
+# Form value for a boolean option
+_BOOL = {True: "true", False: "false"}.__getitem__
+
+# Plain JSONL uploads smaller than this are sent uncompressed
+_COMPRESS_MIN_BYTES = 64 * 1024
+
+# Concurrent page fetches in rest_get_all()
+_PAGE_WORKERS = 8
+
+# Download chunk size for export files
+_DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+# Transient gateway errors retried by the shared adapter. Only idempotent
+# methods are retried on these, so an upload that reached the server is never
+# submitted twice; connection failures (nothing sent yet) are retried for all.
+_RETRY = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=(502, 503, 504),
+    allowed_methods=frozenset(["GET", "HEAD"]),
+    raise_on_status=False,
+)
+
+# TCP keepalive on pooled sockets: probe after 30s idle, every 10s, give up
+# after 3 misses, so load balancers don't silently drop connections left idle
+# during long job waits. Options the platform lacks are skipped.
+_KEEPALIVE_OPTIONS = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)] + [
+    (socket.IPPROTO_TCP, getattr(socket, name), value)
+    for name, value in (
+        ("TCP_KEEPIDLE", 30),
+        ("TCP_KEEPALIVE", 30),  # macOS name for TCP_KEEPIDLE
+        ("TCP_KEEPINTVL", 10),
+        ("TCP_KEEPCNT", 3),
+    )
+    if hasattr(socket, name)
+]
+_SOCKET_OPTIONS = HTTPConnection.default_socket_options + _KEEPALIVE_OPTIONS
+
+# Template value per field type. Types not listed are resolved by substring
+# (first match in _TYPE_FALLBACKS wins); see _fallback_type_default().
+_TYPE_DEFAULTS: Mapping[str, Any] = MappingProxyType(
+    {
+        "CharField": "",
+        "TextField": "",
+        "IntegerField": 0,
+        "BigIntegerField": 0,
+        "SmallIntegerField": 0,
+        "PositiveIntegerField": 0,
+        "PositiveBigIntegerField": 0,
+        "PositiveSmallIntegerField": 0,
+        "BooleanField": False,
+        "JSONField": {},
+        "DecimalField": 0.0,
+        "FloatField": 0.0,
+    }
+)
+_TYPE_FALLBACKS: Tuple[Tuple[str, Any], ...] = (
+    ("Char", ""),
+    ("Text", ""),
+    ("Int", 0),
+    ("Bool", False),
+    ("JSON", {}),
+    ("Decimal", 0.0),
+    ("Float", 0.0),
+)
+
+_shared_session: Optional[requests.Session] = None
+_shared_session_lock = threading.Lock()
+
+
+class _HTTPResponse(Protocol):
+    """The parts of a requests or httpx response the client reads."""
+
+    @property
+    def status_code(self) -> int: ...
+
+    @property
+    def headers(self) -> Mapping[str, str]: ...
+
+    @property
+    def content(self) -> bytes: ...
+
+    def json(self) -> Any: ...
+
+    def raise_for_status(self) -> Any: ...
+
+
+class _KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter whose pooled sockets send TCP keepalive probes."""
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        kwargs.setdefault("socket_options", _SOCKET_OPTIONS)
+        super().init_poolmanager(*args, **kwargs)
+
+
+def get_shared_session() -> requests.Session:
+    """
+    Return the process-wide session whose connection pool clients share.
+
+    The session carries no credentials. Each TurboBulkClient keeps its own
+    session (and Authorization header) but mounts this session's adapters, so
+    TCP and TLS connections are reused across clients talking to the same host.
+    """
+    global _shared_session
+    with _shared_session_lock:
+        if _shared_session is None:
+            session = requests.Session()
+            adapter = _KeepAliveAdapter(
+                pool_connections=_POOL_SIZE,
+                pool_maxsize=_POOL_SIZE,
+                max_retries=_RETRY,
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _shared_session = session
+        return _shared_session
+
+
+def _authorization_header(token: str) -> str:
+    """Return the Authorization header value for a token (v2 tokens start with 'nbt_')."""
+    return f"Bearer {token}" if token.startswith("nbt_") else f"Token {token}"
+
+
+def _auth_failure_message(status_code: int, detail: str, token: str) -> str:
+    """Build the AuthenticationError message, with a hint for v1-looking tokens."""
+    msg = f"{status_code} Authentication failed: {detail}"
+    if not token.startswith("nbt_"):
+        msg += (
+            "\n\nHint: your token does not start with 'nbt_'. If you created a v2 token "
+            "(default in NetBox 4.5+), you must use the full token value in the format: "
+            "nbt_<key>.<plaintext>. See: https://github.com/netboxlabs/netbox-turbobulk-public#authentication"
+        )
+    return msg
+
+
+def _poll_delay(
+    poll_interval: float, unchanged_polls: int, max_poll_interval: float, remaining: float
+) -> float:
+    """
+    Seconds to wait before the next job status poll.
+
+    The delay grows 1.5x for every poll that saw no status change, up to
+    max_poll_interval, plus up to 25% jitter so concurrent pollers spread
+    out. It never sleeps past the remaining timeout.
+    """
+    delay = min(max_poll_interval, poll_interval * 1.5**unchanged_polls)
+    delay += delay * random.uniform(0, 0.25)
+    return max(0.0, min(delay, remaining))
+
+
+# orjson.loads accepts str or bytes, as does json.loads
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _json_dumps(value: Any) -> str:
+    """Serialize a value to a JSON string."""
+    if orjson is not None:
+        return cast(str, orjson.dumps(value).decode())
+    return json.dumps(value)
+
+
+def _response_json(response: _HTTPResponse) -> Any:
+    """Decode a JSON response body, skipping requests' charset detection."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+@contextlib.contextmanager
+def _compressed_upload(data_path: Path, upload_compression: str) -> Iterator[Path]:
+    """
+    Yield the file to upload: a gzipped temporary copy of plain JSONL files.
+
+    TurboBulk accepts .jsonl.gz wherever it accepts .jsonl, so compressing
+    on the client only changes what goes over the wire.
+    """
+    if upload_compression not in ("auto", "none"):
+        raise TurboBulkError(f"Unknown upload_compression: {upload_compression!r}")
+    if (
+        upload_compression == "none"
+        or data_path.suffix.lower() != ".jsonl"
+        or data_path.stat().st_size < _COMPRESS_MIN_BYTES
+    ):
+        yield data_path
+        return
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        gz_path = Path(temp_dir) / f"{data_path.name}.gz"
+        with open(data_path, "rb") as src, gzip.open(gz_path, "wb", compresslevel=1) as dst:
+            shutil.copyfileobj(src, dst, _DOWNLOAD_CHUNK_SIZE)
+        yield gz_path
+
+
+def _httpx_http_error(response: Any) -> requests.HTTPError:
+    """
+    Build the requests.HTTPError for an httpx error response.
+
+    The error carries an equivalent requests.Response, so callers can inspect
+    e.response.status_code whichever transport made the request.
+    """
+    converted = requests.Response()
+    converted.status_code = response.status_code
+    converted.reason = response.reason_phrase
+    converted.url = str(response.url)
+    converted.headers = CaseInsensitiveDict(response.headers)
+    converted._content = response.read()  # also loads streamed bodies
+    return requests.HTTPError(
+        f"{response.status_code} Error: {response.reason_phrase} for url: {response.url}",
+        response=converted,
+    )
+
+
+def _validate_path(data_path: Union[str, Path]) -> Path:
+    """Check that a data file exists and is not empty, with a single stat()."""
+    path = Path(data_path)
+    try:
+        size = path.stat().st_size
+    except FileNotFoundError:
+        raise TurboBulkError(f"Data file not found: {path}") from None
+    if size == 0:
+        raise TurboBulkError(f"Data file is empty: {path}")
+    return path
+
+
+@contextlib.contextmanager
+def _mapped_file(f: BinaryIO) -> Iterator[memoryview]:
+    """
+    Yield an open file's contents as a memoryview over a read-only mapping.
+
+    requests copies a memoryview straight into the multipart body, whereas a
+    file object is first read() into a separate bytes copy of the whole file.
+    The file must not be empty (load() and delete() reject empty files).
+    """
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        view = memoryview(mapped)
+        try:
+            yield view
+        finally:
+            view.release()
+
+
+def _next_offset(next_url: Optional[str]) -> Optional[int]:
+    """Offset of a paginated response's next link (None when there is no next page)."""
+    if not next_url:
+        return None
+    offset = parse_qs(urlparse(next_url).query).get("offset")
+    return int(offset[0]) if offset else None
+
+
+def _read_export_cache_key(cache_file: Path, cache_meta: Path) -> Optional[str]:
+    """Server cache key of a locally cached export (None if nothing usable is cached)."""
+    if not cache_file.exists():
+        return None
+    try:
+        return cast(Optional[str], _json_loads(cache_meta.read_bytes()).get("cache_key"))
+    except (OSError, ValueError):
+        return None
+
+
+def _store_export_cache(
+    path: Path, cache_key: Optional[str], cache_file: Path, cache_meta: Path
+) -> Path:
+    """Move a downloaded export into the local cache, returning its new path."""
+    if not cache_key:
+        return path
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    # Drop the old key first so an interrupted move never pairs it with a new file
+    cache_meta.unlink(missing_ok=True)
+    shutil.move(str(path), cache_file)
+    cache_meta.write_text(_json_dumps({"cache_key": cache_key}))
+    return cache_file
+
+
+@functools.lru_cache(maxsize=256)
+def _fallback_type_default(field_type: str) -> Any:
+    """Resolve a field type missing from _TYPE_DEFAULTS by substring match."""
+    return next((value for marker, value in _TYPE_FALLBACKS if marker in field_type), None)
+
+
+def _type_default(field_type: str) -> Any:
+    """Template value for a schema field type (a fresh copy for mutable values)."""
+    try:
+        default = _TYPE_DEFAULTS[field_type]
+    except KeyError:
+        default = _fallback_type_default(field_type)
+    return copy.copy(default)
+
+
+def _jsonl_has_rows(path: Path) -> bool:
+    """Return True if a (possibly gzipped) JSONL file contains at least one row."""
+    with open(path, "rb") as raw:
+        compressed = raw.read(2) == b"\x1f\x8b"
+    opener = gzip.open if compressed else open
+    with opener(path, "rb") as f:
+        for line in f:
+            if line.strip():
+                return True
+    return False
+
 
 class TurboBulkClient:
     """
@@ -35,6 +386,9 @@ class TurboBulkClient:
         base_url: Optional[str] = None,
         token: Optional[str] = None,
         verify_ssl: bool = True,
+        session: Optional[requests.Session] = None,
+        cache_dir: Optional[Union[str, Path]] = None,
+        http2: bool = False,
     ):
         """
         Initialize TurboBulk client.
@@ -43,6 +397,14 @@ class TurboBulkClient:
             base_url: NetBox URL (or set NETBOX_URL env var)
             token: API token (or set NETBOX_TOKEN env var)
             verify_ssl: Verify SSL certificates (default True)
+            session: Session to send requests with (default: a new session
+                sharing the connection pool from get_shared_session())
+            cache_dir: Directory for keeping export files between runs (or set
+                TURBOBULK_CACHE); unchanged exports are then not re-downloaded
+            http2: Send GET requests (job polling, schemas, REST queries and
+                export downloads) over a multiplexed HTTP/2 connection; needs
+                httpx (pip install turbobulk-client[http2]). Uploads still use
+                the requests session.
         """
         self.base_url = (base_url or os.environ.get("NETBOX_URL", "")).rstrip("/")
         self.token = token or os.environ.get("NETBOX_TOKEN", "")
@@ -53,18 +415,68 @@ class TurboBulkClient:
             raise TurboBulkError("API token required (pass token or set NETBOX_TOKEN)")
 
         self.verify_ssl = verify_ssl
-        self.session = requests.Session()
-        # Detect token version: v2 tokens start with 'nbt_'
-        if self.token.startswith("nbt_"):
-            self.session.headers["Authorization"] = f"Bearer {self.token}"
-        else:
-            self.session.headers["Authorization"] = f"Token {self.token}"
+        # Adapters from get_shared_session() are used by other clients; close() leaves them open
+        self._owns_adapters = session is not None
+        if session is None:
+            session = requests.Session()
+            for prefix, adapter in get_shared_session().adapters.items():
+                session.mount(prefix, adapter)
+        self.session = session
+        self.session.headers["Authorization"] = _authorization_header(self.token)
         self.session.verify = verify_ssl
 
+        self.http2_client: Optional["httpx.Client"] = None
+        if http2:
+            if httpx is None:
+                raise TurboBulkError(
+                    "http2=True requires httpx: pip install turbobulk-client[http2]"
+                )
+            transport = httpx.HTTPTransport(
+                http2=True,
+                verify=verify_ssl,
+                retries=3,
+                socket_options=_SOCKET_OPTIONS,
+                limits=httpx.Limits(
+                    max_connections=_POOL_SIZE,
+                    max_keepalive_connections=_POOL_SIZE,
+                    keepalive_expiry=75,
+                ),
+            )
+            self.http2_client = httpx.Client(
+                headers={"Authorization": _authorization_header(self.token)},
+                transport=transport,
+            )
+
         # TurboBulk API base
         self.api_base = f"{self.base_url}/api/plugins/turbobulk"
+        self._urls = {
+            name: f"{self.api_base}/{name}/"
+            for name in ("models", "load", "delete", "export", "jobs")
+        }
+
+        cache_dir = cache_dir or os.environ.get("TURBOBULK_CACHE")
+        self.cache_dir = Path(cache_dir).expanduser() if cache_dir else None
+
+        # Schemas and content types don't change during a run; fetch each once
+        self._models_cache: Optional[List[Dict]] = None
+        self._schema_cache: Dict[str, Dict] = {}
+        self._content_type_cache: Dict[Tuple[str, str], int] = {}
 
-    def _raise_for_status(self, response: requests.Response) -> None:
+    def close(self) -> None:
+        """
+        Close the connections this client owns.
+
+        A client created without a session uses the shared pool, which other
+        clients may still be using; its connections stay open (close them with
+        get_shared_session().close()). A session passed in is closed; its pool
+        reconnects if used again.
+        """
+        if self._owns_adapters:
+            self.session.close()
+        if self.http2_client is not None:
+            self.http2_client.close()
+
+    def _raise_for_status(self, response: _HTTPResponse) -> None:
         """Raise an appropriate exception for HTTP errors with helpful messages."""
         if response.status_code in (401, 403):
             detail = ""
@@ -73,19 +485,48 @@ class TurboBulkClient:
             except Exception:
                 pass
 
-            msg = f"{response.status_code} Authentication failed: {detail}"
-
-            if not self.token.startswith("nbt_"):
-                msg += (
-                    "\n\nHint: your token does not start with 'nbt_'. If you created a v2 token "
-                    "(default in NetBox 4.5+), you must use the full token value in the format: "
-                    "nbt_<key>.<plaintext>. See: https://github.com/netboxlabs/netbox-turbobulk-public#authentication"
-                )
+            raise AuthenticationError(
+                _auth_failure_message(response.status_code, detail, self.token)
+            )
 
-            raise AuthenticationError(msg)
+        if httpx is not None and isinstance(response, httpx.Response):
+            # Surface HTTP errors as requests.HTTPError on either transport
+            if response.is_error:
+                raise _httpx_http_error(response)
+            return
 
         response.raise_for_status()
 
+    def _get(
+        self, url: str, params: Optional[Dict] = None, headers: Optional[Dict] = None
+    ) -> _HTTPResponse:
+        """GET a URL, over HTTP/2 when enabled (an httpx or a requests response)."""
+        if self.http2_client is not None:
+            response: _HTTPResponse = self.http2_client.get(url, params=params, headers=headers)
+            return response
+        return self.session.get(url, params=params, headers=headers)
+
+    def _upload(self, endpoint: str, data: Dict[str, str], data_path: Path) -> requests.Response:
+        """
+        POST form fields plus the data file to a TurboBulk endpoint.
+
+        With requests-toolbelt installed the multipart body is streamed from
+        disk; otherwise requests builds the whole body in memory first.
+        """
+        url = self._urls[endpoint]
+        with open(data_path, "rb") as f:
+            if MultipartEncoder is not None:
+                file_field = (data_path.name, f, "application/octet-stream")
+                encoder = MultipartEncoder(fields={**data, "file": file_field})
+                return self.session.post(
+                    url, data=encoder, headers={"Content-Type": encoder.content_type}
+                )
+            # requests builds the whole body in memory; copy the file into it once
+            with _mapped_file(f) as body:
+                # requests accepts any buffer here; its type stubs only list bytes
+                body_field = (data_path.name, cast(bytes, body), "application/octet-stream")
+                return self.session.post(url, data=data, files={"file": body_field})
+
     def get_models(self) -> List[Dict]:
         """
         List available models with their schemas.
@@ -93,9 +534,12 @@ class TurboBulkClient:
         Returns:
             List of model info dicts with app_label, model_name, etc.
         """
-        response = self.session.get(f"{self.api_base}/models/")
-        self._raise_for_status(response)
-        return cast(List[Dict[Any, Any]], response.json())
+        if self._models_cache is None:
+            response = self._get(self._urls["models"])
+            self._raise_for_status(response)
+            self._models_cache = cast(List[Dict[Any, Any]], _response_json(response))
+        # Copy so callers can modify the result without changing the cache
+        return copy.deepcopy(self._models_cache)
 
     def get_model_schema(self, model: str) -> Dict:
         """
@@ -107,9 +551,26 @@ class TurboBulkClient:
         Returns:
             Schema dict with fields, constraints, etc.
         """
-        response = self.session.get(f"{self.api_base}/models/{model}/")
-        self._raise_for_status(response)
-        return cast(Dict[Any, Any], response.json())
+        if model not in self._schema_cache:
+            response = self._get(f"{self._urls['models']}{model}/")
+            self._raise_for_status(response)
+            self._schema_cache[model] = cast(Dict[Any, Any], _response_json(response))
+        return copy.deepcopy(self._schema_cache[model])
+
+    def invalidate_schema_cache(self, model: Optional[str] = None) -> None:
+        """
+        Drop cached schemas so the next lookup refetches them.
+
+        Args:
+            model: Model identifier to drop (default: drop every cached schema,
+                the model list and content type IDs)
+        """
+        if model is not None:
+            self._schema_cache.pop(model, None)
+            return
+        self._schema_cache.clear()
+        self._models_cache = None
+        self._content_type_cache.clear()
 
     def get_template(self, model: str, include_optional: bool = False) -> Dict[str, Any]:
         """
@@ -152,23 +613,10 @@ class TurboBulkClient:
                 continue
 
             # Generate appropriate default value based on type
-            field_type = field.get("type", "")
             default = field.get("default")
-
-            if default is not None:
-                template[name] = default
-            elif "Char" in field_type or "Text" in field_type:
-                template[name] = ""
-            elif "Int" in field_type or "BigInt" in field_type:
-                template[name] = 0
-            elif "Bool" in field_type:
-                template[name] = False
-            elif "JSON" in field_type:
-                template[name] = {}
-            elif "Decimal" in field_type or "Float" in field_type:
-                template[name] = 0.0
-            else:
-                template[name] = None
+            template[name] = (
+                default if default is not None else _type_default(field.get("type", ""))
+            )
 
         return template
 
@@ -233,6 +681,7 @@ class TurboBulkClient:
         poll_interval: float = 1.0,
         timeout: int = 3600,
         verbose: bool = True,
+        upload_compression: str = "auto",
     ) -> Dict:
         """
         Submit a bulk load (insert/upsert) job.
@@ -255,6 +704,8 @@ class TurboBulkClient:
             poll_interval: Seconds between status polls
             timeout: Max seconds to wait for completion
             verbose: Print progress messages
+            upload_compression: 'auto' gzips plain .jsonl files (over 64 KiB)
+                before uploading them as .jsonl.gz; 'none' sends the file as-is
 
         Returns:
             Job result dict with status, rows_affected, duration, etc.
@@ -263,43 +714,28 @@ class TurboBulkClient:
         Raises:
             JobFailedError: If job fails or times out
         """
-        data_path = Path(data_path)
-        if not data_path.exists():
-            raise TurboBulkError(f"Data file not found: {data_path}")
+        data_path = _validate_path(data_path)
 
         # Build form data
-        data = {
+        fields = {
             "model": model,
             "mode": mode,
             "validation_mode": validation_mode,
-            "create_changelogs": str(create_changelogs).lower(),
+            "create_changelogs": _BOOL(create_changelogs),
+            "conflict_fields": ",".join(conflict_fields) if conflict_fields else None,
+            "conflict_constraint": conflict_constraint or None,
+            "post_hooks": _json_dumps(post_hooks) if post_hooks else None,
+            "dispatch_events": None if dispatch_events is None else _BOOL(dispatch_events),
+            "branch": branch or None,
+            "dry_run": "true" if dry_run else None,
         }
-        if conflict_fields:
-            data["conflict_fields"] = ",".join(conflict_fields)
-        if conflict_constraint:
-            data["conflict_constraint"] = conflict_constraint
-        if post_hooks:
-            import json
-
-            data["post_hooks"] = json.dumps(post_hooks)
-        if dispatch_events is not None:
-            data["dispatch_events"] = str(dispatch_events).lower()
-        if branch:
-            data["branch"] = branch
-        if dry_run:
-            data["dry_run"] = "true"
+        data = {key: value for key, value in fields.items() if value is not None}
 
         # Upload file
-        with open(data_path, "rb") as f:
-            files = {"file": (data_path.name, f, "application/octet-stream")}
-            response = self.session.post(
-                f"{self.api_base}/load/",
-                data=data,
-                files=files,
-            )
-
+        with _compressed_upload(data_path, upload_compression) as upload_path:
+            response = self._upload("load", data, upload_path)
         self._raise_for_status(response)
-        result: Dict[Any, Any] = response.json()
+        result: Dict[Any, Any] = _response_json(response)
 
         if not wait:
             return result
@@ -332,6 +768,7 @@ class TurboBulkClient:
         poll_interval: float = 1.0,
         timeout: int = 3600,
         verbose: bool = True,
+        upload_compression: str = "auto",
     ) -> Dict:
         """
         Submit a bulk delete job.
@@ -350,39 +787,30 @@ class TurboBulkClient:
             poll_interval: Seconds between status polls
             timeout: Max seconds to wait for completion
             verbose: Print progress messages
+            upload_compression: 'auto' gzips plain .jsonl files (over 64 KiB)
+                before uploading them as .jsonl.gz; 'none' sends the file as-is
 
         Returns:
             Job result dict with status, rows_deleted, etc.
             For dry_run, returns validation result with 'valid', 'rows', 'fks_would_nullify'.
         """
-        data_path = Path(data_path)
-        if not data_path.exists():
-            raise TurboBulkError(f"Data file not found: {data_path}")
+        data_path = _validate_path(data_path)
 
-        data = {
+        fields = {
             "model": model,
-            "cascade_nullable_fks": str(cascade_nullable_fks).lower(),
-            "create_changelogs": str(create_changelogs).lower(),
+            "cascade_nullable_fks": _BOOL(cascade_nullable_fks),
+            "create_changelogs": _BOOL(create_changelogs),
+            "key_fields": ",".join(key_fields) if key_fields else None,
+            "dispatch_events": None if dispatch_events is None else _BOOL(dispatch_events),
+            "branch": branch or None,
+            "dry_run": "true" if dry_run else None,
         }
-        if key_fields:
-            data["key_fields"] = ",".join(key_fields)
-        if dispatch_events is not None:
-            data["dispatch_events"] = str(dispatch_events).lower()
-        if branch:
-            data["branch"] = branch
-        if dry_run:
-            data["dry_run"] = "true"
-
-        with open(data_path, "rb") as f:
-            files = {"file": (data_path.name, f, "application/octet-stream")}
-            response = self.session.post(
-                f"{self.api_base}/delete/",
-                data=data,
-                files=files,
-            )
+        data = {key: value for key, value in fields.items() if value is not None}
 
+        with _compressed_upload(data_path, upload_compression) as upload_path:
+            response = self._upload("delete", data, upload_path)
         self._raise_for_status(response)
-        result: Dict[Any, Any] = response.json()
+        result: Dict[Any, Any] = _response_json(response)
 
         if not wait:
             return result
@@ -400,6 +828,69 @@ class TurboBulkClient:
             operation=operation,
         )
 
+    def delete_by_filter(
+        self,
+        model: str,
+        filters: Dict[str, Any],
+        cascade_nullable_fks: bool = True,
+        create_changelogs: bool = True,
+        dispatch_events: Optional[bool] = None,
+        poll_interval: float = 1.0,
+        timeout: int = 3600,
+        verbose: bool = True,
+    ) -> Dict:
+        """
+        Delete all objects matching export filters.
+
+        The delete endpoint takes a file of keys, so this exports the IDs of
+        the matching objects and submits the exported file to delete() as-is;
+        the IDs are never parsed or rewritten locally.
+
+        Args:
+            model: Model identifier (e.g., 'dcim.device')
+            filters: Dict of filter parameters (e.g., {'name__startswith': 'test-'})
+            cascade_nullable_fks: Clear nullable FK references before delete
+            create_changelogs: Generate ObjectChange records (default: True)
+            dispatch_events: Override global event dispatch setting
+                (True=dispatch, False=skip, None=use global config)
+            poll_interval: Seconds between status polls
+            timeout: Max seconds to wait for each job
+            verbose: Print progress messages
+
+        Returns:
+            Delete job result dict, or {'data': {'rows_deleted': 0}} if
+            nothing matched the filters.
+        """
+        export_result = self.export(
+            model,
+            filters=filters,
+            fields=["id"],
+            include_custom_fields=False,
+            include_tags=False,
+            force_refresh=True,
+            poll_interval=poll_interval,
+            timeout=timeout,
+            verbose=verbose,
+        )
+        ids_path = Path(export_result["path"])
+        try:
+            if not _jsonl_has_rows(ids_path):
+                if verbose:
+                    print(f"No {model} objects match {filters}")
+                return {"data": {"rows_deleted": 0}}
+            return self.delete(
+                model,
+                ids_path,
+                cascade_nullable_fks=cascade_nullable_fks,
+                create_changelogs=create_changelogs,
+                dispatch_events=dispatch_events,
+                poll_interval=poll_interval,
+                timeout=timeout,
+                verbose=verbose,
+            )
+        finally:
+            ids_path.unlink(missing_ok=True)
+
     def export(
         self,
         model: str,
@@ -446,7 +937,20 @@ class TurboBulkClient:
             - For check_cache_only: {'cached': bool, 'data_changed': bool, ...}
             - For 304 Not Modified: {'status_code': 304, 'cached': True, ...}
         """
-        import tempfile
+        # Reuse a local copy of this export if the server says it is still current
+        cache_paths = None
+        local_cache_key = None
+        if (
+            self.cache_dir is not None
+            and output_path is None
+            and not (force_refresh or check_cache_only)
+        ):
+            cache_paths = self._export_cache_paths(
+                model, filters, fields, include_custom_fields, include_tags, format
+            )
+            if client_cache_key is None:
+                local_cache_key = _read_export_cache_key(*cache_paths)
+                client_cache_key = local_cache_key
 
         data = {
             "model": model,
@@ -466,21 +970,23 @@ class TurboBulkClient:
             data["client_cache_key"] = client_cache_key
 
         response = self.session.post(
-            f"{self.api_base}/export/",
+            self._urls["export"],
             json=data,
         )
 
         # Handle 304 Not Modified
         if response.status_code == 304:
-            result: Dict[str, Any] = response.json() if response.content else {}
+            result: Dict[str, Any] = _response_json(response) if response.content else {}
             result["status_code"] = 304
             result["cached"] = True
+            if cache_paths and local_cache_key:
+                result["path"] = cache_paths[0]
             if verbose:
                 print(f"Cache current: client file is up to date")
             return result
 
         self._raise_for_status(response)
-        result = response.json()
+        result = _response_json(response)
         result["status_code"] = response.status_code
 
         # Handle check_cache_only response
@@ -506,6 +1012,10 @@ class TurboBulkClient:
                     format,
                     verbose,
                 )
+                if cache_paths:
+                    output_path = _store_export_cache(
+                        output_path, result.get("cache_key"), *cache_paths
+                    )
                 result["path"] = output_path
 
             return result
@@ -538,12 +1048,15 @@ class TurboBulkClient:
 
         # Fall back to constructing API download endpoint URL
         if not download_url:
-            download_url = f"{self.api_base}/jobs/{job_id}/download/"
+            download_url = f"{self._urls['jobs']}{job_id}/download/"
 
         file_path = job_result.get("data", {}).get("file_path")
         if verbose:
             print(f"Export file at: {file_path or download_url}")
         output_path = self._download_export_file(download_url, output_path, format, verbose)
+        if cache_paths:
+            cache_key = job_result.get("cache_key") or job_result.get("data", {}).get("cache_key")
+            output_path = _store_export_cache(output_path, cache_key, *cache_paths)
         job_result["path"] = output_path
 
         # Add cache info to result
@@ -593,6 +1106,34 @@ class TurboBulkClient:
             verbose=False,
         )
 
+    def _export_cache_paths(
+        self,
+        model: str,
+        filters: Optional[Dict[str, Any]],
+        fields: Optional[List[str]],
+        include_custom_fields: bool,
+        include_tags: bool,
+        format: str,
+    ) -> Tuple[Path, Path]:
+        """Local cache file and metadata paths for an export request."""
+        request = json.dumps(
+            [
+                self.base_url,
+                model,
+                filters or {},
+                fields or [],
+                include_custom_fields,
+                include_tags,
+                format,
+            ],
+            sort_keys=True,
+            default=str,
+        )
+        key = hashlib.blake2b(request.encode(), digest_size=16).hexdigest()
+        suffix = ".jsonl.gz" if format == "jsonl" else ".parquet"
+        cache_dir = cast(Path, self.cache_dir)
+        return cache_dir / f"{key}{suffix}", cache_dir / f"{key}.meta.json"
+
     def _download_export_file(
         self,
         url: str,
@@ -600,18 +1141,13 @@ class TurboBulkClient:
         format: str,
         verbose: bool,
     ) -> Path:
-        """Download an export file from URL."""
-        import tempfile
-
+        """Download an export file from URL, streaming it to disk."""
         if url.startswith("/"):
             url = f"{self.base_url}{url}"
 
         if verbose:
             print(f"Downloading export file...")
 
-        download_response = self.session.get(url)
-        self._raise_for_status(download_response)
-
         if output_path is None:
             suffix = ".jsonl.gz" if format == "jsonl" else ".parquet"
             fd, temp_path = tempfile.mkstemp(suffix=suffix)
@@ -620,8 +1156,19 @@ class TurboBulkClient:
         else:
             final_path = Path(output_path)
 
-        with open(final_path, "wb") as f:
-            f.write(download_response.content)
+        # Stream to disk so memory use does not grow with the export size
+        if self.http2_client is not None:
+            with self.http2_client.stream("GET", url) as download_response:
+                self._raise_for_status(download_response)
+                with open(final_path, "wb") as f:
+                    for chunk in download_response.iter_bytes(_DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
+        else:
+            with self.session.get(url, stream=True) as download_response:
+                self._raise_for_status(download_response)
+                with open(final_path, "wb") as f:
+                    for chunk in download_response.iter_content(chunk_size=_DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
 
         if verbose:
             print(f"Saved to: {final_path}")
@@ -638,9 +1185,34 @@ class TurboBulkClient:
         Returns:
             Job status dict
         """
-        response = self.session.get(f"{self.api_base}/jobs/{job_id}/")
+        result, _ = self._poll_job_status(job_id)
+        return cast(Dict[Any, Any], result)
+
+    def _poll_job_status(
+        self, job_id: str, etag: Optional[str] = None, brief: bool = False
+    ) -> Tuple[Optional[Dict], Optional[str]]:
+        """
+        Fetch job status, sending If-None-Match when an ETag is known.
+
+        With brief=True only the status field is requested (?fields=status);
+        use _finished_status() to get the full payload once the job is done.
+
+        Returns:
+            (status dict, ETag) tuple; the dict is None when the server
+            answered 304 Not Modified
+        """
+        headers = {"If-None-Match": etag} if etag else None
+        params = {"fields": "status"} if brief else None
+        response = self._get(f"{self._urls['jobs']}{job_id}/", params=params, headers=headers)
+        if response.status_code == 304:
+            return None, etag
         self._raise_for_status(response)
-        return cast(Dict[Any, Any], response.json())
+        return _response_json(response), response.headers.get("ETag")
+
+    def _finished_status(self, job_id: str, result: Dict) -> Dict:
+        """Full status of a finished job whose last poll was brief."""
+        # Servers that ignore ?fields= have already sent the full payload
+        return result if "data" in result else self.get_job_status(job_id)
 
     def _wait_for_job(
         self,
@@ -649,22 +1221,40 @@ class TurboBulkClient:
         timeout: int = 3600,
         verbose: bool = True,
         operation: str = "operation",
+        max_poll_interval: float = 30.0,
     ) -> Dict:
-        """Wait for a job to complete."""
+        """
+        Wait for a job to complete.
+
+        Polls start every poll_interval seconds and back off towards
+        max_poll_interval while the status stays the same; any status change
+        resets the interval so transitions are still reported promptly.
+        """
         start_time = time.time()
         last_status = None
+        result: Dict[Any, Any] = {}
+        etag = None
+        unchanged_polls = 0
 
         while True:
             elapsed = time.time() - start_time
             if elapsed > timeout:
                 raise TurboBulkError(f"Job {job_id} timed out after {timeout}s")
 
-            result = self.get_job_status(job_id)
+            polled, etag = self._poll_job_status(job_id, etag, brief=True)
+            if polled is not None:
+                result = polled
             status = result.get("status")
+            if status in _FINISHED_STATUSES:
+                result = self._finished_status(job_id, result)
 
-            if verbose and status != last_status:
-                print(f"[{elapsed:.1f}s] {operation}: {status}")
+            if status != last_status:
+                if verbose:
+                    print(f"[{elapsed:.1f}s] {operation}: {status}")
                 last_status = status
+                unchanged_polls = 0
+            else:
+                unchanged_polls += 1
 
             if status == "completed":
                 if verbose:
@@ -677,7 +1267,9 @@ class TurboBulkClient:
                 error_msg = result.get("data", {}).get("error", "Unknown error")
                 raise JobFailedError(f"Job failed: {error_msg}", result)
 
-            time.sleep(poll_interval)
+            time.sleep(
+                _poll_delay(poll_interval, unchanged_polls, max_poll_interval, timeout - elapsed)
+            )
 
     # Convenience methods for NetBox REST API queries
 
@@ -694,9 +1286,9 @@ class TurboBulkClient:
         """
         if not endpoint.startswith("/"):
             endpoint = f"/{endpoint}"
-        response = self.session.get(f"{self.base_url}{endpoint}", params=params)
+        response = self._get(f"{self.base_url}{endpoint}", params=params)
         self._raise_for_status(response)
-        return cast(Dict[Any, Any], response.json())
+        return cast(Dict[Any, Any], _response_json(response))
 
     def rest_get_all(self, endpoint: str, params: Optional[Dict] = None) -> List[Dict]:
         """
@@ -709,23 +1301,33 @@ class TurboBulkClient:
         Returns:
             List of all result objects
         """
-        params = params or {}
-        params["limit"] = 1000
-        results = []
-
-        while True:
-            data = self.rest_get(endpoint, params)
-            results.extend(data.get("results", []))
-
-            next_url = data.get("next")
-            if not next_url:
-                break
-
-            from urllib.parse import parse_qs, urlparse
-
-            parsed = urlparse(next_url)
-            next_params = parse_qs(parsed.query)
-            params["offset"] = next_params.get("offset", [0])[0]
+        params = {**(params or {}), "limit": 1000}
+        data = self.rest_get(endpoint, params)
+        results = list(data.get("results", []))
+
+        # The next link carries the page size the server actually applied
+        step = _next_offset(data.get("next"))
+        if step is None:
+            return results
+
+        count = data.get("count")
+        if count is None:
+            # No total to plan from; follow next links one page at a time
+            offset: Optional[int] = step
+            while offset is not None:
+                data = self.rest_get(endpoint, {**params, "offset": offset})
+                results.extend(data.get("results", []))
+                offset = _next_offset(data.get("next"))
+            return results
+
+        # Every remaining offset is known up front; fetch them concurrently
+        with ThreadPoolExecutor(max_workers=_PAGE_WORKERS) as executor:
+            pages = executor.map(
+                lambda offset: self.rest_get(endpoint, {**params, "offset": offset}),
+                range(step, int(count), step),
+            )
+            for page in pages:
+                results.extend(page.get("results", []))
 
         return results
 
@@ -742,10 +1344,13 @@ class TurboBulkClient:
         Returns:
             ContentType ID
         """
-        data = self.rest_get(
-            "/api/core/object-types/", params={"app_label": app_label, "model": model}
-        )
-        results = data.get("results", [])
-        if not results:
-            raise TurboBulkError(f"ContentType not found: {app_label}.{model}")
-        return cast(int, results[0]["id"])
+        key = (app_label, model)
+        if key not in self._content_type_cache:
+            data = self.rest_get(
+                "/api/core/object-types/", params={"app_label": app_label, "model": model}
+            )
+            results = data.get("results", [])
+            if not results:
+                raise TurboBulkError(f"ContentType not found: {app_label}.{model}")
+            self._content_type_cache[key] = cast(int, results[0]["id"])
+        return self._content_type_cache[key]
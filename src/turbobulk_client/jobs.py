@@ -0,0 +1,182 @@
+"""
+Shared job status polling.
+
+A JobWaiter polls any number of in-flight jobs from one background thread
+over the client's pooled connection, instead of running one wait loop per job.
+"""
+
+import threading
+import time
+from concurrent.futures import Future, InvalidStateError
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from .client import _FINISHED_STATUSES, TurboBulkClient, _poll_delay
+from .exceptions import JobFailedError, TurboBulkError
+
+
+@dataclass
+class _WatchedJob:
+    job_id: str
+    future: "Future[Dict[Any, Any]]"
+    timeout: float
+    deadline: float
+    next_poll: float
+    etag: Optional[str] = None
+    status: Optional[str] = None
+    unchanged_polls: int = 0
+    result: Dict[Any, Any] = field(default_factory=dict)
+
+
+class JobWaiter:
+    """
+    Wait for many TurboBulk jobs with a single polling thread.
+
+    Each watched job gets a Future that resolves to the job's final status
+    dict, or raises JobFailedError / TurboBulkError (timeout). Jobs are polled
+    with the same backoff and ETag handling as TurboBulkClient's own waits.
+
+    Example:
+        with JobWaiter(client) as waiter:
+            futures = [
+                waiter.watch(client.load(model, path, wait=False)["job_id"])
+                for model, path in files
+            ]
+            results = [future.result() for future in futures]
+    """
+
+    def __init__(
+        self,
+        client: TurboBulkClient,
+        poll_interval: float = 1.0,
+        max_poll_interval: float = 30.0,
+    ):
+        """
+        Initialize the waiter.
+
+        Args:
+            client: Client used to fetch job status
+            poll_interval: Seconds between polls of a job whose status just changed
+            max_poll_interval: Upper bound for the backed-off poll interval
+        """
+        self.client = client
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        self._jobs: Dict[str, _WatchedJob] = {}
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    def watch(self, job_id: str, timeout: float = 3600) -> "Future[Dict[Any, Any]]":
+        """
+        Start polling a job.
+
+        Args:
+            job_id: Job UUID returned by load(), delete() or export() with wait=False
+            timeout: Max seconds to wait for the job to finish
+
+        Returns:
+            Future resolving to the completed job's status dict; watching a job
+            that is already being polled returns its existing Future
+        """
+        now = time.monotonic()
+        job = _WatchedJob(job_id, Future(), timeout, deadline=now + timeout, next_poll=now)
+        with self._condition:
+            if self._closed:
+                raise TurboBulkError("JobWaiter is closed")
+            if job_id in self._jobs:
+                return self._jobs[job_id].future
+            self._jobs[job_id] = job
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="turbobulk-job-waiter", daemon=True
+                )
+                self._thread.start()
+            self._condition.notify()
+        return job.future
+
+    def wait_all(self, job_ids: List[str], timeout: float = 3600) -> List[Dict[Any, Any]]:
+        """Watch several jobs and return their final status dicts in order."""
+        futures = [self.watch(job_id, timeout) for job_id in job_ids]
+        return [future.result() for future in futures]
+
+    def close(self) -> None:
+        """Stop polling; futures of jobs still running are cancelled."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        if self._thread is not None:
+            self._thread.join()
+        for job in self._jobs.values():
+            job.future.cancel()
+        self._jobs.clear()
+
+    def __enter__(self) -> "JobWaiter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._closed:
+                    now = time.monotonic()
+                    due = [job for job in self._jobs.values() if job.next_poll <= now]
+                    if due:
+                        break
+                    next_poll = min((job.next_poll for job in self._jobs.values()), default=None)
+                    self._condition.wait(None if next_poll is None else next_poll - now)
+                if self._closed:
+                    return
+
+            for job in due:
+                try:
+                    done = self._poll(job)
+                except InvalidStateError:  # cancelled by the caller mid-poll
+                    done = True
+                if done:
+                    with self._condition:
+                        if self._jobs.get(job.job_id) is job:
+                            del self._jobs[job.job_id]
+
+    def _poll(self, job: _WatchedJob) -> bool:
+        """Poll one job; returns True once its future has been resolved."""
+        if job.future.cancelled():
+            return True
+        now = time.monotonic()
+        if now > job.deadline:
+            job.future.set_exception(
+                TurboBulkError(f"Job {job.job_id} timed out after {job.timeout}s")
+            )
+            return True
+
+        try:
+            polled, job.etag = self.client._poll_job_status(job.job_id, job.etag, brief=True)
+            if polled is not None:
+                job.result = polled
+            status = job.result.get("status")
+            if status in _FINISHED_STATUSES:
+                job.result = self.client._finished_status(job.job_id, job.result)
+        except Exception as e:
+            job.future.set_exception(e)
+            return True
+
+        if status != job.status:
+            job.status = status
+            job.unchanged_polls = 0
+        else:
+            job.unchanged_polls += 1
+
+        if status == "completed":
+            job.future.set_result(job.result)
+            return True
+        if status == "errored" or status == "failed":
+            error_msg = job.result.get("data", {}).get("error", "Unknown error")
+            job.future.set_exception(JobFailedError(f"Job failed: {error_msg}", job.result))
+            return True
+
+        job.next_poll = now + _poll_delay(
+            self.poll_interval, job.unchanged_polls, self.max_poll_interval, job.deadline - now
+        )
+        return False
@@ -4,14 +4,60 @@ Tests for TurboBulkClient.
 Uses unittest.mock to mock HTTP requests without requiring a running server.
 """
 
+import asyncio
+import gzip
 import json
+import os
+import shutil
+import socket
 import tempfile
+import threading
 import unittest
 from pathlib import Path
-from unittest.mock import MagicMock, patch
-
-from turbobulk_client import TurboBulkClient
-from turbobulk_client.exceptions import AuthenticationError, TurboBulkError
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+import requests
+
+from turbobulk_client import (
+    AsyncTurboBulkClient,
+    JobWaiter,
+    TurboBulkClient,
+    get_shared_session,
+)
+from turbobulk_client.client import _TYPE_DEFAULTS, _json_dumps, _response_json
+from turbobulk_client.exceptions import AuthenticationError, JobFailedError, TurboBulkError
+
+# Response attributes the client reads; MagicMock(spec=...) creates only these
+RESPONSE_ATTRS = ["status_code", "headers", "content", "json", "raise_for_status"]
+
+# Small committed data files for the upload tests (see tests/fixtures/)
+FIXTURES = Path(__file__).parent / "fixtures"
+NAME_PARQUET = FIXTURES / "one_row_name.parquet"
+ID_PARQUET = FIXTURES / "three_ids.parquet"
+
+
+def _stub_response(body):
+    """Cheap stand-in for a successful requests.Response with a JSON body."""
+    return SimpleNamespace(
+        status_code=200,
+        content=json.dumps(body).encode(),
+        json=lambda: body,
+        raise_for_status=lambda: None,
+    )
+
+
+def _schema_field(name, field_type, primary_key=False, nullable=False, default=None, **extra):
+    """Build a field entry as returned by the model schema endpoint."""
+    return {
+        "name": name,
+        "type": field_type,
+        "primary_key": primary_key,
+        "nullable": nullable,
+        "default": default,
+        **extra,
+    }
 
 
 class TestClientInitialization(unittest.TestCase):
@@ -28,79 +74,178 @@ class TestClientInitialization(unittest.TestCase):
         client = TurboBulkClient("http://netbox:8080/", "test-token")
         self.assertEqual(client.base_url, "http://netbox:8080")
 
+    def _set_env(self, **values):
+        """Set (or, for None, unset) environment variables until the test ends."""
+        for key, value in values.items():
+            saved = os.environ.get(key)
+            if saved is None:
+                self.addCleanup(os.environ.pop, key, None)
+            else:
+                self.addCleanup(os.environ.__setitem__, key, saved)
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
     def test_init_from_env_vars(self):
         """Initialize client from environment variables."""
-        with patch.dict(
-            "os.environ", {"NETBOX_URL": "http://env-netbox:8080", "NETBOX_TOKEN": "env-token"}
-        ):
-            client = TurboBulkClient()
-            self.assertEqual(client.base_url, "http://env-netbox:8080")
-            self.assertEqual(client.token, "env-token")
+        self._set_env(NETBOX_URL="http://env-netbox:8080", NETBOX_TOKEN="env-token")
+        client = TurboBulkClient()
+        self.assertEqual(client.base_url, "http://env-netbox:8080")
+        self.assertEqual(client.token, "env-token")
 
     def test_init_missing_url_raises(self):
         """Missing URL raises TurboBulkError."""
-        with patch.dict("os.environ", {}, clear=True):
-            with self.assertRaises(TurboBulkError) as ctx:
-                TurboBulkClient(token="test-token")
-            self.assertIn("URL required", str(ctx.exception))
+        self._set_env(NETBOX_URL=None)
+        with self.assertRaises(TurboBulkError) as ctx:
+            TurboBulkClient(token="test-token")
+        self.assertIn("URL required", str(ctx.exception))
 
     def test_init_missing_token_raises(self):
         """Missing token raises TurboBulkError."""
-        with patch.dict("os.environ", {}, clear=True):
+        self._set_env(NETBOX_TOKEN=None)
+        with self.assertRaises(TurboBulkError) as ctx:
+            TurboBulkClient(base_url="http://netbox:8080")
+        self.assertIn("token required", str(ctx.exception))
+
+    def test_shared_adapter_enables_tcp_keepalive(self):
+        """Pooled sockets are opened with SO_KEEPALIVE."""
+        adapter = get_shared_session().get_adapter("https://netbox:8080")
+        socket_options = adapter.poolmanager.connection_pool_kw["socket_options"]
+        self.assertIn((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1), socket_options)
+
+    def test_http2_requires_httpx(self):
+        """http2=True without httpx installed raises TurboBulkError."""
+        with patch("turbobulk_client.client.httpx", None):
             with self.assertRaises(TurboBulkError) as ctx:
-                TurboBulkClient(base_url="http://netbox:8080")
-            self.assertIn("token required", str(ctx.exception))
+                TurboBulkClient("http://netbox:8080", "test-token", http2=True)
+        self.assertIn("httpx", str(ctx.exception))
+
+    def test_http2_routes_gets_through_httpx(self):
+        """With http2=True, GETs use the httpx client and uploads keep the session."""
+        fake_httpx = MagicMock(Response=type("Response", (), {}))
+        response = MagicMock(spec=RESPONSE_ATTRS, status_code=200, content=b"[]")
+        response.json.return_value = []
+        fake_httpx.Client.return_value.get.return_value = response
+
+        with patch("turbobulk_client.client.httpx", fake_httpx):
+            client = TurboBulkClient("http://netbox:8080", "test-token", http2=True)
+            with patch.object(client.session, "get") as session_get:
+                client.get_models()
+
+        fake_httpx.HTTPTransport.assert_called_once()
+        self.assertTrue(fake_httpx.HTTPTransport.call_args.kwargs["http2"])
+        fake_httpx.Client.return_value.get.assert_called_once()
+        session_get.assert_not_called()
+
+    def test_http2_errors_carry_a_response(self):
+        """HTTP errors over httpx raise requests.HTTPError with e.response filled in."""
+
+        class FakeResponse:
+            status_code = 503
+            reason_phrase = "Service Unavailable"
+            url = "http://netbox:8080/api/plugins/turbobulk/models/"
+            headers = {"Retry-After": "5"}
+            is_error = True
+
+            def read(self):
+                return b"busy"
+
+        fake_httpx = MagicMock(Response=FakeResponse)
+        fake_httpx.Client.return_value.get.return_value = FakeResponse()
+
+        with patch("turbobulk_client.client.httpx", fake_httpx):
+            client = TurboBulkClient("http://netbox:8080", "test-token", http2=True)
+            with self.assertRaises(requests.HTTPError) as ctx:
+                client.get_models()
+
+        self.assertIn("503 Error", str(ctx.exception))
+        self.assertEqual(ctx.exception.response.status_code, 503)
+        self.assertEqual(ctx.exception.response.headers["retry-after"], "5")
+        self.assertEqual(ctx.exception.response.content, b"busy")
+
+    def test_clients_share_connection_pool_not_credentials(self):
+        """Clients reuse the shared adapters but keep their own Authorization header."""
+        first = TurboBulkClient("http://netbox:8080", "token-a")
+        second = TurboBulkClient("http://netbox:8080", "nbt_token-b")
+        self.assertIsNot(first.session, second.session)
+        self.assertIs(
+            first.session.get_adapter("https://netbox/"),
+            get_shared_session().get_adapter("https://netbox/"),
+        )
+        self.assertEqual(first.session.headers["Authorization"], "Token token-a")
+        self.assertEqual(second.session.headers["Authorization"], "Bearer nbt_token-b")
+        self.assertNotIn("Authorization", get_shared_session().headers)
+
+    def test_close_leaves_shared_pool_open(self):
+        """close() on a pooled client does not close adapters other clients use."""
+        client = TurboBulkClient("http://netbox:8080", "test-token")
+        with patch.object(get_shared_session().get_adapter("https://netbox/"), "close") as close:
+            client.close()
+        close.assert_not_called()
+
+        own_session = MagicMock()
+        TurboBulkClient("http://netbox:8080", "test-token", session=own_session).close()
+        own_session.close.assert_called_once()
+
+    def test_shared_adapter_retries_gateway_errors_for_get_only(self):
+        """Gateway errors are retried for GET, never for uploads (POST)."""
+        retry = get_shared_session().get_adapter("https://netbox/").max_retries
+        self.assertIn(503, retry.status_forcelist)
+        self.assertIn("GET", retry.allowed_methods)
+        self.assertNotIn("POST", retry.allowed_methods)
 
 
 class TestGetTemplate(unittest.TestCase):
     """Tests for get_template() method."""
 
-    def setUp(self):
-        self.client = TurboBulkClient("http://netbox:8080", "test-token")
+    _ID_FIELD = _schema_field("id", "AutoField", primary_key=True)
+    _NAME_FIELD = _schema_field("name", "CharField")
+    _DESCRIPTION_FIELD = _schema_field("description", "TextField", nullable=True, default="")
+
+    _SITE_SCHEMA = {
+        "fields": [
+            _ID_FIELD,
+            _NAME_FIELD,
+            _schema_field("slug", "SlugField"),
+            _schema_field("status", "CharField", default="active"),
+            _DESCRIPTION_FIELD,
+        ]
+    }
+    _SCHEMA_WITH_OPTIONAL = {"fields": [_ID_FIELD, _NAME_FIELD, _DESCRIPTION_FIELD]}
+    _SCHEMA_WITH_FK = {
+        "fields": [
+            _ID_FIELD,
+            _NAME_FIELD,
+            _schema_field("site", "ForeignKey", foreign_key="dcim.site"),
+        ]
+    }
+    _SCHEMA_TYPED_DEFAULTS = {
+        "fields": [
+            _NAME_FIELD,
+            _schema_field("count", "IntegerField"),
+            _schema_field("active", "BooleanField"),
+            _schema_field("data", "JSONField"),
+            _schema_field("rate", "DecimalField"),
+        ]
+    }
+    _SCHEMA_UNLISTED_TYPES = {
+        "fields": [
+            {"name": "mac", "type": "MACAddressCharField", "nullable": False},
+            {"name": "weight", "type": "PositiveDecimalField", "nullable": False},
+            {"name": "site", "type": "ForeignKey", "nullable": False},
+            {"name": "data", "type": "JSONField", "nullable": False},
+        ]
+    }
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.client = TurboBulkClient("http://netbox:8080", "test-token")
 
     def test_get_template_returns_required_fields_only(self):
         """get_template() returns only required fields by default."""
-        mock_schema = {
-            "fields": [
-                {
-                    "name": "id",
-                    "type": "AutoField",
-                    "primary_key": True,
-                    "nullable": False,
-                    "default": None,
-                },
-                {
-                    "name": "name",
-                    "type": "CharField",
-                    "primary_key": False,
-                    "nullable": False,
-                    "default": None,
-                },
-                {
-                    "name": "slug",
-                    "type": "SlugField",
-                    "primary_key": False,
-                    "nullable": False,
-                    "default": None,
-                },
-                {
-                    "name": "status",
-                    "type": "CharField",
-                    "primary_key": False,
-                    "nullable": False,
-                    "default": "active",
-                },
-                {
-                    "name": "description",
-                    "type": "TextField",
-                    "primary_key": False,
-                    "nullable": True,
-                    "default": "",
-                },
-            ]
-        }
-
-        with patch.object(self.client, "get_model_schema", return_value=mock_schema):
+        with patch.object(self.client, "get_model_schema", return_value=self._SITE_SCHEMA):
             template = self.client.get_template("dcim.site")
 
         # Should include required fields without defaults
@@ -113,33 +258,7 @@ class TestGetTemplate(unittest.TestCase):
 
     def test_get_template_with_include_optional(self):
         """get_template(include_optional=True) includes all fields."""
-        mock_schema = {
-            "fields": [
-                {
-                    "name": "id",
-                    "type": "AutoField",
-                    "primary_key": True,
-                    "nullable": False,
-                    "default": None,
-                },
-                {
-                    "name": "name",
-                    "type": "CharField",
-                    "primary_key": False,
-                    "nullable": False,
-                    "default": None,
-                },
-                {
-                    "name": "description",
-                    "type": "TextField",
-                    "primary_key": False,
-                    "nullable": True,
-                    "default": "",
-                },
-            ]
-        }
-
-        with patch.object(self.client, "get_model_schema", return_value=mock_schema):
+        with patch.object(self.client, "get_model_schema", return_value=self._SCHEMA_WITH_OPTIONAL):
             template = self.client.get_template("dcim.site", include_optional=True)
 
         # Should include optional field
@@ -149,323 +268,689 @@ class TestGetTemplate(unittest.TestCase):
 
     def test_get_template_fk_uses_id_suffix(self):
         """FK fields use _id suffix in template."""
-        mock_schema = {
-            "fields": [
-                {
-                    "name": "id",
-                    "type": "AutoField",
-                    "primary_key": True,
-                    "nullable": False,
-                    "default": None,
-                },
-                {
-                    "name": "name",
-                    "type": "CharField",
-                    "primary_key": False,
-                    "nullable": False,
-                    "default": None,
-                },
-                {
-                    "name": "site",
-                    "type": "ForeignKey",
-                    "primary_key": False,
-                    "nullable": False,
-                    "default": None,
-                    "foreign_key": "dcim.site",
-                },
-            ]
-        }
-
-        with patch.object(self.client, "get_model_schema", return_value=mock_schema):
+        with patch.object(self.client, "get_model_schema", return_value=self._SCHEMA_WITH_FK):
             template = self.client.get_template("dcim.device")
 
         # FK should use _id suffix
         self.assertIn("site_id", template)
         self.assertNotIn("site", template)
 
-    def test_get_template_skips_primary_key(self):
-        """Primary key field is not included in template."""
-        mock_schema = {
-            "fields": [
-                {
-                    "name": "id",
-                    "type": "AutoField",
-                    "primary_key": True,
-                    "nullable": False,
-                    "default": None,
-                },
-                {
-                    "name": "name",
-                    "type": "CharField",
-                    "primary_key": False,
-                    "nullable": False,
-                    "default": None,
-                },
-            ]
-        }
+    def test_get_template_generates_correct_defaults_by_type(self):
+        """Template generates appropriate default values by field type."""
+        with patch.object(
+            self.client, "get_model_schema", return_value=self._SCHEMA_TYPED_DEFAULTS
+        ):
+            template = self.client.get_template("test.model")
 
-        with patch.object(self.client, "get_model_schema", return_value=mock_schema):
-            template = self.client.get_template("dcim.site")
+        expected_defaults = [
+            ("name", ""),
+            ("count", 0),
+            ("active", False),
+            ("data", {}),
+            ("rate", 0.0),
+        ]
+        for name, expected in expected_defaults:
+            with self.subTest(field=name):
+                self.assertEqual(template[name], expected)
+
+    def test_get_template_resolves_unlisted_types_by_substring(self):
+        """Types outside the lookup table fall back to substring matching."""
+        with patch.object(
+            self.client, "get_model_schema", return_value=self._SCHEMA_UNLISTED_TYPES
+        ):
+            first = self.client.get_template("test.model")
+            second = self.client.get_template("test.model")
 
-        self.assertNotIn("id", template)
+        self.assertEqual(first["mac"], "")
+        self.assertEqual(first["weight"], 0.0)
+        self.assertIsNone(first["site"])
+        # Mutable defaults are not shared between templates
+        self.assertIsNot(first["data"], second["data"])
+        # Resolved types are cached separately; the lookup table stays unchanged
+        self.assertNotIn("MACAddressCharField", _TYPE_DEFAULTS)
 
-    def test_get_template_generates_correct_defaults_by_type(self):
-        """Template generates appropriate default values by field type."""
-        mock_schema = {
-            "fields": [
-                {
-                    "name": "name",
-                    "type": "CharField",
-                    "primary_key": False,
-                    "nullable": False,
-                    "default": None,
-                },
-                {
-                    "name": "count",
-                    "type": "IntegerField",
-                    "primary_key": False,
-                    "nullable": False,
-                    "default": None,
-                },
-                {
-                    "name": "active",
-                    "type": "BooleanField",
-                    "primary_key": False,
-                    "nullable": False,
-                    "default": None,
-                },
-                {
-                    "name": "data",
-                    "type": "JSONField",
-                    "primary_key": False,
-                    "nullable": False,
-                    "default": None,
-                },
-                {
-                    "name": "rate",
-                    "type": "DecimalField",
-                    "primary_key": False,
-                    "nullable": False,
-                    "default": None,
-                },
-            ]
-        }
 
-        with patch.object(self.client, "get_model_schema", return_value=mock_schema):
-            template = self.client.get_template("test.model")
+class TestSchemaCache(unittest.TestCase):
+    """Tests for schema, model list and content type caching."""
+
+    def setUp(self):
+        self.client = TurboBulkClient("http://netbox:8080", "test-token")
 
-        self.assertEqual(template["name"], "")
-        self.assertEqual(template["count"], 0)
-        self.assertEqual(template["active"], False)
-        self.assertEqual(template["data"], {})
-        self.assertEqual(template["rate"], 0.0)
+    def test_model_schema_fetched_once_per_model(self):
+        """get_model_schema() reuses the cached schema until invalidated."""
+        response = MagicMock(spec=RESPONSE_ATTRS, status_code=200)
+        response.json.return_value = {"fields": []}
+        response.content = json.dumps({"fields": []}).encode()
+
+        with patch.object(self.client.session, "get", return_value=response) as mock_get:
+            self.client.get_model_schema("dcim.site")
+            self.client.get_template("dcim.site")
+            self.client.get_model_schema("dcim.device")
+            self.assertEqual(mock_get.call_count, 2)
+
+            self.client.invalidate_schema_cache("dcim.site")
+            self.client.get_model_schema("dcim.site")
+            self.client.get_model_schema("dcim.device")
+            self.assertEqual(mock_get.call_count, 3)
+
+    def test_cached_results_are_copies(self):
+        """Modifying a returned schema or model list does not change the cache."""
+        response = MagicMock(spec=RESPONSE_ATTRS, status_code=200)
+        response.content = json.dumps({"fields": [{"name": "name"}]}).encode()
+
+        with patch.object(self.client.session, "get", return_value=response):
+            schema = self.client.get_model_schema("dcim.site")
+            schema["fields"].pop()
+            self.assertEqual(
+                self.client.get_model_schema("dcim.site"), {"fields": [{"name": "name"}]}
+            )
+
+            response.content = b'[{"app_label": "dcim"}]'
+            self.client.get_models().clear()
+            self.assertEqual(self.client.get_models(), [{"app_label": "dcim"}])
+
+    def test_models_and_content_types_cached(self):
+        """get_models() and get_content_type_id() hit the API once until a full invalidation."""
+        response = MagicMock(spec=RESPONSE_ATTRS, status_code=200)
+        response.json.return_value = {"results": [{"id": 7}]}
+        response.content = json.dumps({"results": [{"id": 7}]}).encode()
+
+        with patch.object(self.client.session, "get", return_value=response) as mock_get:
+            self.client.get_models()
+            self.client.get_models()
+            self.assertEqual(self.client.get_content_type_id("dcim", "interface"), 7)
+            self.assertEqual(self.client.get_content_type_id("dcim", "interface"), 7)
+            self.assertEqual(mock_get.call_count, 2)
+
+            self.client.invalidate_schema_cache()
+            self.client.get_models()
+            self.client.get_content_type_id("dcim", "interface")
+            self.assertEqual(mock_get.call_count, 4)
 
 
 class TestValidate(unittest.TestCase):
     """Tests for validate() method."""
 
-    def setUp(self):
-        self.client = TurboBulkClient("http://netbox:8080", "test-token")
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.client = TurboBulkClient("http://netbox:8080", "test-token")
+
+    def _spy_on_load(self):
+        """Replace client.load with a recorder for this test; returns the call list."""
+        calls = []
+
+        def load(*args, **kwargs):
+            calls.append((args, kwargs))
+            return {"valid": True, "rows": 1}
+
+        self.client.load = load
+        self.addCleanup(delattr, self.client, "load")
+        return calls
 
     def test_validate_calls_load_with_dry_run_true(self):
         """validate() is wrapper around load(dry_run=True)."""
-        with tempfile.NamedTemporaryFile(suffix=".parquet", delete=False) as f:
-            # Write minimal valid parquet
-            import pyarrow as pa
-            import pyarrow.parquet as pq
+        calls = self._spy_on_load()
+        result = self.client.validate("dcim.site", NAME_PARQUET)
 
-            table = pa.table({"name": ["test"]})
-            pq.write_table(table, f.name)
-            parquet_path = Path(f.name)
-
-        try:
-            with patch.object(self.client, "load") as mock_load:
-                mock_load.return_value = {"valid": True, "rows": 1}
-                result = self.client.validate("dcim.site", parquet_path)
-
-            # Verify load was called with dry_run=True
-            mock_load.assert_called_once()
-            call_kwargs = mock_load.call_args.kwargs
-            self.assertTrue(call_kwargs.get("dry_run"))
-        finally:
-            parquet_path.unlink()
+        # Verify load was called once with dry_run=True
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(calls[0][1].get("dry_run"))
+        self.assertEqual(result, {"valid": True, "rows": 1})
 
     def test_validate_passes_all_parameters(self):
         """validate() passes mode and conflict_fields to load()."""
-        with tempfile.NamedTemporaryFile(suffix=".parquet", delete=False) as f:
-            import pyarrow as pa
-            import pyarrow.parquet as pq
+        calls = self._spy_on_load()
+        self.client.validate(
+            "dcim.device",
+            NAME_PARQUET,
+            mode="upsert",
+            conflict_fields=["name", "site"],
+        )
 
-            table = pa.table({"name": ["test"]})
-            pq.write_table(table, f.name)
-            parquet_path = Path(f.name)
+        call_kwargs = calls[0][1]
+        self.assertEqual(call_kwargs["mode"], "upsert")
+        self.assertEqual(call_kwargs["conflict_fields"], ["name", "site"])
+        self.assertTrue(call_kwargs["dry_run"])
 
-        try:
-            with patch.object(self.client, "load") as mock_load:
-                mock_load.return_value = {"valid": True, "rows": 1}
-                self.client.validate(
-                    "dcim.device",
-                    parquet_path,
-                    mode="upsert",
-                    conflict_fields=["name", "site"],
-                )
 
-            call_kwargs = mock_load.call_args.kwargs
-            self.assertEqual(call_kwargs["mode"], "upsert")
-            self.assertEqual(call_kwargs["conflict_fields"], ["name", "site"])
-            self.assertTrue(call_kwargs["dry_run"])
+@pytest.mark.slow
+class _DryRunTestBase(unittest.TestCase):
+    """Shared setup for the load()/delete() dry_run tests."""
+
+    verb: str
+    data_path: Path
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.client = TurboBulkClient("http://netbox:8080", "test-token")
+
+    def setUp(self):
+        # Form fields are inspected via data=, so pin the non-streaming upload path
+        encoder_patch = patch("turbobulk_client.client.MultipartEncoder", None)
+        encoder_patch.start()
+        self.addCleanup(encoder_patch.stop)
+
+    def _invoke_and_capture(self, **kwargs):
+        """Call the client method with stubbed HTTP; returns (form_data, _wait_for_job kwargs)."""
+        captured = {}
+
+        def post(url, **post_kwargs):
+            captured["data"] = post_kwargs["data"]
+            return _stub_response({"job_id": "test-job-id"})
+
+        def wait_for_job(job_id, **wait_kwargs):
+            captured["wait"] = wait_kwargs
+            return {"valid": True}
+
+        self.client.session.post = post
+        self.client._wait_for_job = wait_for_job
+        try:
+            getattr(self.client, self.verb)("dcim.site", self.data_path, **kwargs)
         finally:
-            parquet_path.unlink()
+            del self.client.session.post
+            del self.client._wait_for_job
+
+        return captured["data"], captured["wait"]
 
 
-class TestLoadDryRun(unittest.TestCase):
+class TestLoadDryRun(_DryRunTestBase):
     """Tests for load() with dry_run parameter."""
 
+    verb = "load"
+    data_path = NAME_PARQUET
+
+    def test_load_dry_run_form_data_and_label(self):
+        """load(dry_run=True) sends dry_run and labels the job; plain load() sends neither."""
+        form_data, wait_kwargs = self._invoke_and_capture(dry_run=True)
+        self.assertEqual(form_data.get("dry_run"), "true")
+        self.assertIn("dry-run", wait_kwargs["operation"])
+
+        form_data, wait_kwargs = self._invoke_and_capture()
+        self.assertNotIn("dry_run", form_data)
+        self.assertNotIn("dry-run", wait_kwargs["operation"])
+
+
+class TestDeleteDryRun(_DryRunTestBase):
+    """Tests for delete() with dry_run parameter."""
+
+    verb = "delete"
+    data_path = ID_PARQUET
+
+    def test_delete_dry_run_form_data_and_label(self):
+        """delete(dry_run=True) sends dry_run and labels the job; plain delete() sends neither."""
+        form_data, wait_kwargs = self._invoke_and_capture(dry_run=True)
+        self.assertEqual(form_data.get("dry_run"), "true")
+        self.assertIn("dry-run", wait_kwargs["operation"])
+
+        form_data, wait_kwargs = self._invoke_and_capture()
+        self.assertNotIn("dry_run", form_data)
+        self.assertNotIn("dry-run", wait_kwargs["operation"])
+
+
+@pytest.mark.slow
+class TestUpload(unittest.TestCase):
+    """Tests for multipart uploads."""
+
     def setUp(self):
         self.client = TurboBulkClient("http://netbox:8080", "test-token")
+        with tempfile.NamedTemporaryFile(suffix=".jsonl", delete=False) as f:
+            f.write(b'{"name": "test"}\n')
+            self.data_path = Path(f.name)
+        self.addCleanup(self.data_path.unlink)
+
+    def test_load_and_delete_reject_missing_or_empty_files(self):
+        """Missing and empty data files fail before anything is uploaded."""
+        with tempfile.NamedTemporaryFile(suffix=".jsonl", delete=False) as f:
+            empty_path = Path(f.name)
+        self.addCleanup(empty_path.unlink)
+
+        with patch.object(self.client.session, "post") as mock_post:
+            with self.assertRaisesRegex(TurboBulkError, "empty"):
+                self.client.load("dcim.site", empty_path)
+            with self.assertRaisesRegex(TurboBulkError, "not found"):
+                self.client.delete("dcim.site", empty_path.with_suffix(".missing"))
+
+        mock_post.assert_not_called()
+
+    def test_load_and_delete_accept_str_paths(self):
+        """A plain string path is accepted and converted to a Path once."""
+        uploaded = []
+
+        def upload(endpoint, data, path):
+            uploaded.append(path)
+            return _stub_response({"job_id": "job-1"})
+
+        with patch.object(self.client, "_upload", side_effect=upload):
+            self.client.load("dcim.site", str(self.data_path), wait=False)
+            self.client.delete("dcim.site", str(self.data_path), wait=False)
+
+        self.assertEqual(uploaded, [self.data_path, self.data_path])
+
+    def test_upload_streams_with_multipart_encoder(self):
+        """With requests-toolbelt available the body is a streaming encoder."""
+        encoder_cls = MagicMock()
+        encoder_cls.return_value.content_type = "multipart/form-data; boundary=x"
+
+        with patch("turbobulk_client.client.MultipartEncoder", encoder_cls):
+            with patch.object(self.client.session, "post") as mock_post:
+                self.client._upload("load", {"model": "dcim.site"}, self.data_path)
+
+        fields = encoder_cls.call_args.kwargs["fields"]
+        self.assertEqual(fields["model"], "dcim.site")
+        self.assertEqual(fields["file"][0], self.data_path.name)
+        self.assertIs(mock_post.call_args.kwargs["data"], encoder_cls.return_value)
+        self.assertEqual(
+            mock_post.call_args.kwargs["headers"],
+            {"Content-Type": "multipart/form-data; boundary=x"},
+        )
+        self.assertNotIn("files", mock_post.call_args.kwargs)
 
-    def test_load_sends_dry_run_parameter_in_form_data(self):
-        """load(dry_run=True) sends dry_run in request form data."""
-        with tempfile.NamedTemporaryFile(suffix=".parquet", delete=False) as f:
-            import pyarrow as pa
-            import pyarrow.parquet as pq
+    def test_upload_falls_back_to_requests_files(self):
+        """Without requests-toolbelt the file is sent via requests' files=."""
+        with patch("turbobulk_client.client.MultipartEncoder", None):
+            with patch.object(self.client.session, "post") as mock_post:
+                self.client._upload("delete", {"model": "dcim.site"}, self.data_path)
 
-            table = pa.table({"name": ["test"]})
-            pq.write_table(table, f.name)
-            parquet_path = Path(f.name)
+        self.assertEqual(
+            mock_post.call_args.args[0], "http://netbox:8080/api/plugins/turbobulk/delete/"
+        )
+        self.assertEqual(mock_post.call_args.kwargs["data"], {"model": "dcim.site"})
+        self.assertIn("file", mock_post.call_args.kwargs["files"])
 
-        try:
-            mock_response = MagicMock()
-            mock_response.json.return_value = {"job_id": "test-job-id"}
-            mock_response.raise_for_status = MagicMock()
+    def test_upload_fallback_sends_mapped_file_contents(self):
+        """The fallback upload body holds the file contents."""
+        sent = []
 
-            with patch.object(self.client.session, "post", return_value=mock_response) as mock_post:
-                with patch.object(
-                    self.client, "_wait_for_job", return_value={"valid": True, "rows": 1}
-                ):
-                    self.client.load("dcim.site", parquet_path, dry_run=True)
-
-                # Check that dry_run was included in form data
-                call_args = mock_post.call_args
-                form_data = call_args.kwargs.get("data", {})
-                self.assertEqual(form_data.get("dry_run"), "true")
-        finally:
-            parquet_path.unlink()
+        def post(url, data, files):
+            sent.append(bytes(files["file"][1]))
+            return MagicMock(spec=RESPONSE_ATTRS)
 
-    def test_load_dry_run_false_by_default(self):
-        """load() does not send dry_run when not specified."""
-        with tempfile.NamedTemporaryFile(suffix=".parquet", delete=False) as f:
-            import pyarrow as pa
-            import pyarrow.parquet as pq
+        with patch("turbobulk_client.client.MultipartEncoder", None):
+            with patch.object(self.client.session, "post", side_effect=post):
+                self.client._upload("load", {}, self.data_path)
 
-            table = pa.table({"name": ["test"]})
-            pq.write_table(table, f.name)
-            parquet_path = Path(f.name)
+        self.assertEqual(sent, [b'{"name": "test"}\n'])
 
-        try:
-            mock_response = MagicMock()
-            mock_response.json.return_value = {"job_id": "test-job-id"}
-            mock_response.raise_for_status = MagicMock()
-
-            with patch.object(self.client.session, "post", return_value=mock_response) as mock_post:
-                with patch.object(self.client, "_wait_for_job", return_value={"status": "success"}):
-                    self.client.load("dcim.site", parquet_path)
-
-                # dry_run should not be in form data
-                call_args = mock_post.call_args
-                form_data = call_args.kwargs.get("data", {})
-                self.assertNotIn("dry_run", form_data)
-        finally:
-            parquet_path.unlink()
 
-    def test_load_dry_run_operation_label(self):
-        """load(dry_run=True) uses dry-run in operation label."""
-        # This tests internal behavior - the operation label for verbose output
-        with tempfile.NamedTemporaryFile(suffix=".parquet", delete=False) as f:
-            import pyarrow as pa
-            import pyarrow.parquet as pq
+class TestJsonCodec(unittest.TestCase):
+    """Tests for the optional orjson fast path."""
 
-            table = pa.table({"name": ["test"]})
-            pq.write_table(table, f.name)
-            parquet_path = Path(f.name)
+    def test_response_json_uses_orjson_when_available(self):
+        """Response bodies are decoded from raw bytes with orjson when installed."""
+        fake_orjson = MagicMock()
+        fake_orjson.loads.return_value = {"status": "completed"}
+        response = MagicMock(spec=RESPONSE_ATTRS, content=b'{"status": "completed"}')
 
-        try:
-            mock_response = MagicMock()
-            mock_response.json.return_value = {"job_id": "test-job-id"}
-            mock_response.raise_for_status = MagicMock()
+        with patch("turbobulk_client.client.orjson", fake_orjson):
+            self.assertEqual(_response_json(response), {"status": "completed"})
 
-            with patch.object(self.client.session, "post", return_value=mock_response):
-                with patch.object(
-                    self.client, "_wait_for_job", return_value={"valid": True}
-                ) as mock_wait:
-                    self.client.load("dcim.site", parquet_path, dry_run=True)
+        fake_orjson.loads.assert_called_once_with(b'{"status": "completed"}')
+        response.json.assert_not_called()
 
-                # Check operation label includes dry-run
-                call_kwargs = mock_wait.call_args.kwargs
-                self.assertIn("dry-run", call_kwargs.get("operation", ""))
-        finally:
-            parquet_path.unlink()
+    def test_response_json_falls_back_to_requests(self):
+        """Without orjson, decoding is left to requests."""
+        response = MagicMock(spec=RESPONSE_ATTRS)
+        response.json.return_value = {"status": "completed"}
 
+        with patch("turbobulk_client.client.orjson", None):
+            self.assertEqual(_response_json(response), {"status": "completed"})
+
+    def test_json_dumps_returns_str(self):
+        """_json_dumps() returns text suitable for a form field."""
+        encoded = _json_dumps({"fix_denormalized": True})
+        self.assertIsInstance(encoded, str)
+        self.assertEqual(json.loads(encoded), {"fix_denormalized": True})
 
-class TestDeleteDryRun(unittest.TestCase):
-    """Tests for delete() with dry_run parameter."""
+
+class TestRestGetAll(unittest.TestCase):
+    """Tests for rest_get_all() pagination."""
 
     def setUp(self):
         self.client = TurboBulkClient("http://netbox:8080", "test-token")
 
-    def test_delete_sends_dry_run_parameter_in_form_data(self):
-        """delete(dry_run=True) sends dry_run in request form data."""
-        with tempfile.NamedTemporaryFile(suffix=".parquet", delete=False) as f:
-            import pyarrow as pa
-            import pyarrow.parquet as pq
+    def _page(self, offset, count=2500, limit=1000):
+        end = min(offset + limit, count)
+        next_url = (
+            f"http://netbox:8080/api/dcim/sites/?limit={limit}&offset={end}"
+            if end < count
+            else None
+        )
+        return {
+            "count": count,
+            "next": next_url,
+            "results": [{"id": i} for i in range(offset, end)],
+        }
 
-            table = pa.table({"id": [1, 2, 3]})
-            pq.write_table(table, f.name)
-            parquet_path = Path(f.name)
+    def test_rest_get_all_fetches_remaining_pages_by_offset(self):
+        """Remaining pages are requested by offset and returned in order."""
 
-        try:
-            mock_response = MagicMock()
-            mock_response.json.return_value = {"job_id": "test-job-id"}
-            mock_response.raise_for_status = MagicMock()
+        def rest_get(endpoint, params):
+            return self._page(int(params.get("offset", 0)))
 
-            with patch.object(self.client.session, "post", return_value=mock_response) as mock_post:
-                with patch.object(
-                    self.client, "_wait_for_job", return_value={"valid": True, "rows": 3}
-                ):
-                    self.client.delete("dcim.site", parquet_path, dry_run=True)
-
-                # Check that dry_run was included in form data
-                call_args = mock_post.call_args
-                form_data = call_args.kwargs.get("data", {})
-                self.assertEqual(form_data.get("dry_run"), "true")
-        finally:
-            parquet_path.unlink()
+        with patch.object(self.client, "rest_get", side_effect=rest_get) as mock_get:
+            results = self.client.rest_get_all("/api/dcim/sites/", {"name": "a"})
 
-    def test_delete_dry_run_false_by_default(self):
-        """delete() does not send dry_run when not specified."""
-        with tempfile.NamedTemporaryFile(suffix=".parquet", delete=False) as f:
-            import pyarrow as pa
-            import pyarrow.parquet as pq
+        self.assertEqual([r["id"] for r in results], list(range(2500)))
+        offsets = sorted(call.args[1].get("offset", 0) for call in mock_get.call_args_list)
+        self.assertEqual(offsets, [0, 1000, 2000])
+        for call in mock_get.call_args_list:
+            self.assertEqual(call.args[1]["name"], "a")
 
-            table = pa.table({"id": [1, 2, 3]})
-            pq.write_table(table, f.name)
-            parquet_path = Path(f.name)
+    def test_rest_get_all_uses_server_page_size(self):
+        """Offsets follow the page size from the next link, not the requested limit."""
 
-        try:
-            mock_response = MagicMock()
-            mock_response.json.return_value = {"job_id": "test-job-id"}
-            mock_response.raise_for_status = MagicMock()
-
-            with patch.object(self.client.session, "post", return_value=mock_response) as mock_post:
-                with patch.object(self.client, "_wait_for_job", return_value={"status": "success"}):
-                    self.client.delete("dcim.site", parquet_path)
-
-                # dry_run should not be in form data
-                call_args = mock_post.call_args
-                form_data = call_args.kwargs.get("data", {})
-                self.assertNotIn("dry_run", form_data)
-        finally:
-            parquet_path.unlink()
+        def rest_get(endpoint, params):
+            return self._page(int(params.get("offset", 0)), count=1200, limit=500)
+
+        with patch.object(self.client, "rest_get", side_effect=rest_get):
+            results = self.client.rest_get_all("/api/dcim/sites/")
+
+        self.assertEqual([r["id"] for r in results], list(range(1200)))
+
+    def test_rest_get_all_follows_next_links_without_count(self):
+        """Without a total count, pages are followed serially."""
+        pages = [self._page(0), self._page(1000), self._page(2000)]
+        for page in pages:
+            del page["count"]
+
+        with patch.object(self.client, "rest_get", side_effect=pages) as mock_get:
+            results = self.client.rest_get_all("/api/dcim/sites/")
+
+        self.assertEqual(len(results), 2500)
+        self.assertEqual(mock_get.call_args_list[2].args[1]["offset"], 2000)
+
+
+@pytest.mark.slow
+class TestUploadCompression(unittest.TestCase):
+    """Tests for gzipping plain JSONL uploads."""
+
+    def setUp(self):
+        self.client = TurboBulkClient("http://netbox:8080", "test-token")
+        rows = "".join(f'{{"name": "site-{i}", "slug": "site-{i}"}}\n' for i in range(5000))
+        self.raw = rows.encode()
+        with tempfile.NamedTemporaryFile(suffix=".jsonl", delete=False) as f:
+            f.write(self.raw)
+            self.data_path = Path(f.name)
+        self.addCleanup(self.data_path.unlink)
+
+    def _load(self, **kwargs):
+        uploads = []
+
+        def upload(endpoint, data, path):
+            uploads.append((path.name, path.read_bytes()))
+            return MagicMock(spec=RESPONSE_ATTRS, content=b'{"job_id": "job-1"}')
+
+        with patch.object(self.client, "_upload", side_effect=upload):
+            self.client.load("dcim.site", self.data_path, wait=False, **kwargs)
+        return uploads[0]
+
+    def test_plain_jsonl_is_uploaded_gzipped(self):
+        """Plain JSONL files are sent as a gzipped .jsonl.gz copy."""
+        name, body = self._load()
+
+        self.assertEqual(name, f"{self.data_path.name}.gz")
+        self.assertEqual(gzip.decompress(body), self.raw)
+        self.assertLess(len(body), len(self.raw))
+
+    def test_upload_compression_none_sends_file_as_is(self):
+        """upload_compression='none' uploads the original file."""
+        name, body = self._load(upload_compression="none")
+
+        self.assertEqual(name, self.data_path.name)
+        self.assertEqual(body, self.raw)
+
+    def test_unknown_upload_compression_raises(self):
+        """Unsupported codecs are rejected."""
+        with self.assertRaises(TurboBulkError):
+            self._load(upload_compression="zstd")
+
+
+@pytest.mark.slow
+class TestDeleteByFilter(unittest.TestCase):
+    """Tests for delete_by_filter() method."""
+
+    def setUp(self):
+        self.client = TurboBulkClient("http://netbox:8080", "test-token")
+
+    def _export_file(self, content: bytes) -> Path:
+        with tempfile.NamedTemporaryFile(suffix=".jsonl.gz", delete=False) as f:
+            f.write(gzip.compress(content))
+        path = Path(f.name)
+        # delete_by_filter() removes the file itself; this only covers failed tests
+        self.addCleanup(path.unlink, missing_ok=True)
+        return path
+
+    def test_delete_by_filter_submits_exported_ids(self):
+        """delete_by_filter() exports matching IDs and deletes using that file."""
+        ids_path = self._export_file(b'{"id": 1}\n{"id": 2}\n')
+
+        with patch.object(self.client, "export", return_value={"path": ids_path}) as mock_export:
+            with patch.object(
+                self.client, "delete", return_value={"data": {"rows_deleted": 2}}
+            ) as mock_delete:
+                result = self.client.delete_by_filter(
+                    "dcim.site", {"name__startswith": "test-"}, verbose=False
+                )
+
+        self.assertEqual(result["data"]["rows_deleted"], 2)
+        export_kwargs = mock_export.call_args.kwargs
+        self.assertEqual(export_kwargs["filters"], {"name__startswith": "test-"})
+        self.assertEqual(export_kwargs["fields"], ["id"])
+        self.assertEqual(mock_delete.call_args.args, ("dcim.site", ids_path))
+        # Exported file is removed afterwards
+        self.assertFalse(ids_path.exists())
+
+    def test_delete_by_filter_skips_delete_when_nothing_matches(self):
+        """delete_by_filter() does not submit a delete job for an empty export."""
+        ids_path = self._export_file(b"")
+
+        with patch.object(self.client, "export", return_value={"path": ids_path}):
+            with patch.object(self.client, "delete") as mock_delete:
+                result = self.client.delete_by_filter(
+                    "dcim.site", {"name__startswith": "test-"}, verbose=False
+                )
+
+        mock_delete.assert_not_called()
+        self.assertEqual(result["data"]["rows_deleted"], 0)
+        self.assertFalse(ids_path.exists())
+
+
+class TestWaitForJob(unittest.TestCase):
+    """Tests for _wait_for_job() polling."""
+
+    def setUp(self):
+        self.client = TurboBulkClient("http://netbox:8080", "test-token")
+
+    def _response(self, status_code, body=None, etag=None):
+        response = MagicMock(spec=RESPONSE_ATTRS)
+        response.status_code = status_code
+        response.json.return_value = body
+        response.content = json.dumps(body).encode()
+        response.headers = {"ETag": etag} if etag else {}
+        return response
+
+    def test_wait_for_job_backs_off_and_uses_etag(self):
+        """Unchanged polls back off, and 304 responses keep the last known status."""
+        responses = [
+            self._response(200, {"status": "running"}, etag='"v1"'),
+            self._response(304),
+            self._response(304),
+            self._response(200, {"status": "completed", "data": {}}),
+        ]
+
+        with patch.object(self.client.session, "get", side_effect=responses) as mock_get:
+            with patch("turbobulk_client.client.time.sleep") as mock_sleep:
+                result = self.client._wait_for_job("job-1", poll_interval=1.0, verbose=False)
+
+        self.assertEqual(result["status"], "completed")
+        self.assertEqual(mock_get.call_args_list[0].kwargs["params"], {"fields": "status"})
+        self.assertIsNone(mock_get.call_args_list[0].kwargs["headers"])
+        self.assertEqual(mock_get.call_args_list[1].kwargs["headers"], {"If-None-Match": '"v1"'})
+        delays = [call.args[0] for call in mock_sleep.call_args_list]
+        self.assertEqual(len(delays), 3)
+        # Each delay is the backoff step plus at most 25% jitter
+        for delay, base in zip(delays, [1.0, 1.5, 2.25]):
+            self.assertGreaterEqual(delay, base)
+            self.assertLessEqual(delay, base * 1.25)
+
+    def test_wait_for_job_fetches_full_status_once_finished(self):
+        """A brief terminal status is followed by one full status fetch."""
+        responses = [
+            self._response(200, {"status": "running"}),
+            self._response(200, {"status": "completed"}),
+            self._response(200, {"status": "completed", "data": {"rows_inserted": 5}}),
+        ]
+
+        with patch.object(self.client.session, "get", side_effect=responses) as mock_get:
+            with patch("turbobulk_client.client.time.sleep"):
+                result = self.client._wait_for_job("job-1", poll_interval=1.0, verbose=False)
+
+        self.assertEqual(result["data"], {"rows_inserted": 5})
+        self.assertIsNone(mock_get.call_args_list[2].kwargs["params"])
+
+
+@pytest.mark.slow
+class TestJobWaiter(unittest.TestCase):
+    """Tests for JobWaiter shared polling."""
+
+    def setUp(self):
+        self.client = TurboBulkClient("http://netbox:8080", "test-token")
+
+    def test_waiter_resolves_each_job_from_one_thread(self):
+        """Every watched job resolves to its final status, polled from one thread."""
+        statuses = {
+            "a": [{"status": "running"}, {"status": "completed", "id": "a", "data": {}}],
+            "b": [{"status": "completed", "id": "b", "data": {}}],
+            "c": [{"status": "running"}, {"status": "errored", "data": {"error": "bad row"}}],
+        }
+        threads = set()
+
+        def poll(job_id, etag, brief):
+            threads.add(threading.current_thread().name)
+            return statuses[job_id].pop(0), None
+
+        with patch.object(self.client, "_poll_job_status", side_effect=poll):
+            with JobWaiter(self.client, poll_interval=0.01) as waiter:
+                results = waiter.wait_all(["a", "b"])
+                failed = waiter.watch("c")
+                with self.assertRaises(JobFailedError):
+                    failed.result(timeout=5)
+
+        self.assertEqual([r["id"] for r in results], ["a", "b"])
+        self.assertEqual(threads, {"turbobulk-job-waiter"})
+
+    def test_waiter_times_out_and_cancels_on_close(self):
+        """Jobs past their timeout fail; jobs still running at close() are cancelled."""
+        with patch.object(
+            self.client, "_poll_job_status", return_value=({"status": "running"}, None)
+        ):
+            waiter = JobWaiter(self.client, poll_interval=0.01)
+            timed_out = waiter.watch("slow", timeout=0.05)
+            pending = waiter.watch("pending")
+            with self.assertRaises(TurboBulkError):
+                timed_out.result(timeout=5)
+            waiter.close()
+
+        self.assertTrue(pending.cancelled())
+
+    def test_watching_a_job_twice_shares_one_future(self):
+        """A second watch() of a job still being polled returns the same Future."""
+        with patch.object(
+            self.client, "_poll_job_status", return_value=({"status": "running"}, None)
+        ):
+            waiter = JobWaiter(self.client, poll_interval=0.01)
+            first = waiter.watch("job-1")
+            second = waiter.watch("job-1")
+            waiter.close()
+
+        self.assertIs(first, second)
+        self.assertTrue(first.cancelled())
+
+
+@pytest.mark.slow
+class TestDownloadExportFile(unittest.TestCase):
+    """Tests for _download_export_file()."""
+
+    def test_download_streams_chunks_to_disk(self):
+        """The export body is streamed in chunks rather than read into memory at once."""
+        client = TurboBulkClient("http://netbox:8080", "test-token")
+        response = MagicMock()
+        response.status_code = 200
+        response.__enter__.return_value = response
+        response.iter_content.return_value = iter([b"abc", b"def"])
+
+        with tempfile.TemporaryDirectory() as tmp:
+            output_path = Path(tmp) / "export.parquet"
+            with patch.object(client.session, "get", return_value=response) as mock_get:
+                path = client._download_export_file(
+                    "/media/export.parquet", output_path, "parquet", verbose=False
+                )
+
+            self.assertEqual(path.read_bytes(), b"abcdef")
+        self.assertEqual(mock_get.call_args.args, ("http://netbox:8080/media/export.parquet",))
+        self.assertTrue(mock_get.call_args.kwargs["stream"])
+
+
+@pytest.mark.slow
+class TestExportCache(unittest.TestCase):
+    """Tests for the local export cache."""
+
+    def setUp(self):
+        self.cache_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.cache_dir, ignore_errors=True)
+        self.client = TurboBulkClient("http://netbox:8080", "test-token", cache_dir=self.cache_dir)
+
+    def _response(self, status_code, body):
+        response = MagicMock(spec=RESPONSE_ATTRS, status_code=status_code)
+        response.json.return_value = body
+        response.content = json.dumps(body).encode()
+        return response
+
+    def _download(self, url, output_path, format, verbose):
+        fd, path = tempfile.mkstemp(suffix=".jsonl.gz")
+        os.write(fd, b"exported")
+        os.close(fd)
+        self.addCleanup(Path(path).unlink, missing_ok=True)
+        return Path(path)
+
+    def test_unchanged_export_is_served_from_local_cache(self):
+        """A 304 for the locally cached key returns the cached file without downloading."""
+        hit = self._response(
+            200, {"cached": True, "cache_key": "abc", "download_url": "/cache/abc/download/"}
+        )
+        not_modified = self._response(304, {"message": "Client cache is current"})
+
+        with patch.object(self.client.session, "post", side_effect=[hit, not_modified]) as post:
+            with patch.object(
+                self.client, "_download_export_file", side_effect=self._download
+            ) as download:
+                first = self.client.export("dcim.site", verbose=False)
+                second = self.client.export("dcim.site", verbose=False)
+
+        self.assertEqual(download.call_count, 1)
+        self.assertEqual(first["path"].parent, self.cache_dir)
+        self.assertEqual(second["path"], first["path"])
+        self.assertEqual(second["path"].read_bytes(), b"exported")
+        self.assertNotIn("client_cache_key", post.call_args_list[0].kwargs["json"])
+        self.assertEqual(post.call_args_list[1].kwargs["json"]["client_cache_key"], "abc")
+
+    def test_cache_is_keyed_by_request_and_skipped_for_force_refresh(self):
+        """Different filters and force_refresh never reuse the cached key."""
+        hit = self._response(
+            200, {"cached": True, "cache_key": "abc", "download_url": "/cache/abc/download/"}
+        )
+
+        with patch.object(self.client.session, "post", return_value=hit) as post:
+            with patch.object(self.client, "_download_export_file", side_effect=self._download):
+                self.client.export("dcim.site", verbose=False)
+                self.client.export("dcim.site", filters={"status": "active"}, verbose=False)
+                result = self.client.export("dcim.site", force_refresh=True, verbose=False)
+
+        for call in post.call_args_list[1:]:
+            self.assertNotIn("client_cache_key", call.kwargs["json"])
+        self.assertNotEqual(result["path"].parent, self.cache_dir)
 
 
 class TestAuthErrorHandling(unittest.TestCase):
@@ -475,7 +960,7 @@ class TestAuthErrorHandling(unittest.TestCase):
         """403 with non-nbt_ token raises AuthenticationError with v2 format hint."""
         client = TurboBulkClient("http://netbox:8080", "plaintext-only-token-value-40chars0000")
 
-        mock_response = MagicMock()
+        mock_response = MagicMock(spec=RESPONSE_ATTRS)
         mock_response.status_code = 403
         mock_response.json.return_value = {"detail": "Invalid v1 token"}
 
@@ -490,7 +975,7 @@ class TestAuthErrorHandling(unittest.TestCase):
         """403 with nbt_ token raises AuthenticationError without v2 format hint."""
         client = TurboBulkClient("http://netbox:8080", "nbt_key123456ab.plaintextvalue")
 
-        mock_response = MagicMock()
+        mock_response = MagicMock(spec=RESPONSE_ATTRS)
         mock_response.status_code = 403
         mock_response.json.return_value = {"detail": "Invalid v2 token"}
 
@@ -505,7 +990,7 @@ class TestAuthErrorHandling(unittest.TestCase):
         """401 with non-nbt_ token also includes the v2 format hint."""
         client = TurboBulkClient("http://netbox:8080", "some-legacy-token")
 
-        mock_response = MagicMock()
+        mock_response = MagicMock(spec=RESPONSE_ATTRS)
         mock_response.status_code = 401
         mock_response.json.return_value = {"detail": "Invalid v1 token"}
 
@@ -517,8 +1002,6 @@ class TestAuthErrorHandling(unittest.TestCase):
 
     def test_non_auth_error_raises_http_error(self):
         """Non-auth HTTP errors (e.g. 500) raise standard HTTPError."""
-        import requests
-
         client = TurboBulkClient("http://netbox:8080", "test-token")
 
         mock_response = MagicMock(spec=requests.Response)
@@ -532,5 +1015,192 @@ class TestAuthErrorHandling(unittest.TestCase):
                 client.get_models()
 
 
+class TestAsyncClient(unittest.TestCase):
+    """Tests for AsyncTurboBulkClient that do not need a running server."""
+
+    def test_missing_aiohttp_raises(self):
+        """Constructing the async client without aiohttp raises TurboBulkError."""
+        with patch("turbobulk_client.async_client.aiohttp", None):
+            with self.assertRaises(TurboBulkError) as ctx:
+                AsyncTurboBulkClient("http://netbox:8080", "test-token")
+        self.assertIn("aiohttp", str(ctx.exception))
+
+    def test_session_passes_verify_ssl_as_bool(self):
+        """The connector gets ssl=True/False rather than the deprecated ssl=None."""
+        fake_aiohttp = MagicMock()
+        with patch("turbobulk_client.async_client.aiohttp", fake_aiohttp):
+            AsyncTurboBulkClient("http://netbox:8080", "test-token").session
+            AsyncTurboBulkClient("http://netbox:8080", "test-token", verify_ssl=False).session
+
+        ssl_args = [call.kwargs["ssl"] for call in fake_aiohttp.TCPConnector.call_args_list]
+        self.assertEqual(ssl_args, [True, False])
+
+    def test_wait_for_job_polls_until_completed(self):
+        """_wait_for_job() awaits status polls until the job completes."""
+        with patch("turbobulk_client.async_client.aiohttp", MagicMock()):
+            client = AsyncTurboBulkClient("http://netbox:8080", "test-token")
+
+        statuses = [({"status": "running"}, None), ({"status": "completed", "data": {}}, None)]
+        with patch.object(client, "_poll_job_status", AsyncMock(side_effect=statuses)) as mock:
+            result = asyncio.run(client._wait_for_job("job-1", poll_interval=0, verbose=False))
+
+        self.assertEqual(result["status"], "completed")
+        self.assertEqual(mock.await_count, 2)
+
+    def test_download_writes_chunks_off_the_event_loop(self):
+        """Export chunks are written to disk through the loop's executor."""
+        with patch("turbobulk_client.async_client.aiohttp", MagicMock()):
+            client = AsyncTurboBulkClient("http://netbox:8080", "test-token")
+
+        async def iter_chunked(size):
+            for chunk in (b"abc", b"def"):
+                yield chunk
+
+        response = MagicMock()
+        response.__aenter__ = AsyncMock(return_value=response)
+        response.__aexit__ = AsyncMock(return_value=False)
+        response.content.iter_chunked = iter_chunked
+        session = MagicMock(closed=False)
+        session.get.return_value = response
+        client._session = session
+
+        async def download(output_path):
+            loop = asyncio.get_running_loop()
+            with patch.object(client, "_raise_for_status", AsyncMock()):
+                with patch.object(
+                    loop, "run_in_executor", wraps=loop.run_in_executor
+                ) as run_in_executor:
+                    path = await client._download_export_file(
+                        "/media/export.parquet", output_path, "parquet", verbose=False
+                    )
+            return path, run_in_executor.call_count
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path, executor_calls = asyncio.run(download(Path(tmp) / "export.parquet"))
+            self.assertEqual(path.read_bytes(), b"abcdef")
+        self.assertEqual(executor_calls, 2)
+
+    def _async_response(self, status=200, body=None):
+        """An aiohttp-style response usable as `async with session.post(...)`."""
+        response = MagicMock(status=status)
+        response.__aenter__ = AsyncMock(return_value=response)
+        response.__aexit__ = AsyncMock(return_value=False)
+        response.json = AsyncMock(return_value=body)
+        response.read = AsyncMock(return_value=json.dumps(body).encode() if body else b"")
+        return response
+
+    def _run_with_session(self, call, response):
+        """Run call(client) against a fake session; returns (result, session, form fields)."""
+        fields = {}
+
+        class FormData:
+            def add_field(self, name, value, **kwargs):
+                fields[name] = kwargs.get("filename", value)
+
+        fake_aiohttp = MagicMock(FormData=FormData)
+        with patch("turbobulk_client.async_client.aiohttp", fake_aiohttp):
+            client = AsyncTurboBulkClient("http://netbox:8080", "test-token")
+            client._session = MagicMock(closed=False)
+            client._session.post.return_value = response
+            result = asyncio.run(call(client))
+        return result, client._session, fields
+
+    def test_load_uploads_form_fields(self):
+        """load() posts its options and the data file as multipart form fields."""
+        result, session, fields = self._run_with_session(
+            lambda client: client.load(
+                "dcim.device",
+                NAME_PARQUET,
+                mode="upsert",
+                conflict_fields=["name", "site"],
+                dry_run=True,
+                wait=False,
+            ),
+            self._async_response(body={"job_id": "job-1"}),
+        )
+
+        self.assertEqual(result, {"job_id": "job-1"})
+        self.assertEqual(
+            session.post.call_args.args, ("http://netbox:8080/api/plugins/turbobulk/load/",)
+        )
+        self.assertEqual(fields["model"], "dcim.device")
+        self.assertEqual(fields["mode"], "upsert")
+        self.assertEqual(fields["conflict_fields"], "name,site")
+        self.assertEqual(fields["create_changelogs"], "true")
+        self.assertEqual(fields["dry_run"], "true")
+        self.assertEqual(fields["file"], NAME_PARQUET.name)
+        self.assertNotIn("branch", fields)
+
+    def test_delete_uploads_form_fields(self):
+        """delete() posts to the delete endpoint and omits unset options."""
+        _, session, fields = self._run_with_session(
+            lambda client: client.delete(
+                "dcim.site", ID_PARQUET, cascade_nullable_fks=False, wait=False
+            ),
+            self._async_response(body={"job_id": "job-2"}),
+        )
+
+        self.assertEqual(
+            session.post.call_args.args, ("http://netbox:8080/api/plugins/turbobulk/delete/",)
+        )
+        self.assertEqual(fields["cascade_nullable_fks"], "false")
+        self.assertEqual(fields["file"], ID_PARQUET.name)
+        self.assertNotIn("dry_run", fields)
+
+    def test_export_posts_json_and_reports_not_modified(self):
+        """export() sends its options as JSON and returns a 304 as a cached result."""
+        result, session, _ = self._run_with_session(
+            lambda client: client.export(
+                "dcim.site", filters={"status": "active"}, client_cache_key="k1", verbose=False
+            ),
+            self._async_response(status=304, body={"cache_key": "k1"}),
+        )
+
+        sent = session.post.call_args.kwargs["json"]
+        self.assertEqual(sent["model"], "dcim.site")
+        self.assertEqual(sent["filters"], {"status": "active"})
+        self.assertEqual(sent["client_cache_key"], "k1")
+        self.assertEqual(result, {"cache_key": "k1", "status_code": 304, "cached": True})
+
+    def test_raise_for_status_maps_auth_errors(self):
+        """401/403 become AuthenticationError; other errors use aiohttp's own exception."""
+        with patch("turbobulk_client.async_client.aiohttp", MagicMock()):
+            client = AsyncTurboBulkClient("http://netbox:8080", "legacy-token")
+
+        forbidden = self._async_response(status=403, body={"detail": "Invalid v1 token"})
+        with self.assertRaises(AuthenticationError) as ctx:
+            asyncio.run(client._raise_for_status(forbidden))
+        self.assertIn("Invalid v1 token", str(ctx.exception))
+        self.assertIn("nbt_", str(ctx.exception))
+        forbidden.raise_for_status.assert_not_called()
+
+        server_error = self._async_response(status=500)
+        server_error.raise_for_status.side_effect = RuntimeError("500 Server Error")
+        with self.assertRaisesRegex(RuntimeError, "500"):
+            asyncio.run(client._raise_for_status(server_error))
+
+    def test_get_model_schema_cached(self):
+        """The async client fetches each model schema once until invalidated."""
+        with patch("turbobulk_client.async_client.aiohttp", MagicMock()):
+            client = AsyncTurboBulkClient("http://netbox:8080", "test-token")
+
+        async def fetch_twice():
+            await client.get_model_schema("dcim.site")
+            return await client.get_model_schema("dcim.site")
+
+        get_json = AsyncMock(return_value={"fields": []})
+        with patch.object(client, "_get_json", get_json):
+            self.assertEqual(asyncio.run(fetch_twice()), {"fields": []})
+            self.assertEqual(get_json.await_count, 1)
+
+            # Returned schemas are copies; modifying one leaves the cache intact
+            asyncio.run(client.get_model_schema("dcim.site"))["fields"].append("x")
+            self.assertEqual(asyncio.run(client.get_model_schema("dcim.site")), {"fields": []})
+
+            client.invalidate_schema_cache("dcim.site")
+            asyncio.run(fetch_twice())
+            self.assertEqual(get_json.await_count, 2)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,58 @@
+"""
+Tests for the JSONL helpers in examples/common/parquet_utils.py.
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from common import parquet_utils  # noqa: E402
+from common.parquet_utils import jsonl_row_count, read_jsonl  # noqa: E402
+
+
+@pytest.mark.slow
+class TestJsonlRowCount(unittest.TestCase):
+    """Tests for jsonl_row_count()."""
+
+    def _count(self, content: bytes) -> int:
+        with tempfile.NamedTemporaryFile(suffix=".jsonl", delete=False) as f:
+            f.write(content)
+        path = Path(f.name)
+        self.addCleanup(path.unlink)
+        count = jsonl_row_count(path)
+        self.assertEqual(count, len(read_jsonl(path)))
+        return count
+
+    def test_counts_rows_with_and_without_trailing_newline(self):
+        """A final record without a trailing newline is counted."""
+        self.assertEqual(self._count(b'{"a":1}\n{"a":2}\n'), 2)
+        self.assertEqual(self._count(b'{"a":1}\n{"a":2}'), 2)
+        self.assertEqual(self._count(b""), 0)
+
+    def test_skips_runs_of_blank_lines(self):
+        """Runs of several empty lines add nothing to the count."""
+        self.assertEqual(self._count(b'{"a":1}\n\n\n{"a":2}\n'), 2)
+        self.assertEqual(self._count(b'{"a":1}\n\n\n'), 1)
+        self.assertEqual(self._count(b'\n\n{"a":1}\n\n\n\n'), 1)
+
+    def test_skips_whitespace_only_lines(self):
+        """Lines holding only whitespace are not rows."""
+        self.assertEqual(self._count(b'{"a":1}\n  \n{"a":2}'), 2)
+        self.assertEqual(self._count(b'{"a":1}\r\n\t\r\n{"a":2}\r\n'), 2)
+
+    def test_blank_lines_across_chunk_boundaries(self):
+        """Blank lines and records split between read chunks are counted once."""
+        content = b'{"a":1}\n\n\n  \n{"a":2}\n\n{"a":3}'
+        for chunk_size in (1, 2, 3, 5, 8):
+            with self.subTest(chunk_size=chunk_size):
+                with patch.object(parquet_utils, "_READ_CHUNK_SIZE", chunk_size):
+                    self.assertEqual(self._count(content), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()